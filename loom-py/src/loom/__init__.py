@@ -58,32 +58,74 @@ Module structure:
     - cli/: Command line interface
 """
 
-# Agent
-from .agent import Agent, Envelope, EventContext
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent import Agent, Envelope, EventContext
+    from .cognitive import (
+        CognitiveAgent,
+        CognitiveConfig,
+        CognitiveResult,
+        ThinkingStrategy,
+        WorkingMemory,
+    )
+    from .llm import LLMConfig, LLMProvider
+    from .runtime.config import ProjectConfig, load_project_config
+    from .telemetry import init_telemetry, shutdown_telemetry
+    from .tools import Capability, Tool, capability, tool
 
-# Cognitive
-from .cognitive import (
-    CognitiveAgent,
-    CognitiveConfig,
-    CognitiveResult,
-    ThinkingStrategy,
-    WorkingMemory,
-)
+    Context = EventContext
 
-# LLM
-from .llm import LLMConfig, LLMProvider
+# Public names -> defining submodule. Submodules (gRPC stubs, OpenTelemetry
+# exporters, ...) are imported on first attribute access, so `import loom`
+# and `loom --help` do not pay for the whole SDK up front.
+_LAZY_ATTRS = {
+    # Agent
+    "Agent": ".agent",
+    "Envelope": ".agent",
+    "EventContext": ".agent",
+    # Cognitive
+    "CognitiveAgent": ".cognitive",
+    "CognitiveConfig": ".cognitive",
+    "CognitiveResult": ".cognitive",
+    "ThinkingStrategy": ".cognitive",
+    "WorkingMemory": ".cognitive",
+    # LLM
+    "LLMConfig": ".llm",
+    "LLMProvider": ".llm",
+    # Config
+    "ProjectConfig": ".runtime.config",
+    "load_project_config": ".runtime.config",
+    # Telemetry
+    "init_telemetry": ".telemetry",
+    "shutdown_telemetry": ".telemetry",
+    # Tools
+    "Capability": ".tools",
+    "Tool": ".tools",
+    "capability": ".tools",
+    "tool": ".tools",
+}
 
-# Config
-from .runtime.config import ProjectConfig, load_project_config
+# Backward compatibility
+_ALIASES = {"Context": "EventContext"}
 
-# Telemetry
-from .telemetry import init_telemetry, shutdown_telemetry
 
-# Tools
-from .tools import Capability, Tool, capability, tool
+def __getattr__(name: str) -> Any:
+    target = _ALIASES.get(name, name)
+    module = _LAZY_ATTRS.get(target)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), target)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_ALIASES))
 
-# Backward compatibility
-Context = EventContext
 
 __all__ = [
     # Agent
@@ -21,6 +21,7 @@ from .envelope import Envelope
 from .event import EventContext
 
 if TYPE_CHECKING:
+    from ..bridge.client import BridgeClient
     from ..tools import Tool
 
 EventHandler = Callable[[EventContext, str, Envelope], Awaitable[None]]
@@ -60,6 +61,7 @@ class Agent:
         tools: Optional[Iterable[Callable[..., Any]]] = None,
         address: Optional[str] = None,
         on_event: Optional[EventHandler] = None,
+        client: Optional[BridgeClient] = None,
         # Deprecated parameter - use 'tools' instead
         capabilities: Optional[Iterable[Callable[..., Any]]] = None,
     ):
@@ -71,6 +73,8 @@ class Agent:
             tools: Tool functions decorated with @tool
             address: Bridge address (default from LOOM_BRIDGE_ADDR or 127.0.0.1:50051)
             on_event: Async event handler callback
+            client: Existing BridgeClient to use instead of creating one; the
+                agent does not close a client it was given
             capabilities: Deprecated, use tools instead
         """
         from ..bridge.client import BridgeClient
@@ -104,9 +108,12 @@ class Agent:
                 self._tool_decls.append(t)
 
         self._on_event = on_event
-        self.client = BridgeClient(address=address) if address else BridgeClient()
+        self._owns_client = client is None
+        if client is None:
+            client = BridgeClient(address=address) if address else BridgeClient()
+        self.client = client
         self._ctx = EventContext(agent_id=self.agent_id, client=self.client)
-        self._outbound_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+        self._outbound_queue: asyncio.Queue = asyncio.Queue(maxsize=2048)
         self._ctx._bind(self._outbound_queue)
         self._stream_task: Optional[asyncio.Task] = None
         self._stopped = asyncio.Event()
@@ -141,16 +148,23 @@ class Agent:
         await self.client.register_agent(self.agent_id, topics, tool_descriptors)
 
         # Start stream
-        async def outbound_iter():
-            while True:
-                msg = await self._outbound_queue.get()
-                yield msg
-
-        self._stream = await self.client.event_stream(self.agent_id, outbound_iter())
+        self._stream = await self.client.event_stream(self.agent_id, self._outbound_iter())
         self._stream_task = asyncio.create_task(self._run_stream())
         # Start heartbeat monitor
         self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
 
+    async def _outbound_iter(self):
+        """Yield queued ClientEvents for the EventStream.
+
+        Only an empty queue is awaited; events already queued are drained
+        with get_nowait(), so a burst costs no coroutine per event.
+        """
+        queue = self._outbound_queue
+        while True:
+            yield await queue.get()
+            while not queue.empty():
+                yield queue.get_nowait()
+
     async def _run_stream(self):
         """Process incoming stream messages."""
 
@@ -231,12 +245,9 @@ class Agent:
                     await self.client.register_agent(self.agent_id, topics, tool_descriptors)
 
                     # Restart stream
-                    async def outbound_iter():
-                        while True:
-                            msg = await self._outbound_queue.get()
-                            yield msg
-
-                    self._stream = await self.client.event_stream(self.agent_id, outbound_iter())
+                    self._stream = await self.client.event_stream(
+                        self.agent_id, self._outbound_iter()
+                    )
                     self._stream_task = asyncio.create_task(self._run_stream())
                     logging.info("[loom] Reconnected agent %s", self.agent_id)
                     return
@@ -346,7 +357,9 @@ class Agent:
                 await self._heartbeat_task
             except asyncio.CancelledError:
                 pass
-        await self.client.close()
+        await self._ctx.flush_writes()
+        if self._owns_client:
+            await self.client.close()
 
     def run(self):
         """Run the agent (blocking). Waits for Ctrl+C to stop."""
@@ -176,15 +176,18 @@ class Envelope:
         )
         return ev
 
-    def inject_trace_context(self) -> None:
+    def inject_trace_context(self, span_context: Optional[SpanContext] = None) -> None:
         """Inject current OpenTelemetry trace context into envelope metadata.
 
         Extracts trace_id, span_id, and trace_flags from the current span
         and stores them in the envelope for propagation across process boundaries.
+
+        Args:
+            span_context: Span context to inject; defaults to the current span's
         """
-        span = get_current_span()
-        span_context = span.get_span_context()
-        if span and span_context.is_valid:
+        if span_context is None:
+            span_context = get_current_span().get_span_context()
+        if span_context.is_valid:
             self.trace_id = format(span_context.trace_id, "032x")
             self.span_id = format(span_context.span_id, "016x")
             self.trace_flags = format(span_context.trace_flags, "02x")
@@ -14,9 +14,11 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
+import logging
+import operator
 import time
 import uuid
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from opentelemetry import trace
 
@@ -26,10 +28,40 @@ if TYPE_CHECKING:
     from ..bridge import BridgeClient
 
 EventHandler = Callable[["EventContext", str, Envelope], Awaitable[None]]
+MemoryWriteErrorHandler = Callable[[BaseException], None]
 
 # Get tracer for tool invocation spans
 tracer = trace.get_tracer(__name__)
 
+# Scalar fields copied out of memory records. attrgetter reads them all in a
+# single C-level call instead of one Python attribute lookup per key.
+_PLAN_FIELDS = (
+    "timestamp_ms",
+    "symbol",
+    "action",
+    "confidence",
+    "reasoning",
+    "plan_hash",
+    "method",
+)
+_EXECUTION_SUMMARY_FIELDS = (
+    "timestamp_ms",
+    "plan_hash",
+    "symbol",
+    "action",
+    "status",
+    "executed",
+    "order_id",
+)
+_get_plan_fields = operator.attrgetter(*_PLAN_FIELDS)
+_get_execution_summary_fields = operator.attrgetter(*_EXECUTION_SUMMARY_FIELDS)
+
+
+def _expire_future(fut: asyncio.Future) -> None:
+    """Fail a pending request future with a timeout if no reply arrived."""
+    if not fut.done():
+        fut.set_exception(asyncio.TimeoutError())
+
 
 class EventContext:
     """Event context - agent's interface to Rust Core Event Bus.
@@ -39,6 +71,22 @@ class EventContext:
     with Rust Core's event bus and bridge services.
     """
 
+    # Agents hit these attributes on every emit/request/tool call; slots keep
+    # instances small and attribute access off the per-instance dict.
+    __slots__ = (
+        "agent_id",
+        "client",
+        "_pending",
+        "_outbound_queue",
+        "_base_headers",
+        "_write_buf",
+        "_write_flush_task",
+        "_write_tasks",
+        "write_flush_interval_ms",
+        "write_batch_max",
+        "on_write_error",
+    )
+
     def __init__(self, agent_id: str, client: BridgeClient):
         """Initialize context.
 
@@ -49,6 +97,18 @@ class EventContext:
         self.agent_id = agent_id
         self.client = client
         self._pending: Dict[str, asyncio.Future[Envelope]] = {}
+        self._outbound_queue: Optional[asyncio.Queue] = None
+        # Headers attached to every tool call made by this agent
+        self._base_headers: Dict[str, str] = {"x-agent-id": agent_id}
+        # Fire-and-forget memory writes (save_plan / mark_plan_executed with wait=False)
+        self._write_buf: List[Tuple[Callable[[Any], Awaitable[Any]], Any, str]] = []
+        self._write_flush_task: Optional[asyncio.Task] = None
+        # Running background flushes, held so they are neither garbage
+        # collected nor abandoned by flush_writes()
+        self._write_tasks: Set[asyncio.Task] = set()
+        self.write_flush_interval_ms = 50
+        self.write_batch_max = 32
+        self.on_write_error: Optional[MemoryWriteErrorHandler] = None
 
     # Event API
     async def emit(
@@ -66,12 +126,19 @@ class EventContext:
             QoS level is configured at subscription time in the Bridge (QosBatched by default),
             not per-event. The Bridge uses channel size of 2048 for batched processing.
         """
+        env = envelope or Envelope.new(type=type, payload=payload, sender=self.agent_id)
+        await self._emit_envelope(topic, env)
+
+    async def _emit_envelope(self, topic: str, env: Envelope) -> None:
+        """Publish a fully built envelope to a topic."""
         from ..bridge.proto import bridge_pb2 as pb_bridge
         from ..bridge.proto import event_pb2 as pb_event
 
-        env = envelope or Envelope.new(type=type, payload=payload, sender=self.agent_id)
-        # Inject trace context from current span before sending
-        env.inject_trace_context()
+        # Inject trace context from current span before sending; untraced emits
+        # (most background traffic) skip the metadata formatting entirely
+        span_context = trace.get_current_span().get_span_context()
+        if span_context.is_valid:
+            env.inject_trace_context(span_context)
         ev = env.to_proto(pb_event.Event)
         msg = pb_bridge.ClientEvent(publish=pb_bridge.Publish(topic=topic, event=ev))
         # Send via stream producer (in Agent)
@@ -95,12 +162,17 @@ class EventContext:
         env = Envelope.new(type=type, payload=payload, sender=self.agent_id)
         env.correlation_id = env.id
         env.reply_to = f"agent.{self.agent_id}.replies"
-        fut: asyncio.Future[Envelope] = asyncio.get_event_loop().create_future()
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[Envelope] = loop.create_future()
         self._pending[env.correlation_id] = fut
-        await self.emit(topic, type=type, payload=payload, envelope=env)
+        await self._emit_envelope(topic, env)
+        # Arm the timeout directly on the future rather than via asyncio.wait_for,
+        # which wraps every request in an extra Task.
+        handle = loop.call_later(timeout_ms / 1000, _expire_future, fut)
         try:
-            return await asyncio.wait_for(fut, timeout=timeout_ms / 1000)
+            return await fut
         finally:
+            handle.cancel()
             self._pending.pop(env.correlation_id, None)
 
     async def reply(self, original: Envelope, *, type: str, payload: bytes = b"") -> None:
@@ -119,7 +191,7 @@ class EventContext:
             correlation_id=original.correlation_id or original.id,
             thread_id=original.thread_id,
         )
-        await self.emit(thread_topic, type=env.type, payload=env.payload, envelope=env)
+        await self._emit_envelope(thread_topic, env)
 
     async def tool(
         self,
@@ -151,6 +223,9 @@ class EventContext:
                 "timeout.ms": timeout_ms,
             },
         ) as span:
+            # Unsampled / no-op spans skip the per-result attribute bookkeeping
+            recording = span.is_recording()
+
             # Serialize payload to JSON string
             arguments = ""
             if payload is not None:
@@ -159,31 +234,29 @@ class EventContext:
             call_id = str(uuid.uuid4())
             correlation_id = call_id
 
-            # Merge custom headers with default headers
-            call_headers = {
-                "x-correlation-id": correlation_id,
-                "x-agent-id": self.agent_id,
-            }
-            if headers:
-                call_headers.update(headers)
-
             call = pb_action.ToolCall(
                 id=call_id,
                 name=name,
                 arguments=arguments,
-                headers=call_headers,
+                headers=self._base_headers,
                 timeout_ms=timeout_ms,
                 correlation_id=correlation_id,
             )
+            # Fill the proto map in place; custom headers override the defaults
+            call.headers["x-correlation-id"] = correlation_id
+            if headers:
+                call.headers.update(headers)
 
             try:
                 res = await self.client.forward_tool_call(call)
 
                 # Record result status
-                span.set_attribute("tool.status", res.status)
+                if recording:
+                    span.set_attribute("tool.status", res.status)
 
                 if res.status == pb_action.ToolStatus.TOOL_OK:
-                    span.set_attribute("tool.output.size", len(res.output))
+                    if recording:
+                        span.set_attribute("tool.output.size", len(res.output))
                     span.set_status(trace.Status(trace.StatusCode.OK))
                     return res.output
                 else:
@@ -205,14 +278,76 @@ class EventContext:
     # Internal wiring
     async def _send(self, client_event) -> None:
         """Send a client event via the outbound queue."""
-        if not hasattr(self, "_outbound_queue"):
+        q = self._outbound_queue
+        if q is None:
             raise RuntimeError("Context not bound to Agent stream")
-        await self._outbound_queue.put(client_event)
+        try:
+            q.put_nowait(client_event)
+        except asyncio.QueueFull:
+            # Only suspend the producer when the stream is actually backed up
+            await q.put(client_event)
 
     def _bind(self, outbound_queue: asyncio.Queue) -> None:
         """Bind context to an outbound queue."""
         self._outbound_queue = outbound_queue
 
+    def _queue_write(self, send: Callable[[Any], Awaitable[Any]], req: Any, what: str) -> None:
+        """Buffer a memory write for the background flusher."""
+        self._write_buf.append((send, req, what))
+        if len(self._write_buf) >= self.write_batch_max:
+            self._spawn_flush(self._flush_batch())
+        elif self._write_flush_task is None or self._write_flush_task.done():
+            self._write_flush_task = self._spawn_flush(self._flush_writes_later())
+
+    def _spawn_flush(self, coro: Awaitable[None]) -> asyncio.Task:
+        """Run a background flush, holding it in ``_write_tasks`` until it finishes."""
+        task = asyncio.ensure_future(coro)
+        self._write_tasks.add(task)
+        task.add_done_callback(self._write_tasks.discard)
+        return task
+
+    async def _flush_writes_later(self) -> None:
+        await asyncio.sleep(self.write_flush_interval_ms / 1000)
+        await self._flush_batch()
+
+    async def flush_writes(self) -> None:
+        """Send all buffered memory writes to Core and wait for in-flight ones.
+
+        Buffered writes are issued concurrently over the shared channel. Failures
+        are reported through ``on_write_error`` (or logged) rather than raised.
+        Background flushes already under way are awaited too, so nothing is
+        left in flight when this returns.
+        """
+        await self._flush_batch()
+        current = asyncio.current_task()
+        inflight = [task for task in self._write_tasks if task is not current]
+        if inflight:
+            await asyncio.gather(*inflight, return_exceptions=True)
+
+    async def _flush_batch(self) -> None:
+        """Send the writes buffered so far and report failures."""
+        pending = self._write_flush_task
+        if pending is not None and pending is not asyncio.current_task():
+            pending.cancel()  # still sleeping; this call takes over its batch
+        self._write_flush_task = None
+        batch, self._write_buf = self._write_buf, []
+        if not batch:
+            return
+        results = await asyncio.gather(
+            *(send(req) for send, req, _ in batch), return_exceptions=True
+        )
+        for (_, _, what), res in zip(batch, results):
+            if isinstance(res, BaseException):  # including CancelledError
+                err: BaseException = res
+            elif not res.success:
+                err = RuntimeError(f"Failed to {what}: {res.error_message}")
+            else:
+                continue
+            if self.on_write_error is not None:
+                self.on_write_error(err)
+            else:
+                logging.warning("[loom] Buffered memory write failed: %s", err)
+
     def _on_delivery(self, delivery) -> None:
         """Handle a delivery from the stream."""
         if delivery.event is None:
@@ -234,6 +369,7 @@ class EventContext:
         reasoning: str = "",
         method: str = "llm",
         metadata: Optional[Dict[str, str]] = None,
+        wait: bool = True,
     ) -> str:
         """Save a trading plan to Core memory.
 
@@ -244,6 +380,8 @@ class EventContext:
             reasoning: Explanation for the decision
             method: Method used ("llm" or "rule-based")
             metadata: Additional metadata
+            wait: If False, buffer the write for the background flusher and
+                return the locally computed hash without waiting for Core
 
         Returns:
             plan_hash: Unique hash for this plan
@@ -255,7 +393,7 @@ class EventContext:
         plan_hash = hashlib.md5(plan_content.encode()).hexdigest()[:8]
 
         plan = pb_memory.PlanRecord(
-            timestamp_ms=int(time.time() * 1000),
+            timestamp_ms=time.time_ns() // 1_000_000,
             symbol=symbol,
             action=action,
             confidence=confidence,
@@ -270,6 +408,10 @@ class EventContext:
             plan=plan,
         )
 
+        if not wait:
+            self._queue_write(self.client.save_plan, req, "save plan")
+            return plan_hash
+
         resp = await self.client.save_plan(req)
         if not resp.success:
             raise RuntimeError(f"Failed to save plan: {resp.error_message}")
@@ -304,18 +446,9 @@ class EventContext:
 
         plans = []
         for plan in resp.plans:
-            plans.append(
-                {
-                    "timestamp_ms": plan.timestamp_ms,
-                    "symbol": plan.symbol,
-                    "action": plan.action,
-                    "confidence": plan.confidence,
-                    "reasoning": plan.reasoning,
-                    "plan_hash": plan.plan_hash,
-                    "method": plan.method,
-                    "metadata": dict(plan.metadata),
-                }
-            )
+            record = dict(zip(_PLAN_FIELDS, _get_plan_fields(plan)))
+            record["metadata"] = dict(plan.metadata)
+            plans.append(record)
 
         return plans
 
@@ -342,15 +475,14 @@ class EventContext:
         plan_content = f"{symbol}|{action}|{reasoning}"
         plan_hash = hashlib.md5(plan_content.encode()).hexdigest()[:8]
 
+        # Core matches duplicates on symbol/action/time window (plus the hash), so
+        # the potentially large LLM reasoning text is hashed locally and never
+        # put on the wire.
         plan = pb_memory.PlanRecord(
-            timestamp_ms=int(time.time() * 1000),
+            timestamp_ms=time.time_ns() // 1_000_000,
             symbol=symbol,
             action=action,
-            confidence=0.0,  # Not used for duplicate check
-            reasoning=reasoning,
             plan_hash=plan_hash,
-            method="",
-            metadata={},
         )
 
         req = pb_memory.CheckDuplicateRequest(
@@ -386,6 +518,7 @@ class EventContext:
         order_id: str = "",
         order_size_usdt: float = 0.0,
         error_message: str = "",
+        wait: bool = True,
     ) -> None:
         """Mark a plan as executed in Core memory (for idempotency).
 
@@ -399,11 +532,12 @@ class EventContext:
             order_id: Exchange order ID
             order_size_usdt: Order size in USDT
             error_message: Error message if failed
+            wait: If False, buffer the write for the background flusher
         """
         from ..bridge.proto import memory_pb2 as pb_memory
 
         execution = pb_memory.ExecutionRecord(
-            timestamp_ms=int(time.time() * 1000),
+            timestamp_ms=time.time_ns() // 1_000_000,
             plan_hash=plan_hash,
             symbol=symbol,
             action=action,
@@ -421,6 +555,10 @@ class EventContext:
             execution=execution,
         )
 
+        if not wait:
+            self._queue_write(self.client.mark_executed, req, "mark executed")
+            return
+
         resp = await self.client.mark_executed(req)
         if not resp.success:
             raise RuntimeError(f"Failed to mark executed: {resp.error_message}")
@@ -484,19 +622,10 @@ class EventContext:
 
         resp = await self.client.get_execution_stats(req)
 
-        recent_executions = []
-        for exec_rec in resp.recent_executions:
-            recent_executions.append(
-                {
-                    "timestamp_ms": exec_rec.timestamp_ms,
-                    "plan_hash": exec_rec.plan_hash,
-                    "symbol": exec_rec.symbol,
-                    "action": exec_rec.action,
-                    "status": exec_rec.status,
-                    "executed": exec_rec.executed,
-                    "order_id": exec_rec.order_id,
-                }
-            )
+        recent_executions = [
+            dict(zip(_EXECUTION_SUMMARY_FIELDS, _get_execution_summary_fields(exec_rec)))
+            for exec_rec in resp.recent_executions
+        ]
 
         return {
             "total_executions": resp.total_executions,
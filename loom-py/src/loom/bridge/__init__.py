@@ -6,10 +6,48 @@ to Rust Core:
 - proto/: Generated protobuf code
 """
 
-from .client import BridgeClient
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import BridgeClient
+    from .proto import (
+        action_pb2,
+        bridge_pb2,
+        bridge_pb2_grpc,
+        event_pb2,
+        memory_pb2,
+        memory_pb2_grpc,
+    )
+
+# Exported name -> submodule, imported on first access (gRPC and the
+# generated protobuf modules are comparatively slow to import)
+_LAZY_ATTRS = {
+    "BridgeClient": ".client",
+    # Proto modules, re-exported for convenience
+    "action_pb2": ".proto",
+    "bridge_pb2": ".proto",
+    "bridge_pb2_grpc": ".proto",
+    "event_pb2": ".proto",
+    "memory_pb2": ".proto",
+    "memory_pb2_grpc": ".proto",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-# Re-export proto modules for convenience
-from .proto import action_pb2, bridge_pb2, bridge_pb2_grpc, event_pb2, memory_pb2, memory_pb2_grpc
 
 __all__ = [
     "BridgeClient",
@@ -1,19 +1,45 @@
 from __future__ import annotations
 
 import os
-from typing import AsyncIterator, Optional
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
 
 import grpc
 
-from .proto import action_pb2 as pb_action
 from .proto import bridge_pb2 as pb_bridge
 from .proto import bridge_pb2_grpc as pb_bridge_grpc
-from .proto import event_pb2 as pb_event
-from .proto import memory_pb2 as pb_memory
-from .proto import memory_pb2_grpc as pb_memory_grpc
+
+if TYPE_CHECKING:
+    from .proto import action_pb2 as pb_action
+    from .proto import event_pb2 as pb_event
+    from .proto import memory_pb2 as pb_memory
+    from .proto import memory_pb2_grpc as pb_memory_grpc
+
+# Proto modules re-exported from here but not needed by the client itself;
+# imported on first access so connecting only loads the Bridge service
+_LAZY_PROTO = {"pb_action": "action_pb2", "pb_event": "event_pb2", "pb_memory": "memory_pb2"}
 
 DEFAULT_ADDR = "127.0.0.1:50051"  # resolved at construction time
 
+# Channel tuning for long-lived chat/agent streams:
+# - keepalive pings (allowed while idle) keep shared channels from being dropped
+# - 64 MiB message caps leave room for large histories and tool outputs
+_MAX_MESSAGE_BYTES = 64 << 20
+_CHANNEL_OPTIONS = (
+    ("grpc.keepalive_time_ms", 20000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_send_message_length", _MAX_MESSAGE_BYTES),
+    ("grpc.max_receive_message_length", _MAX_MESSAGE_BYTES),
+)
+
+
+@lru_cache(maxsize=1)
+def _heartbeat_request() -> pb_bridge.HeartbeatRequest:
+    """Shared HeartbeatRequest; it has no fields, so one instance serves every tick."""
+    return pb_bridge.HeartbeatRequest()
+
 
 class BridgeClient:
     def __init__(self, address: Optional[str] = None):
@@ -25,9 +51,11 @@ class BridgeClient:
 
     async def connect(self):
         if self._channel is None:
-            self._channel = grpc.aio.insecure_channel(self.address)
+            self._channel = grpc.aio.insecure_channel(
+                self.address,
+                options=_CHANNEL_OPTIONS,
+            )
             self._stub = pb_bridge_grpc.BridgeStub(self._channel)
-            self._memory_stub = pb_memory_grpc.MemoryServiceStub(self._channel)
 
     async def close(self):
         if self._channel:
@@ -36,6 +64,16 @@ class BridgeClient:
             self._stub = None
             self._memory_stub = None
 
+    @property
+    def memory_stub(self) -> pb_memory_grpc.MemoryServiceStub:
+        """MemoryService stub on the same channel, created on first use."""
+        if self._memory_stub is None:
+            assert self._channel is not None
+            from .proto import memory_pb2_grpc as pb_memory_grpc
+
+            self._memory_stub = pb_memory_grpc.MemoryServiceStub(self._channel)
+        return self._memory_stub
+
     async def register_agent(
         self,
         agent_id: str,
@@ -73,42 +111,92 @@ class BridgeClient:
 
     async def heartbeat(self) -> pb_bridge.HeartbeatResponse:
         assert self._stub is not None
-        return await self._stub.Heartbeat(pb_bridge.HeartbeatRequest())
+        return await self._stub.Heartbeat(_heartbeat_request())
 
     # Memory service methods
     async def save_plan(self, req: pb_memory.SavePlanRequest) -> pb_memory.SavePlanResponse:
-        assert self._memory_stub is not None
-        return await self._memory_stub.SavePlan(req)
+        return await self.memory_stub.SavePlan(req)
 
     async def get_recent_plans(
         self, req: pb_memory.GetRecentPlansRequest
     ) -> pb_memory.GetRecentPlansResponse:
-        assert self._memory_stub is not None
-        return await self._memory_stub.GetRecentPlans(req)
+        return await self.memory_stub.GetRecentPlans(req)
 
     async def check_duplicate(
         self, req: pb_memory.CheckDuplicateRequest
     ) -> pb_memory.CheckDuplicateResponse:
-        assert self._memory_stub is not None
-        return await self._memory_stub.CheckDuplicate(req)
+        return await self.memory_stub.CheckDuplicate(req)
 
     async def mark_executed(
         self, req: pb_memory.MarkExecutedRequest
     ) -> pb_memory.MarkExecutedResponse:
-        assert self._memory_stub is not None
-        return await self._memory_stub.MarkExecuted(req)
+        return await self.memory_stub.MarkExecuted(req)
 
     async def check_executed(
         self, req: pb_memory.CheckExecutedRequest
     ) -> pb_memory.CheckExecutedResponse:
-        assert self._memory_stub is not None
-        return await self._memory_stub.CheckExecuted(req)
+        return await self.memory_stub.CheckExecuted(req)
 
     async def get_execution_stats(
         self, req: pb_memory.GetExecutionStatsRequest
     ) -> pb_memory.GetExecutionStatsResponse:
-        assert self._memory_stub is not None
-        return await self._memory_stub.GetExecutionStats(req)
-
-
-__all__ = ["BridgeClient", "pb_bridge", "pb_event", "pb_action", "pb_memory"]
+        return await self.memory_stub.GetExecutionStats(req)
+
+
+# Connected clients shared per address, with the number of holders of each.
+# A threading lock guards the dicts: nothing is awaited while it is held, and
+# unlike an asyncio.Lock it is not bound to the first loop that contends on it.
+_CLIENTS: dict[str, BridgeClient] = {}
+_CLIENT_REFS: dict[str, int] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+async def get_shared_client(address: Optional[str] = None) -> BridgeClient:
+    """Return a connected BridgeClient for ``address``, shared across callers.
+
+    Every call must be paired with :func:`release_shared_client`; the channel
+    is closed when the last holder releases it.
+    """
+    address = address or os.environ.get("LOOM_BRIDGE_ADDR", DEFAULT_ADDR)
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(address)
+        if client is None:
+            client = _CLIENTS[address] = BridgeClient(address)
+        _CLIENT_REFS[address] = _CLIENT_REFS.get(address, 0) + 1
+    await client.connect()  # no-op once the channel is open
+    return client
+
+
+async def release_shared_client(client: BridgeClient) -> None:
+    """Release a client obtained from :func:`get_shared_client`."""
+    with _CLIENTS_LOCK:
+        address = client.address
+        if _CLIENTS.get(address) is not client:
+            return
+        _CLIENT_REFS[address] -= 1
+        if _CLIENT_REFS[address] > 0:
+            return
+        del _CLIENTS[address], _CLIENT_REFS[address]
+    await client.close()
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_PROTO.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import proto
+
+    value = getattr(proto, module)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "BridgeClient",
+    "get_shared_client",
+    "release_shared_client",
+    "pb_bridge",
+    "pb_event",
+    "pb_action",
+    "pb_memory",
+]
@@ -1,14 +1,15 @@
 """Protocol buffer Python modules package.
 
-Generated stubs live in the subpackage ``loom.proto.generated`` after running
+Generated stubs live in the subpackage ``loom.bridge.proto.generated`` after running
 ``loom proto`` in a monorepo checkout. Published wheels will vendor those files
 so end users do **not** need ``grpcio-tools``.
 
 Backward compatibility: we re-export common modules at this level so existing
-imports like ``from loom.proto import bridge_pb2`` keep working.
+imports like ``from loom.bridge.proto import bridge_pb2`` keep working.
 """
 
 from importlib import import_module
+from typing import Any
 
 from . import generated as _generated  # type: ignore
 
@@ -23,11 +24,23 @@ _NAMES = [
     "memory_pb2_grpc",
 ]
 
-for _name in _NAMES:
+
+def __getattr__(name: str) -> Any:
+    # Import generated modules on first access: each one registers its
+    # descriptors, so importing all of them up front slows down startup.
+    if name not in _NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     try:
-        globals()[_name] = import_module(f"loom.bridge.proto.generated.{_name}")
-    except Exception:
-        # Modules may not exist yet if user hasn't generated them; remain lazy.
-        pass
+        module = import_module(f"{_generated.__name__}.{name}")
+    except Exception as e:
+        # Modules may not exist yet if user hasn't generated them
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from e
+    globals()[name] = module
+    return module
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_NAMES))
+
 
 __all__ = _NAMES
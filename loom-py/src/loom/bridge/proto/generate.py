@@ -1,7 +1,7 @@
 """Generate Python gRPC stubs from the Loom .proto files.
 
 Usage:
-    python -m loom.proto.generate
+    python -m loom.bridge.proto.generate
 
 Requires `grpcio-tools`.
 """
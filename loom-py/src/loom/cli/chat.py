@@ -5,12 +5,26 @@ This module provides terminal UI for chatting with cognitive agents.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import os
 import shutil
+import signal
+import sys
+import textwrap
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Iterable
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from types import FrameType
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional
 
 if TYPE_CHECKING:
+    from ..bridge.client import BridgeClient
     from ..cognitive import CognitiveAgent
+    from ..cognitive.types import CognitiveResult, ThoughtStep
 
 
 # ============================================================================
@@ -45,14 +59,133 @@ class Colors:
     BRIGHT_CYAN = "\033[96m"
 
 
+def _color_enabled() -> bool:
+    """Whether to emit ANSI colors: honors NO_COLOR/FORCE_COLOR, else needs a TTY."""
+    if os.environ.get("FORCE_COLOR"):
+        return True
+    if os.environ.get("NO_COLOR"):
+        return False
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
+# Blank the palette when output is piped, before any decorated string below
+# is built, so plain output carries no escape codes at all
+if not _color_enabled():
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, "")
+
+
+# Fixed ANSI fragments used by the step/result renderers, built once at import
+# so the per-line work is only concatenating the dynamic payload.
+_RESET = Colors.RESET
+_DIM = Colors.DIM
+_BAR = f"{Colors.BRIGHT_MAGENTA}  │{Colors.RESET}"
+_BAR_DIM = f"{_BAR}{Colors.DIM}"
+_BAR_DIM_INDENT = f"{_BAR}    {Colors.DIM}"
+_STEP_OPEN = f"{Colors.BRIGHT_MAGENTA}  ┌─ Step "
+_STEP_CLOSE = f"{Colors.BRIGHT_MAGENTA}  └"
+_THOUGHT_HDR = f"{_BAR} {Colors.YELLOW}💭 Thought:{Colors.RESET}"
+_ACTION_HDR = f"{_BAR} {Colors.CYAN}🔧 Action:{Colors.RESET} {Colors.BOLD}"
+_ARGS_PREFIX = f"{_BAR}    {Colors.DIM}Args: "
+_OBS_HDR = f"{_BAR} {Colors.GREEN}✅ Observation:{Colors.RESET}"
+_OBS_ERROR_PREFIX = f"{_BAR} {Colors.RED}❌ Error: "
+_GREEN_RULE = Colors.BRIGHT_GREEN
+_ASSISTANT_HDR = f"{Colors.BRIGHT_GREEN}{Colors.BOLD}🤖 Assistant:{Colors.RESET}"
+_STATUS_OK = "✅ Success"
+_STATUS_FAILED = "❌ Failed"
+_CALLING_TOOL = f"{Colors.CYAN}🔧 Calling tool: {Colors.BOLD}"
+_RESULT_HDR = f"{Colors.GREEN}   ✅ Result:{Colors.RESET}"
+_DIM_INDENT = f"{Colors.DIM}      "
+_OFFLOADED_PREFIX = f"{Colors.DIM}      📄 Offloaded to: {Colors.CYAN}"
+_SUMMARY_PREFIX = f"{Colors.DIM}      💡 Summary: "
+_VIEW_PREFIX = f"{Colors.DIM}      📖 View with: {Colors.YELLOW}cat "
+_ERROR_PREFIX = f"{Colors.RED}   ❌ Error: "
+_HELP_BODY = "\n".join(
+    [
+        f"{Colors.CYAN}{Colors.BOLD}Available Commands:{Colors.RESET}",
+        f"  {Colors.YELLOW}/help{Colors.RESET}      - Show this help message",
+        f"  {Colors.YELLOW}/clear{Colors.RESET}     - Clear conversation history",
+        f"  {Colors.YELLOW}/history{Colors.RESET}   - Show conversation history",
+        f"  {Colors.YELLOW}/verbose{Colors.RESET}   - Toggle verbose mode (show thinking)",
+        f"  {Colors.YELLOW}/stream{Colors.RESET}    - Toggle streaming mode",
+        f"  {Colors.YELLOW}/research{Colors.RESET}  - Deep research mode "
+        "(e.g., /research AI frameworks)",
+        f"  {Colors.YELLOW}/quit{Colors.RESET}      - Exit the chat",
+        f"\n{Colors.DIM}Available Tools:{Colors.RESET}",
+        f"  {Colors.DIM}• weather:get    - Get weather for a location{Colors.RESET}",
+        f"  {Colors.DIM}• system:shell   - Run shell commands (ls, echo, cat, grep){Colors.RESET}",
+        f"  {Colors.DIM}• fs:read_file   - Read file contents{Colors.RESET}",
+        f"  {Colors.DIM}• fs:write_file  - Write content to a file (requires approval){Colors.RESET}",
+        f"  {Colors.DIM}• fs:list_dir    - List directory contents{Colors.RESET}",
+        f"  {Colors.DIM}• fs:delete      - Delete a file or directory (requires approval){Colors.RESET}",
+        f"  {Colors.DIM}• web:search     - Search the web (Brave Search){Colors.RESET}",
+    ]
+)
+
+
+# Terminal width cached until the next SIGWINCH; None means "query again"
+_CACHED_WIDTH: Optional[int] = None
+_SIGWINCH_INSTALLED = False
+
+
+def _invalidate_on_sigwinch(
+    signum: Optional[int] = None, frame: Optional[FrameType] = None, _previous: Any = None
+) -> None:
+    """Drop the cached width so the next render re-queries the terminal."""
+    global _CACHED_WIDTH
+    _CACHED_WIDTH = None
+    if callable(_previous):
+        _previous(signum, frame)
+
+
+def _install_sigwinch_handler() -> bool:
+    """Install the resize handler once; False where it cannot be installed."""
+    global _SIGWINCH_INSTALLED
+    if _SIGWINCH_INSTALLED:
+        return True
+    if not hasattr(signal, "SIGWINCH"):
+        return False
+    try:
+        previous = signal.getsignal(signal.SIGWINCH)
+        signal.signal(
+            signal.SIGWINCH,
+            lambda signum, frame: _invalidate_on_sigwinch(signum, frame, previous),
+        )
+    except ValueError:  # not the main thread
+        return False
+    _SIGWINCH_INSTALLED = True
+    return True
+
+
 def get_terminal_width() -> int:
-    """Get terminal width, default to 80."""
-    return shutil.get_terminal_size((80, 24)).columns
+    """Get terminal width, default to 80.
+
+    The value is cached and invalidated on SIGWINCH, so repeated calls while
+    rendering do not each issue a TIOCGWINSZ ioctl. Without a resize signal
+    (Windows, non-main threads) the terminal is queried every time.
+    """
+    global _CACHED_WIDTH
+    if _CACHED_WIDTH is not None:
+        return _CACHED_WIDTH
+    width = shutil.get_terminal_size((80, 24)).columns
+    if _install_sigwinch_handler():
+        _CACHED_WIDTH = width
+    return width
+
+
+# Renderers never draw wider than this, even on wide terminals
+_MAX_RENDER_WIDTH = 70
+
+
+def _render_width() -> int:
+    """Width used by the chat renderers: terminal width capped at 70 columns."""
+    return min(get_terminal_width(), _MAX_RENDER_WIDTH)
 
 
-def print_header():
+def print_header() -> None:
     """Print the application header."""
-    width = min(get_terminal_width(), 70)
+    width = _render_width()
 
     print(f"\n{Colors.BRIGHT_CYAN}{Colors.BOLD}")
     print("╔" + "═" * (width - 2) + "╗")
@@ -62,106 +195,132 @@ def print_header():
     print(f"{Colors.RESET}")
 
 
-def print_divider(char="─", color=Colors.GRAY):
+def _divider(char: str = "─", color: str = Colors.GRAY, width: Optional[int] = None) -> str:
+    """Return a divider line (without the newline)."""
+    if width is None:
+        width = _render_width()
+    return f"{color}{char * width}{Colors.RESET}"
+
+
+def print_divider(char: str = "─", color: str = Colors.GRAY, width: Optional[int] = None) -> None:
     """Print a divider line."""
-    width = min(get_terminal_width(), 70)
-    print(f"{color}{char * width}{Colors.RESET}")
+    print(_divider(char, color, width))
+
+
+@functools.lru_cache(maxsize=16)
+def _text_wrapper(width: int, indent: str) -> textwrap.TextWrapper:
+    return textwrap.TextWrapper(
+        width=max(width, 1),
+        initial_indent=indent,
+        subsequent_indent=indent,
+        break_long_words=False,
+        break_on_hyphens=False,
+    )
 
 
 def wrap_text(text: str, width: int, indent: str = "") -> str:
     """Wrap text to fit within width with optional indent."""
-    words = text.split()
-    lines = []
-    current_line = indent
-
-    for word in words:
-        if len(current_line) + len(word) + 1 <= width:
-            if current_line == indent:
-                current_line += word
-            else:
-                current_line += " " + word
-        else:
-            if current_line != indent:
-                lines.append(current_line)
-            current_line = indent + word
+    # Collapse whitespace runs first, matching the old split()-based wrapper
+    lines = _text_wrapper(width, indent).wrap(" ".join(text.split()))
+    return "\n".join(lines) if lines else indent
 
-    if current_line != indent:
-        lines.append(current_line)
 
-    return "\n".join(lines) if lines else indent
+def _emit(parts: list[str]) -> None:
+    """Write rendered lines with a single write() and flush."""
+    sys.stdout.write("\n".join(parts) + "\n")
+    sys.stdout.flush()
+
+
+class _StepLayout(NamedTuple):
+    """Width-derived strings and limits for the step renderers."""
+
+    header_tail: str
+    footer: str
+    wrap_width: int
+    args_limit: int
+    args_cut: int
+    obs_cut: int
+    error_cut: int
+    stream_cut: int
+
+
+@functools.lru_cache(maxsize=8)
+def _step_layout(width: int) -> _StepLayout:
+    """Precompute everything the step renderers derive from ``width``.
+
+    The width only changes on terminal resize, so borders and cut-offs are
+    built once per width instead of on every rendered step.
+    """
+    return _StepLayout(
+        header_tail=f" {'─' * (width - 15)}┐{_RESET}",
+        footer=f"{_STEP_CLOSE}{'─' * (width - 4)}┘{_RESET}",
+        wrap_width=width - 8,
+        args_limit=width - 15,
+        args_cut=width - 18,
+        obs_cut=width - 8,
+        error_cut=width - 15,
+        stream_cut=width - 10,
+    )
 
 
-def print_thinking_step(step: dict, step_num: int):
+def print_thinking_step(step: dict, step_num: int, width: Optional[int] = None) -> None:
     """Print a thinking step with nice formatting."""
-    width = min(get_terminal_width(), 70)
+    if width is None:
+        width = _render_width()
+    layout = _step_layout(width)
 
     # Step header
-    print(f"\n{Colors.BRIGHT_MAGENTA}  ┌─ Step {step_num} {'─' * (width - 15)}┐{Colors.RESET}")
+    parts = [f"\n{_STEP_OPEN}{step_num}{layout.header_tail}"]
 
     # Reasoning (Thought)
     if step.get("reasoning"):
-        reasoning = step["reasoning"]
-        print(f"{Colors.BRIGHT_MAGENTA}  │{Colors.RESET}")
-        print(f"{Colors.BRIGHT_MAGENTA}  │{Colors.RESET} {Colors.YELLOW}💭 Thought:{Colors.RESET}")
-        wrapped = wrap_text(reasoning, width - 8, "     ")
-        for line in wrapped.split("\n"):
-            print(f"{Colors.BRIGHT_MAGENTA}  │{Colors.RESET}{Colors.DIM}{line}{Colors.RESET}")
+        parts.append(_BAR)
+        parts.append(_THOUGHT_HDR)
+        wrapped = wrap_text(step["reasoning"], layout.wrap_width, "     ")
+        parts.extend(_BAR_DIM + line + _RESET for line in wrapped.split("\n"))
 
     # Tool Call (Action)
     if step.get("tool_call"):
         tc = step["tool_call"]
-        print(f"{Colors.BRIGHT_MAGENTA}  │{Colors.RESET}")
-        print(
-            f"{Colors.BRIGHT_MAGENTA}  │{Colors.RESET} {Colors.CYAN}🔧 Action:{Colors.RESET} "
-            f"{Colors.BOLD}{tc.get('tool', 'unknown')}{Colors.RESET}"
-        )
         args_str = str(tc.get("args", {}))
-        if len(args_str) > width - 15:
-            args_str = args_str[: width - 18] + "..."
-        print(
-            f"{Colors.BRIGHT_MAGENTA}  │{Colors.RESET}    {Colors.DIM}Args: {args_str}{Colors.RESET}"
-        )
+        if len(args_str) > layout.args_limit:
+            args_str = args_str[: layout.args_cut] + "..."
+        parts.append(_BAR)
+        parts.append(_ACTION_HDR + tc.get("tool", "unknown") + _RESET)
+        parts.append(_ARGS_PREFIX + args_str + _RESET)
 
     # Observation (Result)
     if step.get("observation"):
         obs = step["observation"]
-        print(f"{Colors.BRIGHT_MAGENTA}  │{Colors.RESET}")
+        parts.append(_BAR)
         if obs.get("success"):
             output = obs.get("output", "")
             if len(output) > 200:
                 output = output[:200] + "..."
-            print(
-                f"{Colors.BRIGHT_MAGENTA}  │{Colors.RESET} {Colors.GREEN}✅ Observation:{Colors.RESET}"
-            )
-            for line in output.split("\n")[:5]:
-                print(
-                    f"{Colors.BRIGHT_MAGENTA}  │{Colors.RESET}    "
-                    f"{Colors.DIM}{line[:width-8]}{Colors.RESET}"
-                )
+            parts.append(_OBS_HDR)
+            cut = layout.obs_cut
+            parts.extend(_BAR_DIM_INDENT + line[:cut] + _RESET for line in output.split("\n")[:5])
         else:
             error = obs.get("error", "Unknown error")
-            print(
-                f"{Colors.BRIGHT_MAGENTA}  │{Colors.RESET} "
-                f"{Colors.RED}❌ Error: {error[:width-15]}{Colors.RESET}"
-            )
+            parts.append(_OBS_ERROR_PREFIX + error[: layout.error_cut] + _RESET)
 
-    print(f"{Colors.BRIGHT_MAGENTA}  └{'─' * (width - 4)}┘{Colors.RESET}")
+    parts.append(layout.footer)
+    _emit(parts)
 
 
-def print_result(result: dict):
+def print_result(result: dict, width: Optional[int] = None) -> None:
     """Print the final result."""
-    width = min(get_terminal_width(), 70)
-
-    print(f"\n{Colors.BRIGHT_GREEN}{'═' * width}{Colors.RESET}")
-    print(f"{Colors.BRIGHT_GREEN}{Colors.BOLD}🤖 Assistant:{Colors.RESET}")
-    print()
-
-    answer = result["answer"]
-    wrapped = wrap_text(answer, width - 2, "")
-    print(f"{wrapped}")
-
-    print()
-    print(f"{Colors.BRIGHT_GREEN}{'─' * width}{Colors.RESET}")
+    if width is None:
+        width = _render_width()
+
+    parts = [
+        f"\n{_GREEN_RULE}{'═' * width}{_RESET}",
+        _ASSISTANT_HDR,
+        "",
+        wrap_text(result["answer"], width - 2, ""),
+        "",
+        f"{_GREEN_RULE}{'─' * width}{_RESET}",
+    ]
 
     # Stats
     stats = []
@@ -170,11 +329,10 @@ def print_result(result: dict):
     if result.get("latency_ms"):
         stats.append(f"⏱️  {result['latency_ms']}ms")
     if result.get("success") is not None:
-        status = "✅" if result["success"] else "❌"
-        stats.append(f"{status} {'Success' if result['success'] else 'Failed'}")
+        stats.append(_STATUS_OK if result["success"] else _STATUS_FAILED)
 
     if stats:
-        print(f"{Colors.DIM}{' │ '.join(stats)}{Colors.RESET}")
+        parts.append(_DIM + " │ ".join(stats) + _RESET)
 
     # Context engineering metrics
     steps = result.get("steps", [])
@@ -187,99 +345,154 @@ def print_result(result: dict):
             and s["observation"].get("reduced_step", {}).get("outcome_ref")
         )
         if offloaded_count > 0:
-            print(f"{Colors.DIM}📊 Context: {offloaded_count} offloaded outputs{Colors.RESET}")
+            parts.append(f"{_DIM}📊 Context: {offloaded_count} offloaded outputs{_RESET}")
+
+    _emit(parts)
 
 
-def print_help():
+def print_help(width: Optional[int] = None) -> None:
     """Print help message."""
-    width = min(get_terminal_width(), 70)
-
-    print(f"\n{Colors.CYAN}{'─' * width}{Colors.RESET}")
-    print(f"{Colors.CYAN}{Colors.BOLD}Available Commands:{Colors.RESET}")
-    print(f"  {Colors.YELLOW}/help{Colors.RESET}      - Show this help message")
-    print(f"  {Colors.YELLOW}/clear{Colors.RESET}     - Clear conversation history")
-    print(f"  {Colors.YELLOW}/history{Colors.RESET}   - Show conversation history")
-    print(f"  {Colors.YELLOW}/verbose{Colors.RESET}   - Toggle verbose mode (show thinking)")
-    print(f"  {Colors.YELLOW}/stream{Colors.RESET}    - Toggle streaming mode")
-    print(
-        f"  {Colors.YELLOW}/research{Colors.RESET}  - Deep research mode (e.g., /research AI frameworks)"
+    if width is None:
+        width = _render_width()
+
+    rule = f"{Colors.CYAN}{'─' * width}{_RESET}"
+    _emit([f"\n{rule}", _HELP_BODY, f"{rule}\n"])
+
+
+class StreamWriter:
+    """Buffered sink for streamed LLM chunks.
+
+    Chunks are held until one contains a newline, ``max_pending`` characters
+    accumulate, or ``min_flush_interval`` seconds pass, then written (wrapped
+    in ``prefix``/``suffix``) with a single write() and flush(). Inside a
+    running event loop a ``call_later`` timer guarantees the tail of a
+    paused stream is still shown on time. Call :meth:`flush` before printing
+    anything else to keep output ordered.
+    """
+
+    __slots__ = (
+        "_pending",
+        "_pending_len",
+        "_last_flush",
+        "_timer",
+        "min_flush_interval",
+        "max_pending",
+        "prefix",
+        "suffix",
     )
-    print(f"  {Colors.YELLOW}/quit{Colors.RESET}      - Exit the chat")
-    print(f"\n{Colors.DIM}Available Tools:{Colors.RESET}")
-    print(f"  {Colors.DIM}• weather:get    - Get weather for a location{Colors.RESET}")
-    print(
-        f"  {Colors.DIM}• system:shell   - Run shell commands (ls, echo, cat, grep){Colors.RESET}"
-    )
-    print(f"  {Colors.DIM}• fs:read_file   - Read file contents{Colors.RESET}")
-    print(
-        f"  {Colors.DIM}• fs:write_file  - Write content to a file (requires approval){Colors.RESET}"
-    )
-    print(f"  {Colors.DIM}• fs:list_dir    - List directory contents{Colors.RESET}")
-    print(
-        f"  {Colors.DIM}• fs:delete      - Delete a file or directory (requires approval){Colors.RESET}"
-    )
-    print(f"  {Colors.DIM}• web:search     - Search the web (Brave Search){Colors.RESET}")
-    print(f"{Colors.CYAN}{'─' * width}{Colors.RESET}\n")
 
-
-def print_streaming_header():
+    def __init__(
+        self,
+        min_flush_interval: float = 0.03,
+        prefix: str = "",
+        suffix: str = "",
+        max_pending: int = 4096,
+    ):
+        self._pending: list[str] = []
+        self._pending_len = 0
+        self._last_flush = time.monotonic()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.min_flush_interval = min_flush_interval
+        self.max_pending = max_pending
+        self.prefix = prefix
+        self.suffix = suffix
+
+    def __call__(self, chunk: str) -> None:
+        self._pending.append(chunk)
+        self._pending_len += len(chunk)
+        if (
+            "\n" in chunk
+            or self._pending_len >= self.max_pending
+            or time.monotonic() - self._last_flush >= self.min_flush_interval
+        ):
+            self.flush()
+        elif self._timer is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self._timer = loop.call_later(self.min_flush_interval, self.flush)
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            sys.stdout.write(self.prefix + "".join(self._pending) + self.suffix)
+            sys.stdout.flush()
+            self._pending.clear()
+            self._pending_len = 0
+        self._last_flush = time.monotonic()
+
+
+def make_stream_writer(
+    min_flush_interval: float = 0.03,
+    prefix: str = "",
+    suffix: str = "",
+    max_pending: int = 4096,
+) -> StreamWriter:
+    """Create an ``on_chunk`` callback that coalesces stdout writes."""
+    return StreamWriter(min_flush_interval, prefix, suffix, max_pending)
+
+
+_STREAMING_HEADER = (
+    f"\n{Colors.BRIGHT_MAGENTA}{Colors.BOLD}💭 Thinking...{Colors.RESET}\n"
+    f"{Colors.DIM}{'─' * 50}{Colors.RESET}"
+)
+
+
+def print_streaming_header() -> None:
     """Print streaming header."""
-    print(f"\n{Colors.BRIGHT_MAGENTA}{Colors.BOLD}💭 Thinking...{Colors.RESET}")
-    print(f"{Colors.DIM}─" * 50 + f"{Colors.RESET}")
+    print(_STREAMING_HEADER)
 
 
-def print_stream_step_complete(step):
+def print_stream_step_complete(step: ThoughtStep, width: Optional[int] = None) -> None:
     """Print a brief note when a thinking step completes."""
-    width = min(get_terminal_width(), 70)
-    print()  # Newline after streamed content
+    if width is None:
+        width = _render_width()
+    parts = [""]  # Newline after streamed content
 
     if step.tool_call:
-        tool_name = step.tool_call.name
-        print(f"\n{Colors.CYAN}🔧 Calling tool: {Colors.BOLD}{tool_name}{Colors.RESET}")
+        parts.append(f"\n{_CALLING_TOOL}{step.tool_call.name}{_RESET}")
 
         # Show observation
         if step.observation:
             if step.observation.success:
                 output = step.observation.output
+                cut = _step_layout(width).stream_cut
 
                 # Check if data was offloaded
                 if step.reduced_step and step.reduced_step.outcome_ref:
-                    print(f"{Colors.GREEN}   ✅ Result:{Colors.RESET}")
                     # Show workspace-relative path and how to view it
                     ref_path = step.reduced_step.outcome_ref
-                    print(
-                        f"{Colors.DIM}      📄 Offloaded to: {Colors.CYAN}{ref_path}{Colors.RESET}"
-                    )
-                    print(
-                        f"{Colors.DIM}      💡 Summary: {step.reduced_step.observation[:100]}{Colors.RESET}"
-                    )
-                    print(
-                        f"{Colors.DIM}      📖 View with: {Colors.YELLOW}cat {ref_path}{Colors.RESET}"
-                    )
-                    print(
-                        f"{Colors.DIM}      💡 Summary: {step.reduced_step.observation[:100]}{Colors.RESET}"
-                    )
+                    summary = _SUMMARY_PREFIX + step.reduced_step.observation[:100] + _RESET
+                    parts.append(_RESULT_HDR)
+                    parts.append(_OFFLOADED_PREFIX + ref_path + _RESET)
+                    parts.append(summary)
+                    parts.append(_VIEW_PREFIX + ref_path + _RESET)
+                    parts.append(summary)
                 else:
                     # Show output with smart truncation
                     max_lines = 8
                     lines = output.split("\n")
-                    print(f"{Colors.GREEN}   ✅ Result:{Colors.RESET}")
+                    parts.append(_RESULT_HDR)
 
                     if len(lines) > max_lines:
                         # Show first few and last few lines
-                        for line in lines[: max_lines - 2]:
-                            print(f"{Colors.DIM}      {line[:width-10]}{Colors.RESET}")
-                        print(
-                            f"{Colors.DIM}      ... ({len(lines) - max_lines} more lines) ...{Colors.RESET}"
+                        parts.extend(
+                            _DIM_INDENT + line[:cut] + _RESET for line in lines[: max_lines - 2]
                         )
-                        for line in lines[-2:]:
-                            print(f"{Colors.DIM}      {line[:width-10]}{Colors.RESET}")
+                        parts.append(
+                            f"{_DIM_INDENT}... ({len(lines) - max_lines} more lines) ...{_RESET}"
+                        )
+                        parts.extend(_DIM_INDENT + line[:cut] + _RESET for line in lines[-2:])
                     else:
-                        for line in lines:
-                            print(f"{Colors.DIM}      {line[:width-10]}{Colors.RESET}")
+                        parts.extend(_DIM_INDENT + line[:cut] + _RESET for line in lines)
             else:
-                print(f"{Colors.RED}   ❌ Error: {step.observation.error}{Colors.RESET}")
-        print()
+                parts.append(f"{_ERROR_PREFIX}{step.observation.error}{_RESET}")
+        parts.append("")
+
+    _emit(parts)
 
 
 # ============================================================================
@@ -287,6 +500,86 @@ def print_stream_step_complete(step):
 # ============================================================================
 
 
+class _SafeCharTable(dict):
+    """str.translate table keeping alphanumerics and "-_ ", mapping others to "_".
+
+    Entries are filled in on first sight of each code point, so translation
+    stays a single C-level pass while matching str.isalnum() for non-ASCII.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        c = chr(codepoint)
+        value = c if c.isalnum() or c in "-_ " else "_"
+        self[codepoint] = value
+        return value
+
+
+_SAFE_FILENAME_CHARS = _SafeCharTable()
+
+
+# Number of prior messages passed to the cognitive loop as context
+_CONTEXT_MESSAGES = 5
+
+# Static system prompt and tool list, kept byte-identical across turns and
+# sessions so provider-side prompt caches keep hitting on the prefix
+_SYSTEM_PROMPT = """You are a helpful AI assistant with access to tools.
+
+Available tools:
+- weather:get: Get current weather. Args: {"location": "city name"}
+- system:shell: Run shell commands. Args: {"command": "cmd"} (some commands may require user approval)
+- fs:read_file: Read file contents. Args: {"path": "relative/path"}
+- fs:write_file: Write content to file. Args: {"path": "relative/path", "content": "text"} (requires approval)
+- fs:list_dir: List directory. Args: {"path": "relative/path"} (optional, defaults to workspace root)
+- fs:delete: Delete file or empty directory. Args: {"path": "relative/path"} (requires approval)
+- web:search: Search the web for information. Args: {"query": "search terms", "limit": 5}
+
+When you need information, use the appropriate tool.
+Think step by step and explain your reasoning.
+Be helpful, concise, and friendly."""
+_CHAT_TOOLS = (
+    "weather:get",
+    "system:shell",
+    "fs:read_file",
+    "fs:write_file",
+    "fs:list_dir",
+    "fs:delete",
+    "web:search",
+)
+
+# Default cap on messages kept in a session's history
+_MAX_HISTORY = 200
+
+# Default time budget for a /research run, in seconds
+_RESEARCH_TIMEOUT = 600.0
+
+# Display labels for history roles, avoiding str.capitalize() per message
+_ROLE_LABELS = {"user": "User", "assistant": "Assistant"}
+
+
+def _serialize_step(s: ThoughtStep) -> dict:
+    return {
+        "step": s.step,
+        "reasoning": s.reasoning,
+        "tool_call": tc.to_dict() if (tc := s.tool_call) else None,
+        "observation": (
+            {"success": obs.success, "output": obs.output, "error": obs.error}
+            if (obs := s.observation)
+            else None
+        ),
+    }
+
+
+def _serialize_result(result: CognitiveResult) -> dict:
+    """Convert a CognitiveResult into the dict shape returned by ChatSession."""
+    return {
+        "answer": result.answer,
+        "steps": [_serialize_step(s) for s in result.steps],
+        "iterations": result.iterations,
+        "success": result.success,
+        "latency_ms": result.total_latency_ms,
+    }
+
+
 class ChatSession:
     """Interactive chat session with a cognitive agent."""
 
@@ -296,18 +589,79 @@ class ChatSession:
         bridge_addr: Optional[str] = None,
         verbose: bool = True,
         streaming: bool = True,
+        max_history: int = _MAX_HISTORY,
+        max_history_chars: Optional[int] = None,
+        research_timeout: Optional[float] = _RESEARCH_TIMEOUT,
     ):
         self.agent_id = agent_id
         self.bridge_addr = bridge_addr
         self.verbose = verbose
         self.streaming = streaming
         self.agent = None
+        self._client: Optional[BridgeClient] = None
         self.cognitive: Optional[CognitiveAgent] = None
-        self.conversation_history: list[dict] = []
+        # History stored column-wise (parallel role/content/length deques);
+        # the oldest messages are evicted once max_history is reached
+        self._roles: deque[str] = deque(maxlen=max_history)
+        self._contents: deque[str] = deque(maxlen=max_history)
+        self._lengths: deque[int] = deque(maxlen=max_history)
+        self._history_chars = 0
+        self.max_history_chars = max_history_chars
+        # Seconds /research may run before it is cancelled (None = no limit)
+        self.research_timeout = research_timeout
+        # Preformatted "Role: content" lines for the last few messages, fed
+        # to the cognitive loop as context without re-slicing the history
+        self._context_lines: deque[str] = deque(maxlen=_CONTEXT_MESSAGES)
+
+    @property
+    def conversation_history(self) -> list[dict]:
+        """Conversation as a list of ``{"role", "content"}`` dicts (a snapshot)."""
+        return [{"role": r, "content": c} for r, c in zip(self._roles, self._contents)]
+
+    @property
+    def max_history(self) -> Optional[int]:
+        """Maximum number of messages kept in the history."""
+        return self._roles.maxlen
+
+    def append_message(self, role: str, content: str) -> None:
+        """Append one message to the conversation history.
+
+        Evicts the oldest messages when the history is over ``max_history``
+        messages or ``max_history_chars`` characters (the newest message is
+        always kept).
+        """
+        if len(self._lengths) == self._lengths.maxlen:
+            self._history_chars -= self._lengths[0]
+        self._roles.append(role)
+        self._contents.append(content)
+        self._lengths.append(len(content))
+        self._history_chars += len(content)
+        budget = self.max_history_chars
+        if budget is not None:
+            while self._history_chars > budget and len(self._lengths) > 1:
+                self._roles.popleft()
+                self._contents.popleft()
+                self._history_chars -= self._lengths.popleft()
+        self._context_lines.append(f"{_ROLE_LABELS.get(role) or role.capitalize()}: {content}")
+
+    def _begin_turn(self) -> Optional[list[str]]:
+        """Return the context lines for a new turn.
+
+        The user message is not committed until the turn completes, so a
+        turn that raises or is cancelled leaves the history untouched.
+        """
+        return list(self._context_lines) or None
+
+    def _commit_turn(self, message: str, answer: Optional[str] = None) -> None:
+        """Append a completed turn to the committed history."""
+        self.append_message("user", message)
+        if answer is not None:
+            self.append_message("assistant", answer)
 
-    async def start(self):
+    async def start(self) -> ChatSession:
         """Initialize and start the chat session."""
         from .. import Agent, CognitiveAgent, CognitiveConfig, ThinkingStrategy
+        from ..bridge.client import get_shared_client
         from ..llm import LLMProvider
         from ..runtime.config import load_project_config
 
@@ -317,11 +671,12 @@ class ChatSession:
         # Use provided address or from config
         addr = self.bridge_addr or project_config.bridge.address
 
-        # Create base agent
+        # Create base agent on the process-wide client for this address
+        self._client = await get_shared_client(addr)
         self.agent = Agent(
             agent_id=self.agent_id,
             topics=["chat.input", "chat.replies"],
-            address=addr,
+            client=self._client,
         )
         await self.agent.start()
 
@@ -349,33 +704,12 @@ class ChatSession:
             ctx=self.agent._ctx,
             llm=llm,
             config=CognitiveConfig(
-                system_prompt="""You are a helpful AI assistant with access to tools.
-
-Available tools:
-- weather:get: Get current weather. Args: {"location": "city name"}
-- system:shell: Run shell commands. Args: {"command": "cmd"} (some commands may require user approval)
-- fs:read_file: Read file contents. Args: {"path": "relative/path"}
-- fs:write_file: Write content to file. Args: {"path": "relative/path", "content": "text"} (requires approval)
-- fs:list_dir: List directory. Args: {"path": "relative/path"} (optional, defaults to workspace root)
-- fs:delete: Delete file or empty directory. Args: {"path": "relative/path"} (requires approval)
-- web:search: Search the web for information. Args: {"query": "search terms", "limit": 5}
-
-When you need information, use the appropriate tool.
-Think step by step and explain your reasoning.
-Be helpful, concise, and friendly.""",
+                system_prompt=_SYSTEM_PROMPT,
                 thinking_strategy=strategy,
                 max_iterations=max_iterations,
                 temperature=0.7,
             ),
-            available_tools=[
-                "weather:get",
-                "system:shell",
-                "fs:read_file",
-                "fs:write_file",
-                "fs:list_dir",
-                "fs:delete",
-                "web:search",
-            ],
+            available_tools=list(_CHAT_TOOLS),
             permission_callback=self._request_permission,
         )
 
@@ -387,13 +721,18 @@ Be helpful, concise, and friendly.""",
         This is called when a tool (e.g., shell command) is denied by the sandbox.
         Returns True if user approves, False otherwise.
         """
-        print()
-        print(f"{Colors.YELLOW}{'─' * 50}{Colors.RESET}")
-        print(f"{Colors.YELLOW}⚠️  Permission Required{Colors.RESET}")
-        print(f"{Colors.DIM}Tool: {tool_name}{Colors.RESET}")
-        print(f"{Colors.DIM}Args: {args}{Colors.RESET}")
-        print(f"{Colors.DIM}Reason: {error_msg}{Colors.RESET}")
-        print(f"{Colors.YELLOW}{'─' * 50}{Colors.RESET}")
+        rule = f"{Colors.YELLOW}{'─' * 50}{Colors.RESET}"
+        _emit(
+            [
+                "",
+                rule,
+                f"{Colors.YELLOW}⚠️  Permission Required{Colors.RESET}",
+                f"{Colors.DIM}Tool: {tool_name}{Colors.RESET}",
+                f"{Colors.DIM}Args: {args}{Colors.RESET}",
+                f"{Colors.DIM}Reason: {error_msg}{Colors.RESET}",
+                rule,
+            ]
+        )
 
         try:
             response = (
@@ -418,46 +757,18 @@ Be helpful, concise, and friendly.""",
         if not self.cognitive:
             raise RuntimeError("Chat session not started")
 
-        # Add to conversation history
-        self.conversation_history.append({"role": "user", "content": message})
-
-        # Build context from history
-        context = []
-        if len(self.conversation_history) > 1:
-            for msg in self.conversation_history[-6:-1]:
-                context.append(f"{msg['role'].capitalize()}: {msg['content']}")
-
-        # Run cognitive loop
-        result = await self.cognitive.run(message, context=context if context else None)
+        context = self._begin_turn()
+        result = await self.cognitive.run(message, context=context)
 
-        # Add response to history
-        self.conversation_history.append({"role": "assistant", "content": result.answer})
+        self._commit_turn(message, result.answer)
+        return _serialize_result(result)
 
-        return {
-            "answer": result.answer,
-            "steps": [
-                {
-                    "step": s.step,
-                    "reasoning": s.reasoning,
-                    "tool_call": s.tool_call.to_dict() if s.tool_call else None,
-                    "observation": (
-                        {
-                            "success": s.observation.success,
-                            "output": s.observation.output,
-                            "error": s.observation.error,
-                        }
-                        if s.observation
-                        else None
-                    ),
-                }
-                for s in result.steps
-            ],
-            "iterations": result.iterations,
-            "success": result.success,
-            "latency_ms": result.total_latency_ms,
-        }
-
-    async def chat_stream(self, message: str, on_chunk=None, on_step=None):
+    async def chat_stream(
+        self,
+        message: str,
+        on_chunk: Optional[Callable[[str], None]] = None,
+        on_step: Optional[Callable[[ThoughtStep], None]] = None,
+    ) -> dict:
         """Process a chat message with streaming output.
 
         Args:
@@ -473,20 +784,13 @@ Be helpful, concise, and friendly.""",
         if not self.cognitive:
             raise RuntimeError("Chat session not started")
 
-        # Add to conversation history
-        self.conversation_history.append({"role": "user", "content": message})
-
-        # Build context from history
-        context = []
-        if len(self.conversation_history) > 1:
-            for msg in self.conversation_history[-6:-1]:
-                context.append(f"{msg['role'].capitalize()}: {msg['content']}")
+        context = self._begin_turn()
 
         # Stream cognitive loop
         final_result = None
         steps = []
 
-        async for item in self.cognitive.run_stream(message, context=context if context else None):
+        async for item in self.cognitive.run_stream(message, context=context):
             if isinstance(item, str):
                 # LLM text chunk
                 if on_chunk:
@@ -501,47 +805,35 @@ Be helpful, concise, and friendly.""",
                 final_result = item
 
         if final_result:
-            # Add response to history
-            self.conversation_history.append({"role": "assistant", "content": final_result.answer})
-
-            return {
-                "answer": final_result.answer,
-                "steps": [
-                    {
-                        "step": s.step,
-                        "reasoning": s.reasoning,
-                        "tool_call": s.tool_call.to_dict() if s.tool_call else None,
-                        "observation": (
-                            {
-                                "success": s.observation.success,
-                                "output": s.observation.output,
-                                "error": s.observation.error,
-                            }
-                            if s.observation
-                            else None
-                        ),
-                    }
-                    for s in final_result.steps
-                ],
-                "iterations": final_result.iterations,
-                "success": final_result.success,
-                "latency_ms": final_result.total_latency_ms,
-            }
+            self._commit_turn(message, final_result.answer)
+            return _serialize_result(final_result)
 
+        self._commit_turn(message)
         return {"answer": "", "steps": [], "iterations": 0, "success": False}
 
-    async def stop(self):
+    async def stop(self) -> None:
         """Stop the chat session."""
+        from ..bridge.client import release_shared_client
+
         if self.agent:
             await self.agent.stop()
+        if self._client is not None:
+            await release_shared_client(self._client)
+            self._client = None
 
-    def clear_history(self):
+    def clear_history(self) -> None:
         """Clear conversation history."""
-        self.conversation_history = []
+        self._roles.clear()
+        self._contents.clear()
+        self._lengths.clear()
+        self._history_chars = 0
+        self._context_lines.clear()
         if self.cognitive:
             self.cognitive.memory.clear()
 
-    async def research(self, topic: str, on_progress=None) -> dict:
+    async def research(
+        self, topic: str, on_progress: Optional[Callable[[str], None]] = None
+    ) -> dict:
         """Deep research mode: multi-step investigation on a topic.
 
         This method:
@@ -562,7 +854,7 @@ Be helpful, concise, and friendly.""",
         if not self.cognitive:
             raise RuntimeError("Chat session not started")
 
-        def log(msg: str):
+        def log(msg: str) -> None:
             if on_progress:
                 on_progress(msg)
 
@@ -620,14 +912,16 @@ Create a well-structured markdown report with:
 
         # Phase 4: Save report
         log("💾 Phase 4: Saving report...")
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_topic = "".join(c if c.isalnum() or c in "-_ " else "_" for c in topic)[:50]
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        human_ts = now.strftime("%Y-%m-%d %H:%M:%S")
+        safe_topic = topic[:50].translate(_SAFE_FILENAME_CHARS)
         report_filename = f"workspace/reports/{timestamp}_{safe_topic}.md"
 
         # Create full report with metadata
         full_report = f"""# Research Report: {topic}
 
-**Generated**: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+**Generated**: {human_ts}
 **Agent**: {self.agent_id}
 
 ---
@@ -673,7 +967,222 @@ Create a well-structured markdown report with:
 # ============================================================================
 
 
-async def run_chat_cli(bridge_addr: Optional[str] = None, agent_id: str = "chat-assistant"):
+# Static REPL strings, decorated once at import instead of on every turn
+_YOU_PROMPT = f"{Colors.BRIGHT_BLUE}{Colors.BOLD}You ▶{Colors.RESET} "
+_USE_QUIT_HINT = f"\n{Colors.YELLOW}Use /quit to exit{Colors.RESET}"
+_GOODBYE = f"\n{Colors.CYAN}Goodbye! 👋{Colors.RESET}\n"
+_CLEARED = f"{Colors.GREEN}✅ Conversation cleared.{Colors.RESET}\n"
+_VERBOSE_ON = f"{Colors.GREEN}Verbose mode: ON{Colors.RESET}\n"
+_VERBOSE_OFF = f"{Colors.GREEN}Verbose mode: OFF{Colors.RESET}\n"
+_STREAMING_ON = f"{Colors.GREEN}Streaming mode: ON{Colors.RESET}\n"
+_STREAMING_OFF = f"{Colors.GREEN}Streaming mode: OFF{Colors.RESET}\n"
+_NO_HISTORY = f"{Colors.DIM}No conversation history yet.{Colors.RESET}\n"
+_HISTORY_HDR = f"\n{Colors.CYAN}📜 Conversation History:{Colors.RESET}"
+_HISTORY_ROW = f"  {Colors.DIM}[%d]{Colors.RESET} %s %s"
+_AI_TAG = f"{Colors.BRIGHT_GREEN}AI:{Colors.RESET}"
+_HISTORY_TAGS = {"user": f"{Colors.BRIGHT_BLUE}You:{Colors.RESET}", "assistant": _AI_TAG}
+_RESEARCH_USAGE = (
+    f"{Colors.RED}Usage: /research <topic>{Colors.RESET}\n"
+    f"{Colors.DIM}Example: /research AI agent frameworks{Colors.RESET}\n"
+)
+_RESEARCH_HDR = f"\n{Colors.BRIGHT_MAGENTA}{Colors.BOLD}🔬 Deep Research Mode{Colors.RESET}"
+_RESEARCH_RULE = f"{Colors.BRIGHT_GREEN}{'═' * 50}{Colors.RESET}"
+_RESEARCH_DONE = f"{Colors.BRIGHT_GREEN}{Colors.BOLD}📊 Research Complete{Colors.RESET}"
+_RESEARCH_TIMED_OUT = f"{Colors.RED}⏱️  Research timed out after %gs.{Colors.RESET}\n"
+_RESEARCH_CANCELLED = f"{Colors.YELLOW}Research cancelled.{Colors.RESET}\n"
+_SUMMARY_LABEL = f"{Colors.BOLD}Summary:{Colors.RESET}"
+_PROCESSING = f"\n{Colors.MAGENTA}🧠 Processing...{Colors.RESET}"
+_THINKING_PROCESS_HDR = f"\n{Colors.BRIGHT_MAGENTA}{Colors.BOLD}💭 Thinking Process:{Colors.RESET}"
+
+
+def _print_exc() -> None:
+    """Write the current exception's traceback to stderr in one write."""
+    sys.stderr.write(traceback.format_exc())
+    sys.stderr.flush()
+
+
+def print_history(roles: Iterable[str], contents: Iterable[str]) -> None:
+    """Print a numbered preview of the conversation with a single write."""
+    if not roles:
+        print(_NO_HISTORY)
+        return
+    tags = _HISTORY_TAGS
+    rows = [
+        _HISTORY_ROW
+        % (i, tags.get(role, _AI_TAG), content if len(content) <= 60 else content[:60] + "...")
+        for i, (role, content) in enumerate(zip(roles, contents), 1)
+    ]
+    _emit([_HISTORY_HDR, *rows, ""])
+
+
+class _AsyncLineReader:
+    """Read stdin lines without blocking the event loop.
+
+    ``input()`` runs on a daemon thread so gRPC streams and heartbeats keep
+    being serviced while the user types, and a read still blocked at exit
+    does not hold up interpreter shutdown. A read interrupted by Ctrl+C is
+    resumed by the next ``readline`` call rather than starting a second
+    concurrent reader.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Optional[asyncio.Future] = None
+
+    async def readline(self, prompt: str) -> str:
+        if self._pending is None or self._pending.done():
+            loop = asyncio.get_running_loop()
+            fut = loop.create_future()
+            threading.Thread(
+                target=self._read, args=(loop, fut, prompt), daemon=True, name="loom-chat-input"
+            ).start()
+            self._pending = fut
+        # Shield so cancelling the waiting task leaves the read in flight
+        return await asyncio.shield(self._pending)
+
+    @staticmethod
+    def _read(loop: asyncio.AbstractEventLoop, fut: asyncio.Future, prompt: str) -> None:
+        try:
+            line = input(prompt)
+        except BaseException as e:  # EOFError, KeyboardInterrupt, ...
+            loop.call_soon_threadsafe(_settle, fut, None, e)
+        else:
+            loop.call_soon_threadsafe(_settle, fut, line, None)
+
+
+def _settle(fut: asyncio.Future, result: Any, exc: Optional[BaseException]) -> None:
+    if fut.done():
+        return
+    if exc is not None:
+        fut.set_exception(exc)
+    else:
+        fut.set_result(result)
+
+
+# REPL slash commands. Each handler takes the session and the raw input line
+# and returns False to end the chat loop, True to keep reading input.
+
+
+async def _cmd_quit(session: ChatSession, user_input: str) -> bool:
+    print(_GOODBYE)
+    return False
+
+
+async def _cmd_clear(session: ChatSession, user_input: str) -> bool:
+    session.clear_history()
+    print(_CLEARED)
+    return True
+
+
+async def _cmd_help(session: ChatSession, user_input: str) -> bool:
+    print_help()
+    return True
+
+
+async def _cmd_verbose(session: ChatSession, user_input: str) -> bool:
+    session.verbose = not session.verbose
+    print(_VERBOSE_ON if session.verbose else _VERBOSE_OFF)
+    return True
+
+
+async def _cmd_history(session: ChatSession, user_input: str) -> bool:
+    print_history(session._roles, session._contents)
+    return True
+
+
+async def _cmd_stream(session: ChatSession, user_input: str) -> bool:
+    session.streaming = not session.streaming
+    print(_STREAMING_ON if session.streaming else _STREAMING_OFF)
+    return True
+
+
+def _cancel_on_sigint(task: asyncio.Task) -> Callable[[], None]:
+    """Route SIGINT to ``task.cancel()`` until the returned restore() is called."""
+    loop = asyncio.get_running_loop()
+    previous = signal.getsignal(signal.SIGINT)
+    try:
+        loop.add_signal_handler(signal.SIGINT, task.cancel)
+    except (NotImplementedError, RuntimeError, ValueError):
+        # No loop signal support (e.g. Windows or not the main thread)
+        return lambda: None
+
+    def restore() -> None:
+        loop.remove_signal_handler(signal.SIGINT)
+        # remove_signal_handler resets to the default handler; put back
+        # whatever was there (e.g. asyncio.run's cancel-main-task handler)
+        signal.signal(signal.SIGINT, previous)
+
+    return restore
+
+
+async def _cmd_research(session: ChatSession, user_input: str) -> bool:
+    # Extract topic from command
+    parts = user_input.split(maxsplit=1)
+    if len(parts) < 2:
+        print(_RESEARCH_USAGE)
+        return True
+
+    topic = parts[1].strip()
+    _emit(
+        [
+            _RESEARCH_HDR,
+            f"{Colors.DIM}Topic: {topic}{Colors.RESET}",
+            _divider(),
+        ]
+    )
+
+    write, flush = sys.stdout.write, sys.stdout.flush
+
+    def progress_callback(msg: str) -> None:
+        write(f"{Colors.CYAN}{msg}{Colors.RESET}\n")
+        flush()
+
+    # Run research as its own task so Ctrl+C (or the time budget) cancels
+    # just the research and returns to the prompt
+    timeout = session.research_timeout
+    task = asyncio.create_task(session.research(topic, on_progress=progress_callback))
+    restore_sigint = _cancel_on_sigint(task)
+    try:
+        result = await asyncio.wait_for(task, timeout=timeout)
+        lines = ["", _RESEARCH_RULE, _RESEARCH_DONE, ""]
+        if result.get("report_path"):
+            lines.append(f"{Colors.GREEN}📄 Report saved: {result['report_path']}{Colors.RESET}")
+        lines += [
+            f"{Colors.DIM}Total iterations: {result['iterations']}{Colors.RESET}",
+            "",
+            _SUMMARY_LABEL,
+            result["summary"],
+            _RESEARCH_RULE + "\n",
+        ]
+        _emit(lines)
+    except asyncio.TimeoutError:
+        print(_RESEARCH_TIMED_OUT % timeout)
+    except asyncio.CancelledError:
+        current = asyncio.current_task()
+        if current is not None and current.cancelling():
+            raise
+        print(_RESEARCH_CANCELLED)
+    except Exception as e:
+        print(f"{Colors.RED}❌ Research failed: {e}{Colors.RESET}\n")
+        _print_exc()
+    finally:
+        restore_sigint()
+    return True
+
+
+_COMMANDS = {
+    "/quit": _cmd_quit,
+    "/exit": _cmd_quit,
+    "/q": _cmd_quit,
+    "/clear": _cmd_clear,
+    "/help": _cmd_help,
+    "/verbose": _cmd_verbose,
+    "/history": _cmd_history,
+    "/stream": _cmd_stream,
+    "/research": _cmd_research,
+}
+
+
+async def run_chat_cli(bridge_addr: Optional[str] = None, agent_id: str = "chat-assistant") -> int:
     """Run interactive CLI chat."""
     print_header()
 
@@ -691,168 +1200,91 @@ async def run_chat_cli(bridge_addr: Optional[str] = None, agent_id: str = "chat-
         print(f"{Colors.DIM}Make sure Loom runtime is running (loom run or loom up){Colors.RESET}")
         return 1
 
+    reader = _AsyncLineReader()
+
     try:
         while True:
             try:
-                user_input = input(f"{Colors.BRIGHT_BLUE}{Colors.BOLD}You ▶{Colors.RESET} ").strip()
+                user_input = (await reader.readline(_YOU_PROMPT)).strip()
             except EOFError:
                 break
-            except KeyboardInterrupt:
-                print(f"\n{Colors.YELLOW}Use /quit to exit{Colors.RESET}")
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                # asyncio.run turns the first Ctrl+C into a task cancellation
+                task = asyncio.current_task()
+                if task is not None and task.cancelling():
+                    task.uncancel()
+                print(_USE_QUIT_HINT)
                 continue
 
             if not user_input:
                 continue
 
             # Handle commands
-            if user_input.startswith("/"):
-                cmd = user_input.lower().split()[0]
-
-                if cmd in ["/quit", "/exit", "/q"]:
-                    print(f"\n{Colors.CYAN}Goodbye! 👋{Colors.RESET}\n")
-                    break
-
-                if cmd == "/clear":
-                    session.clear_history()
-                    print(f"{Colors.GREEN}✅ Conversation cleared.{Colors.RESET}\n")
-                    continue
-
-                if cmd == "/help":
-                    print_help()
-                    continue
-
-                if cmd == "/verbose":
-                    session.verbose = not session.verbose
-                    state = "ON" if session.verbose else "OFF"
-                    print(f"{Colors.GREEN}Verbose mode: {state}{Colors.RESET}\n")
-                    continue
-
-                if cmd == "/history":
-                    if not session.conversation_history:
-                        print(f"{Colors.DIM}No conversation history yet.{Colors.RESET}\n")
-                    else:
-                        print(f"\n{Colors.CYAN}📜 Conversation History:{Colors.RESET}")
-                        for i, msg in enumerate(session.conversation_history):
-                            role_color = (
-                                Colors.BRIGHT_BLUE if msg["role"] == "user" else Colors.BRIGHT_GREEN
-                            )
-                            role = "You" if msg["role"] == "user" else "AI"
-                            content = (
-                                msg["content"][:60] + "..."
-                                if len(msg["content"]) > 60
-                                else msg["content"]
-                            )
-                            print(
-                                f"  {Colors.DIM}[{i+1}]{Colors.RESET} "
-                                f"{role_color}{role}:{Colors.RESET} {content}"
-                            )
-                        print()
-                    continue
-
-                if cmd == "/stream":
-                    session.streaming = not session.streaming
-                    state = "ON" if session.streaming else "OFF"
-                    print(f"{Colors.GREEN}Streaming mode: {state}{Colors.RESET}\n")
-                    continue
-
-                if cmd == "/research":
-                    # Extract topic from command
-                    parts = user_input.split(maxsplit=1)
-                    if len(parts) < 2:
-                        print(f"{Colors.RED}Usage: /research <topic>{Colors.RESET}")
-                        print(f"{Colors.DIM}Example: /research AI agent frameworks{Colors.RESET}\n")
-                        continue
-
-                    topic = parts[1].strip()
+            if user_input[:1] == "/":
+                cmd = user_input.split(maxsplit=1)[0].lower()
+                handler = _COMMANDS.get(cmd)
+                if handler is None:
                     print(
-                        f"\n{Colors.BRIGHT_MAGENTA}{Colors.BOLD}🔬 Deep Research Mode{Colors.RESET}"
+                        f"{Colors.RED}Unknown command: {cmd}. "
+                        f"Type /help for available commands.{Colors.RESET}\n"
                     )
-                    print(f"{Colors.DIM}Topic: {topic}{Colors.RESET}")
-                    print_divider()
-
-                    def progress_callback(msg: str):
-                        print(f"{Colors.CYAN}{msg}{Colors.RESET}")
-
-                    try:
-                        result = await session.research(topic, on_progress=progress_callback)
-                        print()
-                        print(f"{Colors.BRIGHT_GREEN}{'═' * 50}{Colors.RESET}")
-                        print(
-                            f"{Colors.BRIGHT_GREEN}{Colors.BOLD}📊 Research Complete{Colors.RESET}"
-                        )
-                        print()
-                        if result.get("report_path"):
-                            print(
-                                f"{Colors.GREEN}📄 Report saved: {result['report_path']}{Colors.RESET}"
-                            )
-                        print(f"{Colors.DIM}Total iterations: {result['iterations']}{Colors.RESET}")
-                        print()
-                        print(f"{Colors.BOLD}Summary:{Colors.RESET}")
-                        print(result["summary"])
-                        print(f"{Colors.BRIGHT_GREEN}{'═' * 50}{Colors.RESET}\n")
-                    except Exception as e:
-                        print(f"{Colors.RED}❌ Research failed: {e}{Colors.RESET}\n")
-                        import traceback
-
-                        traceback.print_exc()
-                    continue
-
-                print(
-                    f"{Colors.RED}Unknown command: {cmd}. "
-                    f"Type /help for available commands.{Colors.RESET}\n"
-                )
+                elif not await handler(session, user_input):
+                    break
                 continue
 
             # Process message
             try:
+                # Measure once per turn and thread it through every renderer
+                width = _render_width()
                 if session.streaming:
                     # Streaming mode - show LLM output in real-time
                     print_streaming_header()
 
-                    # Callback to print chunks directly
-                    def on_chunk(chunk: str):
-                        print(f"{Colors.DIM}{chunk}{Colors.RESET}", end="", flush=True)
+                    # Coalesce token chunks into few writes (newline or ~30ms)
+                    on_chunk = make_stream_writer(prefix=_DIM, suffix=_RESET)
 
                     # Callback when a step completes
-                    def on_step(step):
-                        print_stream_step_complete(step)
+                    def on_step(
+                        step: ThoughtStep, width: int = width, on_chunk: StreamWriter = on_chunk
+                    ) -> None:
+                        on_chunk.flush()
+                        print_stream_step_complete(step, width)
 
-                    result = await session.chat_stream(
-                        user_input,
-                        on_chunk=on_chunk,
-                        on_step=on_step,
-                    )
+                    try:
+                        result = await session.chat_stream(
+                            user_input,
+                            on_chunk=on_chunk,
+                            on_step=on_step,
+                        )
+                    finally:
+                        on_chunk.flush()
 
                     # Show final result (without repeating thinking if shown during streaming)
                     print()  # Newline after streaming content
-                    print_result(result)
+                    print_result(result, width)
                     print()
                 else:
                     # Non-streaming mode - wait for complete response
-                    print(f"\n{Colors.MAGENTA}🧠 Processing...{Colors.RESET}")
+                    print(_PROCESSING)
                     result = await session.chat(user_input)
 
                     # Show reasoning steps if verbose mode
                     if session.verbose and result.get("steps"):
-                        print(
-                            f"\n{Colors.BRIGHT_MAGENTA}{Colors.BOLD}💭 Thinking Process:{Colors.RESET}"
-                        )
+                        print(_THINKING_PROCESS_HDR)
                         for i, step in enumerate(result["steps"], 1):
-                            print_thinking_step(step, i)
+                            print_thinking_step(step, i, width)
 
                     # Show final result
-                    print_result(result)
+                    print_result(result, width)
                     print()
 
             except Exception as e:
                 print(f"{Colors.RED}❌ Error: {e}{Colors.RESET}")
-                import traceback
-
-                traceback.print_exc()
+                _print_exc()
                 print()
 
     except KeyboardInterrupt:
-        print(f"\n{Colors.CYAN}Goodbye! 👋{Colors.RESET}\n")
+        print(_GOODBYE)
     finally:
         await session.stop()
 
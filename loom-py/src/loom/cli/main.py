@@ -1,47 +1,154 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
-import shutil
-import signal
-import socket
-import subprocess
 import sys
 from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, Optional, TypeAlias
 
 
 def _pick_free_port() -> int:
-    s = socket.socket()
-    s.bind(("127.0.0.1", 0))
-    addr, port = s.getsockname()
-    s.close()
-    return port
+    """Return a currently free localhost TCP port.
 
+    The probe socket is close-on-exec so it never leaks into spawned
+    children, and sets SO_REUSEADDR (plus SO_REUSEPORT where available) so
+    it leaves no lingering state blocking the real server. The server that
+    binds the port must also set SO_REUSEADDR (and SO_REUSEPORT, which only
+    helps when set on both sockets).
+    """
+    import socket
+
+    sock_type = socket.SOCK_STREAM | getattr(socket, "SOCK_CLOEXEC", 0)
+    with socket.socket(socket.AF_INET, sock_type) as s:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            try:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except OSError:
+                pass
+        s.bind(("127.0.0.1", 0))
+        port: int = s.getsockname()[1]
+        return port
+
+
+def _which_cache_path() -> Path:
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("loom", "loom-os")) / "which.json"
+
+
+def _path_mtimes(path_env: str) -> list[Optional[int]]:
+    """Modification times (ns) of each PATH entry; None for missing entries."""
+    mtimes: list[Optional[int]] = []
+    for entry in path_env.split(os.pathsep):
+        try:
+            mtimes.append(os.stat(entry or ".").st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return mtimes
+
+
+@functools.lru_cache(maxsize=1)
+def _find_cargo(path_env: str) -> Optional[str]:
+    """Resolve ``cargo`` on ``path_env``, persisting hits across invocations.
+
+    ``shutil.which`` probes every PATH entry, which is slow on long or
+    network-mounted PATHs. Hits are stored per PATH hash in the user cache
+    dir together with the PATH directories' mtimes, and reused only while
+    those mtimes are unchanged and the recorded binary is still executable,
+    so a cargo newly installed earlier on PATH takes over. Misses are never
+    persisted so a later Rust install is picked up.
+    """
+    import hashlib
+    import json
+    import shutil
+
+    key = hashlib.sha1(path_env.encode("utf-8")).hexdigest()
+    cache_file = _which_cache_path()
+    try:
+        entries = json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        entries = {}
+    if not isinstance(entries, dict):
+        entries = {}
+
+    mtimes = _path_mtimes(path_env)
+    cached = entries.get(key)
+    if (
+        isinstance(cached, dict)
+        and cached.get("mtimes") == mtimes
+        and isinstance(path := cached.get("path"), str)
+        and os.access(path, os.X_OK)
+    ):
+        return path
+
+    resolved = shutil.which("cargo", path=path_env)
+    if resolved:
+        entries[key] = {"path": resolved, "mtimes": mtimes}
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(entries), encoding="utf-8")
+        except OSError:
+            pass
+    return resolved
 
-def cmd_proto(args):
+
+def _write_status(lines: list[str]) -> None:
+    """Emit buffered status lines with a single write and flush."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
+
+def cmd_proto(args: argparse.Namespace) -> None:
     """Generate gRPC stubs into proto/generated/ (dev workflow)."""
     from ..bridge.proto import generate  # type: ignore
 
     generate.main()
 
 
-def cmd_dev(args):
+def cmd_dev(args: argparse.Namespace) -> None:
     """Start the bridge server locally via cargo and export LOOM_BRIDGE_ADDR."""
-    cargo = shutil.which("cargo")
+    import signal
+    import subprocess
+
+    cargo = _find_cargo(os.environ.get("PATH", os.defpath))
     port = args.port or _pick_free_port()
     addr = f"127.0.0.1:{port}"
-    env = os.environ.copy()
-    env["LOOM_BRIDGE_ADDR"] = addr
-    print(f"[loom] Starting loom-bridge at {addr} ...")
+    env = os.environ | {"LOOM_BRIDGE_ADDR": addr}
+    msgs = [f"[loom] Starting loom-bridge at {addr} ..."]
     if not cargo:
-        print("[loom] 'cargo' not found. Please start the bridge server manually or install Rust.")
-        print("      cargo run -p loom-bridge --bin loom-bridge-server")
+        msgs.append(
+            "[loom] 'cargo' not found. Please start the bridge server manually or install Rust."
+        )
+        msgs.append("      cargo run -p loom-bridge --bin loom-bridge-server")
+        _write_status(msgs)
         sys.exit(2)
-    proc = subprocess.Popen(
-        [cargo, "run", "-p", "loom-bridge", "--bin", "loom-bridge-server"],
-        env=env,
-    )
-    print("[loom] Press Ctrl+C to stop.")
+    cmd = [cargo, "run", "-p", "loom-bridge", "--bin", "loom-bridge-server"]
+    if args.background:
+        if hasattr(os, "posix_spawnp"):
+            # posix_spawn avoids fork()ing (and copying page tables of) this
+            # interpreter just to exec cargo in a new session.
+            pid = os.posix_spawnp(cargo, cmd, env, setsid=True)
+        else:
+            pid = subprocess.Popen(cmd, env=env, start_new_session=True).pid
+        msgs.append(f"[loom] loom-bridge running in background (PID {pid})")
+        _write_status(msgs)
+        return
+
+    if os.name == "posix":
+        # Replace this interpreter with cargo: no supervising Python process,
+        # and Ctrl+C reaches cargo directly.
+        msgs.append("[loom] Press Ctrl+C to stop.")
+        _write_status(msgs)
+        os.execvpe(cargo, cmd, env)
+
+    proc = subprocess.Popen(cmd, env=env)
+    msgs.append("[loom] Press Ctrl+C to stop.")
+    _write_status(msgs)
     try:
         proc.wait()
     except KeyboardInterrupt:
@@ -74,16 +181,20 @@ topics = ["topic.hello"]
 # future options: managed_endpoint = "bridge.loomcloud.dev:443"
 """.strip()
 
+# Templates are constant; encode once instead of on every `loom init`
+_TEMPLATE_AGENT_BYTES = TEMPLATE_AGENT.encode("utf-8")
+_TEMPLATE_CONFIG_BYTES = TEMPLATE_CONFIG.encode("utf-8")
+
 
-def cmd_init(args):
+def cmd_init(args: argparse.Namespace) -> None:
     target = Path(args.path).resolve()
     target.mkdir(parents=True, exist_ok=True)
-    (target / "agent.py").write_text(TEMPLATE_AGENT)
-    (target / "loom.toml").write_text(TEMPLATE_CONFIG)
+    (target / "agent.py").write_bytes(_TEMPLATE_AGENT_BYTES)
+    (target / "loom.toml").write_bytes(_TEMPLATE_CONFIG_BYTES)
     print(f"[loom] Initialized project at {target}")
 
 
-def cmd_run(args):
+def cmd_run(args: argparse.Namespace) -> None:
     """Run a Loom project (orchestrate runtime + agents).
 
     If no arguments provided, discovers project configuration and agents.
@@ -96,35 +207,51 @@ def cmd_run(args):
 
     # If a script is provided and it's a file, just execute it directly (legacy behavior)
     if args.script and Path(args.script).exists() and Path(args.script).is_file():
+        import runpy
+
         print(f"[loom] Running script: {args.script}")
-        os.execv(sys.executable, [sys.executable, args.script])
+        # Run in-process instead of re-exec'ing a fresh interpreter; mirror
+        # `python script.py` by exposing argv and the script's directory.
+        script = str(Path(args.script).resolve())
+        sys.argv = [args.script]
+        sys.path.insert(0, os.path.dirname(script))
+        runpy.run_path(script, run_name="__main__")
         return
 
     # Otherwise, orchestrate a full project
     project_dir = Path(args.script) if args.script else Path.cwd()
-    if not project_dir.exists():
+    try:
+        # One directory scan answers every discovery question below; DirEntry
+        # type checks use the cached d_type instead of a stat per path.
+        with os.scandir(project_dir) as it:
+            entries = {e.name: e for e in it}
+    except (FileNotFoundError, NotADirectoryError):
         print(f"[loom] Project directory not found: {project_dir}")
         sys.exit(1)
 
     # Discover agent scripts
+    msgs: list[str] = []
     agent_scripts = []
-    agents_dir = project_dir / "agents"
-    if agents_dir.exists() and agents_dir.is_dir():
-        agent_scripts = sorted(agents_dir.glob("*.py"))
+    agents_entry = entries.get("agents")
+    if agents_entry is not None and agents_entry.is_dir():
+        with os.scandir(agents_entry.path) as it:
+            agent_scripts = sorted(
+                Path(e.path) for e in it if e.name.endswith(".py") and e.is_file()
+            )
         if agent_scripts:
-            print(f"[loom] Discovered {len(agent_scripts)} agent scripts in agents/")
+            msgs.append(f"[loom] Discovered {len(agent_scripts)} agent scripts in agents/")
 
     # Check for main.py or run.py
     for entry_point in ["main.py", "run.py", "app.py"]:
-        entry_file = project_dir / entry_point
-        if entry_file.exists():
-            agent_scripts.append(entry_file)
-            print(f"[loom] Found entry point: {entry_point}")
+        if entry_point in entries:
+            agent_scripts.append(project_dir / entry_point)
+            msgs.append(f"[loom] Found entry point: {entry_point}")
             break
 
     if not agent_scripts:
-        print("[loom] Warning: No agent scripts found")
-        print("[loom]   Looking for: agents/*.py, main.py, run.py, or app.py")
+        msgs.append("[loom] Warning: No agent scripts found")
+        msgs.append("[loom]   Looking for: agents/*.py, main.py, run.py, or app.py")
+    _write_status(msgs)
 
     # Setup orchestrator config
     logs_dir = project_dir / "logs" if args.logs else None
@@ -142,83 +269,175 @@ def cmd_run(args):
         force_download=args.force_download,
     )
 
-    # Run orchestrator
-    asyncio.run(run_orchestrator(config))
+    # Run orchestrator; prefer uvloop (optional `loom[uvloop]` extra) since the
+    # supervisor spends its life shuttling agent subprocess pipes.
+    try:
+        import uvloop  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        asyncio.run(run_orchestrator(config))
+    else:
+        uvloop.run(run_orchestrator(config))
 
 
 def _load_project_config(start: Path) -> dict:
-    """Load loom.toml using tomllib (py>=3.11) or tomli; return {} if missing/invalid."""
-    cfg_path = start / "loom.toml"
-    if not cfg_path.exists():
-        return {}
-    if sys.version_info >= (3, 11):
-        import tomllib as toml  # type: ignore
-    else:
-        try:
-            import tomli as toml  # type: ignore
-        except Exception:
-            return {}
+    """Load loom.toml with tomllib; return {} if missing/invalid.
+
+    Parses go through runtime.config's cache and are reused until the file's
+    mtime or size changes. Callers must treat the returned dict as read-only.
+    """
+    from ..runtime.config import _read_toml
+
     try:
-        return toml.loads(cfg_path.read_text(encoding="utf-8"))
-    except Exception:
+        return _read_toml(start / "loom.toml")
+    except (OSError, ValueError):  # TOMLDecodeError / bad UTF-8 are ValueErrors
         return {}
 
 
-def _toml_format_value(v):
+# Basic-string escapes applied in a single pass by str.translate
+_TOML_ESC = str.maketrans(
+    {
+        "\\": "\\\\",
+        '"': '\\"',
+        "\n": "\\n",
+        "\r": "\\r",
+        "\t": "\\t",
+        "\b": "\\b",
+        "\f": "\\f",
+    }
+)
+
+
+def _toml_fmt_bool(v: bool) -> str:
+    return "true" if v else "false"
+
+
+def _toml_fmt_str(v: str) -> str:
+    return '"' + v.translate(_TOML_ESC) + '"'
+
+
+def _toml_fmt_array(v: Iterable[Any]) -> str:
+    return "[" + ", ".join(_toml_format_value(x) for x in v) + "]"
+
+
+# Exact-type dispatch: one dict lookup per value, and bool never falls into
+# the int handler because type(True) is bool.
+_TOML_FMT: dict[type, Callable[[Any], str]] = {
+    bool: _toml_fmt_bool,
+    int: str,
+    float: str,
+    str: _toml_fmt_str,
+    list: _toml_fmt_array,
+    tuple: _toml_fmt_array,
+}
+
+
+def _toml_format_value(v: Any) -> str:
     """Minimal TOML value formatter for strings, numbers, bools, and simple lists."""
+    fmt = _TOML_FMT.get(type(v))
+    if fmt is not None:
+        return fmt(v)
+    # Subclasses (enums, str/int subclasses, ...) take the slow path
     if isinstance(v, bool):
-        return "true" if v else "false"
+        return _toml_fmt_bool(v)
     if isinstance(v, (int, float)):
         return str(v)
     if isinstance(v, str):
-        esc = v.replace("\\", "\\\\").replace('"', '\\"')
-        return f'"{esc}"'
+        return _toml_fmt_str(v)
     if isinstance(v, (list, tuple)):
-        return "[" + ", ".join(_toml_format_value(x) for x in v) + "]"
+        return _toml_fmt_array(v)
     return f'"{str(v)}"'
 
 
+def _item_key(item: tuple[str, Any]) -> str:
+    return item[0]
+
+
 def _toml_dumps_minimal(cfg: dict) -> str:
     """Dump a minimal TOML supporting top-level keys and one-level tables."""
-    lines: list[str] = []
-    # top-level keys
-    for k in sorted(cfg.keys()):
-        v = cfg[k]
-        if not isinstance(v, dict):
-            lines.append(f"{k} = {_toml_format_value(v)}")
+    # Partition in one pass, then sort each group once for deterministic output
+    scalars: list[tuple[str, Any]] = []
+    tables: list[tuple[str, Any]] = []
+    for k, v in cfg.items():
+        (tables if isinstance(v, dict) else scalars).append((k, v))
+    scalars.sort(key=_item_key)
+    tables.sort(key=_item_key)
+
+    lines = [f"{k} = {_toml_format_value(v)}" for k, v in scalars]
     if lines:
         lines.append("")
-    # tables
-    for k in sorted(cfg.keys()):
-        v = cfg[k]
-        if isinstance(v, dict):
-            lines.append(f"[{k}]")
-            for sk in sorted(v.keys()):
-                sv = v[sk]
-                lines.append(f"{sk} = {_toml_format_value(sv)}")
-            lines.append("")
-    while lines and lines[-1] == "":
-        lines.pop()
-    return "\n".join(lines) + "\n"
-
-
-def _write_project_bridge(start: Path, address: str, mode: str, version: str):
+    for k, v in tables:
+        lines.append(f"[{k}]")
+        lines.extend(f"{sk} = {_toml_format_value(sv)}" for sk, sv in sorted(v.items()))
+        lines.append("")
+    # Values are escaped, so the only trailing newlines are the table separators
+    return "\n".join(lines).rstrip("\n") + "\n"
+
+
+@functools.lru_cache(maxsize=1)
+def _toml_writer() -> Optional[ModuleType]:
+    """Return the tomli_w module, or None if it is not installed.
+
+    Resolved lazily (and only once) so commands that never write TOML,
+    including ``loom --help``, do not pay for the import.
+    """
+    try:
+        import tomli_w
+    except ImportError:
+        return None
+    return tomli_w
+
+
+def _toml_dumps(cfg: dict) -> str:
+    """Serialize config with tomli_w, falling back to the minimal writer."""
+    writer = _toml_writer()
+    if writer is None:
+        return _toml_dumps_minimal(cfg)
+    text: str = writer.dumps(cfg)
+    return text
+
+
+def _write_project_bridge(start: Path, address: str, mode: str, version: str) -> None:
     """Merge bridge config while preserving existing keys."""
-    existing = _load_project_config(start)
-    bridge = existing.get("bridge") or {}
-    bridge.update({"address": address, "mode": mode, "version": version})
-    existing["bridge"] = bridge
-    (start / "loom.toml").write_text(_toml_dumps_minimal(existing), encoding="utf-8")
+    from ..runtime.config import _forget_toml
 
+    cfg_path = start / "loom.toml"
+    if not cfg_path.exists():
+        # Fresh project: nothing to merge, so skip the parse/dump round-trip
+        doc = (
+            "[bridge]\n"
+            f"address = {_toml_fmt_str(address)}\n"
+            f"mode = {_toml_fmt_str(mode)}\n"
+            f"version = {_toml_fmt_str(version)}\n"
+        )
+        try:
+            with open(cfg_path, "xb") as f:
+                f.write(doc.encode("utf-8"))
+            return
+        except FileExistsError:
+            pass  # created concurrently; fall through to the merge path
 
-def cmd_up(args):
+    existing = _load_project_config(start)
+    # Build a new mapping: the loaded config is shared with the parse cache
+    bridge = {
+        **(existing.get("bridge") or {}),
+        "address": address,
+        "mode": mode,
+        "version": version,
+    }
+    cfg_path.write_text(_toml_dumps({**existing, "bridge": bridge}), encoding="utf-8")
+    _forget_toml(cfg_path)
+
+
+def cmd_up(args: argparse.Namespace) -> None:
     """Start (or reuse) embedded runtime and export LOOM_BRIDGE_ADDR.
 
     Modes:
     - bridge-only: Start only the gRPC bridge server
     - full: Start full Loom Core with Dashboard + Bridge
     """
-    from . import embedded
+    import subprocess
+
+    from ..runtime import embedded
 
     version = args.version
     mode = args.mode
@@ -235,8 +454,10 @@ def cmd_up(args):
             prefer_release=prefer_release,
             force_download=force_download,
         )
-        print(f"[loom] Bridge server started PID={proc.pid} at {bridge_addr}")
-        print(f"[loom] Python agents can connect via LOOM_BRIDGE_ADDR={bridge_addr}")
+        msgs = [
+            f"[loom] Bridge server started PID={proc.pid} at {bridge_addr}",
+            f"[loom] Python agents can connect via LOOM_BRIDGE_ADDR={bridge_addr}",
+        ]
     else:  # full mode
         dashboard_port = args.dashboard_port or 3030
         proc = embedded.start_core(
@@ -246,15 +467,18 @@ def cmd_up(args):
             prefer_release=prefer_release,
             force_download=force_download,
         )
-        print(f"[loom] Loom Core started PID={proc.pid}")
-        print(f"[loom] Bridge: {bridge_addr}")
-        print(f"[loom] Dashboard: http://localhost:{dashboard_port}")
+        msgs = [
+            f"[loom] Loom Core started PID={proc.pid}",
+            f"[loom] Bridge: {bridge_addr}",
+            f"[loom] Dashboard: http://localhost:{dashboard_port}",
+        ]
 
     os.environ["LOOM_BRIDGE_ADDR"] = bridge_addr
     _write_project_bridge(Path("."), bridge_addr, mode, version)
 
     # Keep process alive
-    print("[loom] Press Ctrl+C to stop.")
+    msgs.append("[loom] Press Ctrl+C to stop.")
+    _write_status(msgs)
     try:
         proc.wait()
     except KeyboardInterrupt:
@@ -265,7 +489,7 @@ def cmd_up(args):
             proc.kill()
 
 
-def cmd_down(args):
+def cmd_down(args: argparse.Namespace) -> None:
     """Shutdown all Loom processes (bridge, core, dashboard, agents)."""
     try:
         import psutil
@@ -321,7 +545,7 @@ def cmd_down(args):
         print(f"[loom] Shutdown complete ({killed_count} processes killed)")
 
 
-def cmd_chat(args):
+def cmd_chat(args: argparse.Namespace) -> None:
     """Start interactive chat with a cognitive agent."""
     import asyncio
 
@@ -338,29 +562,37 @@ def cmd_chat(args):
         sys.exit(0)
 
 
-def main():
-    p = argparse.ArgumentParser(prog="loom", description="Loom Python SDK CLI")
-    sub = p.add_subparsers(dest="cmd", required=True)
+# The object add_subparsers() returns, passed to each _add_* builder
+_SubParsers: TypeAlias = "argparse._SubParsersAction[argparse.ArgumentParser]"
 
+
+def _add_proto(sub: _SubParsers) -> None:
     sp = sub.add_parser("proto", help="Generate Python gRPC stubs into proto/generated/")
     sp.set_defaults(func=cmd_proto)
 
+
+def _add_dev(sub: _SubParsers) -> None:
     sd = sub.add_parser("dev", help="Start local Loom bridge server (requires cargo)")
     sd.add_argument("--port", type=int, default=None)
+    sd.add_argument(
+        "--background",
+        action="store_true",
+        help="Start the bridge detached and return instead of handing the terminal to cargo",
+    )
     sd.set_defaults(func=cmd_dev)
 
-    si = sub.add_parser("init", help="Create a new Loom agent project in PATH (default .)")
+
+def _add_init(sub: _SubParsers) -> None:
+    si = sub.add_parser(
+        "init",
+        aliases=["new", "create"],
+        help="Create a new Loom agent project in PATH (default .)",
+    )
     si.add_argument("path", nargs="?", default=".")
     si.set_defaults(func=cmd_init)
 
-    sn = sub.add_parser("new", help="Alias for 'init'")
-    sn.add_argument("path", nargs="?", default=".")
-    sn.set_defaults(func=cmd_init)
-
-    sc = sub.add_parser("create", help="Alias for 'init'")
-    sc.add_argument("path", nargs="?", default=".")
-    sc.set_defaults(func=cmd_init)
 
+def _add_run(sub: _SubParsers) -> None:
     sr = sub.add_parser(
         "run",
         help="Run a Loom project (orchestrate runtime + agents) or execute a single script",
@@ -391,6 +623,8 @@ def main():
     )
     sr.set_defaults(func=cmd_run)
 
+
+def _add_up(sub: _SubParsers) -> None:
     su = sub.add_parser("up", help="Start embedded runtime (bridge or full core with dashboard)")
     su.add_argument("--version", default="latest", help="Runtime version (default: latest)")
     su.add_argument(
@@ -415,9 +649,13 @@ def main():
     )
     su.set_defaults(func=cmd_up)
 
+
+def _add_down(sub: _SubParsers) -> None:
     sdown = sub.add_parser("down", help="Shutdown all Loom processes (runtime + agents)")
     sdown.set_defaults(func=cmd_down)
 
+
+def _add_chat(sub: _SubParsers) -> None:
     schat = sub.add_parser("chat", help="Start interactive chat with a cognitive agent")
     schat.add_argument(
         "--address",
@@ -433,7 +671,45 @@ def main():
     )
     schat.set_defaults(func=cmd_chat)
 
-    args = p.parse_args()
+
+# Subcommand name -> parser builder, in the order shown by `loom --help`
+_SUBCOMMANDS = {
+    "proto": _add_proto,
+    "dev": _add_dev,
+    "init": _add_init,
+    "run": _add_run,
+    "up": _add_up,
+    "down": _add_down,
+    "chat": _add_chat,
+}
+
+# Aliases registered through argparse's aliases= on their canonical parser
+_ALIASES = {"new": "init", "create": "init"}
+
+
+def build_parser(argv: Optional[list[str]] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    When ``argv`` names a known subcommand only that subparser is built; help,
+    missing or unknown commands get the full parser so usage output and
+    errors list every command.
+    """
+    p = argparse.ArgumentParser(prog="loom", description="Loom Python SDK CLI")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    builder = _SUBCOMMANDS.get(_ALIASES.get(argv[0], argv[0])) if argv else None
+    if builder is not None:
+        builder(sub)
+    else:
+        for add in _SUBCOMMANDS.values():
+            add(sub)
+    return p
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+    args = build_parser(argv).parse_args(argv)
     args.func(args)
 
 
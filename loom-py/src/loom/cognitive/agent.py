@@ -45,6 +45,7 @@ from ..context import (
     create_default_registry,
 )
 from ..context.memory import WorkingMemory
+from ..llm.cache import SemanticLLMCache
 from .config import CognitiveConfig, ThinkingStrategy
 from .executor import ToolExecutor
 from .strategies import StrategyExecutor
@@ -93,6 +94,16 @@ class CognitiveAgent:
         self.config = config or CognitiveConfig()
         self.available_tools = available_tools or []
         self.memory = WorkingMemory()
+        self.llm_cache = (
+            SemanticLLMCache(
+                threshold=self.config.cache_similarity_threshold,
+                embed=self.config.cache_embed,
+            )
+            if self.config.cache_responses
+            else None
+        )
+        # Rolling share of ReAct iterations that called a tool or answered
+        self._accept_rate_ema = 1.0
 
         # Context Engineering components
         self.step_reducer = StepReducer()
@@ -125,6 +136,7 @@ class CognitiveAgent:
             step_compactor=self.step_compactor,
             available_tools=self.available_tools,
             tool_registry=self.tool_registry,
+            llm_cache=self.llm_cache,
         )
 
     def _auto_discover_tools(self) -> None:
@@ -147,6 +159,7 @@ class CognitiveAgent:
         self._auto_discover_tools()
         # Update strategy executor's tool list
         self.strategy_executor.available_tools = tools
+        self.strategy_executor.invalidate_system_prompt()
 
     def register_tool(
         self,
@@ -189,6 +202,23 @@ class CognitiveAgent:
         # Add to available tools if not already present
         if name not in self.available_tools:
             self.available_tools.append(name)
+        self.strategy_executor.invalidate_system_prompt()
+
+    def _iteration_cap(self) -> Optional[int]:
+        """ReAct iteration cap scaled by the acceptance rate, if adaptive."""
+        if not self.config.adaptive_iterations:
+            return None
+        scale = max(0.3, self._accept_rate_ema)
+        return max(2, int(self.config.max_iterations * scale))
+
+    def _record_acceptance(self, result: CognitiveResult) -> None:
+        """Fold a ReAct run's share of productive iterations into the EMA."""
+        if not result.iterations:
+            return
+        # Each reasoning-only iteration leaves exactly one step without a tool call
+        stalled = sum(1 for step in result.steps if step.tool_call is None)
+        rate = 1.0 - stalled / result.iterations
+        self._accept_rate_ema = 0.9 * self._accept_rate_ema + 0.1 * rate
 
     async def run(self, goal: str, context: Optional[list[str]] = None) -> CognitiveResult:
         """Execute the cognitive loop to achieve a goal.
@@ -211,19 +241,26 @@ class CognitiveAgent:
         ) as span:
             start_time = time.time()
 
-            # Add goal to memory
-            self.memory.add("user", goal)
+            if (
+                self.config.persist_memory
+                or self.config.thinking_strategy == ThinkingStrategy.REACT
+            ):
+                # Add goal to memory
+                self.memory.add("user", goal)
 
-            # Add context if provided
-            if context:
-                for ctx_item in context:
-                    self.memory.add("system", f"Context: {ctx_item}")
+                # Add context if provided
+                if context:
+                    for ctx_item in context:
+                        self.memory.add("system", f"Context: {ctx_item}")
 
             try:
                 if self.config.thinking_strategy == ThinkingStrategy.SINGLE_SHOT:
                     result = await self.strategy_executor.run_single_shot(goal)
                 elif self.config.thinking_strategy == ThinkingStrategy.REACT:
-                    result = await self.strategy_executor.run_react(goal)
+                    result = await self.strategy_executor.run_react(
+                        goal, max_iterations=self._iteration_cap()
+                    )
+                    self._record_acceptance(result)
                 else:  # ChainOfThought
                     result = await self.strategy_executor.run_cot(goal)
 
@@ -278,7 +315,11 @@ class CognitiveAgent:
                 "goal_length": len(goal),
             },
         ):
-            async for item in self.strategy_executor.run_react_stream(goal):
+            async for item in self.strategy_executor.run_react_stream(
+                goal, max_iterations=self._iteration_cap()
+            ):
+                if isinstance(item, CognitiveResult):
+                    self._record_acceptance(item)
                 yield item
 
 
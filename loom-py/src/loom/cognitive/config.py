@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional, Sequence
 
 
 class ThinkingStrategy(Enum):
@@ -36,6 +36,22 @@ class CognitiveConfig:
         max_tools_per_step: Maximum tool calls per iteration
         temperature: LLM temperature setting
         stop_on_final_answer: Whether to stop when "FINAL ANSWER" is detected
+        cache_responses: Reuse LLM responses for repeated single-shot/CoT goals
+        cache_similarity_threshold: Minimum prompt similarity for a cache hit
+            when cache_embed is set
+        cache_embed: Embedding function that lets the response cache match
+            paraphrased goals too (default: exact goals only)
+        stream_react: Stream ReAct responses in run() too, so decoding stops as
+            soon as the rest of a response would be discarded
+        react_samples: Candidate responses sampled per ReAct step in run() when
+            the LLM supports generate_candidates; the first one that answers
+            or calls an available tool is used
+        max_stalled_iterations: Stop ReAct after this many consecutive responses
+            with neither a tool call nor a final answer (0, the default, disables)
+        adaptive_iterations: Lower the ReAct iteration cap, down to 30% of
+            max_iterations, for agents whose responses often make no progress
+        persist_memory: Record goals, context and answers of single-shot and CoT
+            runs in working memory (ReAct runs always do)
     """
 
     system_prompt: Optional[str] = None
@@ -44,6 +60,14 @@ class CognitiveConfig:
     max_tools_per_step: int = 3
     temperature: float = 0.7
     stop_on_final_answer: bool = True
+    cache_responses: bool = False
+    cache_similarity_threshold: float = 0.85
+    cache_embed: Optional[Callable[[str], Sequence[float]]] = None
+    stream_react: bool = False
+    react_samples: int = 1
+    max_stalled_iterations: int = 0
+    adaptive_iterations: bool = False
+    persist_memory: bool = True
 
 
 __all__ = [
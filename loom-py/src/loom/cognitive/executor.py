@@ -33,6 +33,32 @@ TOOLS_REQUIRING_APPROVAL = {
     "fs:delete",  # Can delete files
 }
 
+# Tool namespaces whose calls touch shared state (files, processes); they run
+# one at a time, in the order the model issued them
+_ORDERED_TOOL_PREFIXES = ("fs:", "system:")
+
+# Maximum characters of tool output shown to the LLM in an Observation
+_OBSERVATION_MAX_CHARS = 2000
+
+
+def _format_json(result: str | bytes) -> str:
+    """Re-serialize a JSON tool result for the observation.
+
+    Results that fit the observation budget are indented for readability.
+    Larger ones are emitted compact, since indentation would spend a large
+    share of the truncated observation on whitespace.
+
+    Raises:
+        ValueError: If the result is not valid JSON
+    """
+    indent = len(result) <= _OBSERVATION_MAX_CHARS
+    if isinstance(result, bytes):
+        result = result.decode("utf-8")
+    parsed = json.loads(result)
+    if indent:
+        return json.dumps(parsed, indent=2)
+    return json.dumps(parsed, separators=(",", ":"))
+
 
 class ToolExecutor:
     """Handles tool execution with approval management and result processing."""
@@ -108,6 +134,15 @@ class ToolExecutor:
             return False
         return tool_call.name in TOOLS_REQUIRING_APPROVAL
 
+    def runs_in_order(self, tool_call: ToolCall) -> bool:
+        """Check if a tool call must not overlap with other calls.
+
+        Calls that may write files or run processes are executed alone and in
+        order, so a later call in the same response sees their effects.
+        """
+        name = tool_call.name
+        return name in TOOLS_REQUIRING_APPROVAL or name.startswith(_ORDERED_TOOL_PREFIXES)
+
     def _get_approval_reason(self, tool_call: ToolCall) -> str:
         """Generate a human-readable reason for the approval request."""
         if tool_call.name == "fs:write_file":
@@ -149,11 +184,10 @@ class ToolExecutor:
 
             # Parse result if JSON
             try:
+                raw_output = _format_json(result)
+            except ValueError:
                 if isinstance(result, bytes):
-                    result = result.decode("utf-8")
-                parsed = json.loads(result)
-                raw_output = json.dumps(parsed, indent=2)
-            except (json.JSONDecodeError, AttributeError):
+                    result = result.decode("utf-8", errors="replace")
                 raw_output = str(result)
 
             # Process through offloader and reducer
@@ -173,7 +207,7 @@ class ToolExecutor:
             return Observation(
                 tool_name=tool_call.name,
                 success=True,
-                output=processed_output[:2000],
+                output=processed_output[:_OBSERVATION_MAX_CHARS],
                 latency_ms=latency_ms,
                 reduced_step=reduced_step,
             )
@@ -241,7 +275,7 @@ class ToolExecutor:
             return Observation(
                 tool_name=tool_call.name,
                 success=True,
-                output=output[:2000],
+                output=output[:_OBSERVATION_MAX_CHARS],
                 latency_ms=latency_ms,
             )
 
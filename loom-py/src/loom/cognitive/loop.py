@@ -8,6 +8,7 @@ This module contains the pure logic for cognitive loops:
 
 from __future__ import annotations
 
+import ast
 import json
 import re
 from typing import TYPE_CHECKING, Any, Optional
@@ -16,6 +17,53 @@ if TYPE_CHECKING:
     from ..context import StepCompactor, ToolRegistry
     from .types import ThoughtStep
 
+# Response parsing runs on every ReAct iteration, so its patterns are
+# compiled once here rather than looked up in re's cache per call.
+
+# Hallucination markers: the LLM often keeps generating fake observations,
+# thoughts, etc. after its action
+_TRUNCATION_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\nObservation:",  # Fake observation
+        r"\nThought\s*\d+:",  # Next thought (should wait for real observation)
+        r"\nAction:\s*\n*Action:",  # Repeated action markers
+        r"\nAction:\s*[a-z_]+:",  # Format like "Action: fs:write_file(...)"
+        r"\nFINAL ANSWER:",  # Repeated final answer (keep only first)
+    )
+)
+_FINAL_ANSWER_RE = re.compile(
+    r"FINAL ANSWER:\s*(.+?)(?=\nFINAL ANSWER:|\nThought|\nAction|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+_TOOL_THOUGHT_PREFIX_RE = re.compile(r"^(Thought\s*\d*:|Action:)\s*", re.IGNORECASE)
+_THOUGHT_PREFIX_RE = re.compile(r"^Thought\s*\d*:\s*", re.IGNORECASE)
+_JSON_DECODER = json.JSONDecoder()
+_PYTHON_ACTION_RE = re.compile(
+    r"Action:\s*([a-z_:]+)\s*\(\s*(\{.+?\})\s*\)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Fixed part of the ReAct system prompt, between the base prompt and tools
+_REACT_INSTRUCTIONS = """
+
+You follow the ReAct (Reasoning + Acting) pattern:
+1. Thought: Analyze the situation and decide what to do
+2. Action: If needed, call a tool using JSON format: {"tool": "tool_name", "args": {"key": "value"}}
+3. STOP and wait for the real Observation from the system
+4. Repeat until you have enough information
+
+IMPORTANT RULES:
+- After outputting your Action JSON, you MUST STOP immediately
+- Do NOT write "Observation:" yourself - the system will provide real results
+- Do NOT imagine or make up tool results
+- Only output ONE thought per response, followed by ONE action
+- Exception: when several tool calls do not depend on each other's results,
+  you may output them together, one JSON object per line; they run in order
+- When you have gathered enough information, respond with:
+  FINAL ANSWER: <your complete answer here>
+"""
+
 
 def build_react_system_prompt(
     base_prompt: Optional[str],
@@ -48,22 +96,7 @@ def build_react_system_prompt(
             tools_list = ", ".join(available_tools)
             tools_desc = f"\n\nAvailable tools: {tools_list}"
 
-    return f"""{base}
-
-You follow the ReAct (Reasoning + Acting) pattern:
-1. Thought: Analyze the situation and decide what to do
-2. Action: If needed, call a tool using JSON format: {{"tool": "tool_name", "args": {{"key": "value"}}}}
-3. STOP and wait for the real Observation from the system
-4. Repeat until you have enough information
-
-IMPORTANT RULES:
-- After outputting an Action JSON, you MUST STOP immediately
-- Do NOT write "Observation:" yourself - the system will provide real results
-- Do NOT imagine or make up tool results
-- Only output ONE thought and ONE action per response
-- When you have gathered enough information, respond with:
-  FINAL ANSWER: <your complete answer here>
-{tools_desc}"""
+    return base + _REACT_INSTRUCTIONS + tools_desc
 
 
 def build_react_prompt(
@@ -71,6 +104,7 @@ def build_react_prompt(
     steps: list[ThoughtStep],
     compactor: Optional[StepCompactor] = None,
     use_compaction: bool = True,
+    step_lines: Optional[list[list[str]]] = None,
 ) -> str:
     """Build prompt for current ReAct iteration.
 
@@ -79,6 +113,8 @@ def build_react_prompt(
         steps: Previous reasoning steps
         compactor: Optional StepCompactor for history compression
         use_compaction: Whether to use compaction (default: True)
+        step_lines: Optional per-step cache of formatted lines, reused across
+            iterations of one run so each step is formatted only once
 
     Returns:
         Prompt string for the LLM
@@ -123,47 +159,64 @@ def build_react_prompt(
                 parts.append("\nRecent steps (detailed):")
                 recent_indices = list(range(len(steps) - len(history.recent_steps), len(steps)))
                 for idx in recent_indices:
-                    step = steps[idx]
-                    parts.append(f"\nThought {step.step}: {step.reasoning}")
-                    if step.tool_call:
-                        parts.append(f"Action: {step.tool_call.name}({step.tool_call.arguments})")
-                    if step.observation:
-                        if step.observation.success:
-                            # Show offload reference if available
-                            if step.reduced_step and step.reduced_step.outcome_ref:
-                                parts.append(f"Observation: (See {step.reduced_step.outcome_ref})")
-                            else:
-                                parts.append(f"Observation: {step.observation.output}")
-                        else:
-                            parts.append(f"Observation: Error - {step.observation.error}")
+                    # Show offload references for recent steps
+                    parts.extend(_format_step(steps[idx], show_refs=True))
         else:
             # Fallback to traditional format if no reduced steps
-            _add_traditional_steps(parts, steps)
+            _add_traditional_steps(parts, steps, step_lines)
     else:
         # No compaction - use traditional format
-        _add_traditional_steps(parts, steps)
+        _add_traditional_steps(parts, steps, step_lines)
 
     parts.append("\nWhat is your next thought or final answer?")
     return "\n".join(parts)
 
 
-def _add_traditional_steps(parts: list[str], steps: list[ThoughtStep]) -> None:
+def _add_traditional_steps(
+    parts: list[str],
+    steps: list[ThoughtStep],
+    step_lines: Optional[list[list[str]]] = None,
+) -> None:
     """Add steps in traditional format (no compaction).
 
     Args:
         parts: List to append prompt parts to
         steps: Steps to format
+        step_lines: Optional cache of formatted lines; only steps beyond its
+            length are formatted, then appended to it
     """
+    if step_lines is None:
+        step_lines = []
+    for step in steps[len(step_lines) :]:
+        step_lines.append(_format_step(step))
+
     parts.append("\nPrevious steps:")
-    for step in steps:
-        parts.append(f"\nThought {step.step}: {step.reasoning}")
-        if step.tool_call:
-            parts.append(f"Action: {step.tool_call.name}({step.tool_call.arguments})")
-        if step.observation:
-            if step.observation.success:
-                parts.append(f"Observation: {step.observation.output}")
+    for lines in step_lines:
+        parts.extend(lines)
+
+
+def _format_step(step: ThoughtStep, show_refs: bool = False) -> list[str]:
+    """Format one step as prompt lines.
+
+    Args:
+        step: Step to format
+        show_refs: Show the offload reference instead of the full output
+            when the observation was offloaded
+    """
+    lines = [f"\nThought {step.step}: {step.reasoning}"]
+    if step.tool_call:
+        # Compact JSON, matching the tool call format the model is asked for
+        args = json.dumps(step.tool_call.arguments, separators=(",", ":"), default=str)
+        lines.append(f"Action: {step.tool_call.name}({args})")
+    if step.observation:
+        if step.observation.success:
+            if show_refs and step.reduced_step and step.reduced_step.outcome_ref:
+                lines.append(f"Observation: (See {step.reduced_step.outcome_ref})")
             else:
-                parts.append(f"Observation: Error - {step.observation.error}")
+                lines.append(f"Observation: {step.observation.output}")
+        else:
+            lines.append(f"Observation: Error - {step.observation.error}")
+    return lines
 
 
 def build_cot_prompt(goal: str) -> str:
@@ -194,23 +247,15 @@ def parse_react_response(response: str) -> dict[str, Any]:
     Returns:
         Dict with 'type' key and relevant content:
         - {"type": "final_answer", "content": "..."}
-        - {"type": "tool_call", "thought": "...", "tool": "...", "args": {...}}
+        - {"type": "tool_call", "thought": "...", "tool": "...", "args": {...},
+           "tool_calls": [{"tool": "...", "args": {...}}, ...]}
         - {"type": "reasoning", "content": "..."}
     """
     response = response.strip()
 
     # Truncate at various hallucination markers
-    # LLM often continues generating fake observations, thoughts, etc.
-    truncation_patterns = [
-        r"\nObservation:",  # Fake observation
-        r"\nThought\s*\d+:",  # Next thought (should wait for real observation)
-        r"\nAction:\s*\n*Action:",  # Repeated action markers
-        r"\nAction:\s*[a-z_]+:",  # Format like "Action: fs:write_file(...)"
-        r"\nFINAL ANSWER:",  # Repeated final answer (keep only first)
-    ]
-
-    for pattern in truncation_patterns:
-        match = re.search(pattern, response, re.IGNORECASE)
+    for pattern in _TRUNCATION_PATTERNS:
+        match = pattern.search(response)
         if match:
             # Only truncate if we have a tool call before the marker
             before = response[: match.start()]
@@ -220,11 +265,7 @@ def parse_react_response(response: str) -> dict[str, Any]:
 
     # Check for final answer - find first occurrence and use only that
     # This prevents LLM from repeating the same final answer multiple times
-    final_match = re.search(
-        r"FINAL ANSWER:\s*(.+?)(?=\nFINAL ANSWER:|\nThought|\nAction|$)",
-        response,
-        re.IGNORECASE | re.DOTALL,
-    )
+    final_match = _FINAL_ANSWER_RE.search(response)
     if final_match:
         return {"type": "final_answer", "content": final_match.group(1).strip()}
 
@@ -234,20 +275,53 @@ def parse_react_response(response: str) -> dict[str, Any]:
         # Extract thought before tool call
         thought = response.split("{")[0].strip()
         # Remove various prefixes
-        thought = re.sub(r"^(Thought\s*\d*:|Action:)\s*", "", thought, flags=re.IGNORECASE)
+        thought = _TOOL_THOUGHT_PREFIX_RE.sub("", thought)
         thought = thought.strip()
         return {
             "type": "tool_call",
             "thought": thought,
             "tool": tool_call["tool"],
             "args": tool_call.get("args", {}),
+            # All independent calls in the response, first one included
+            "tool_calls": extract_tool_calls(response) or [tool_call],
         }
 
     # Just reasoning
-    content = re.sub(r"^Thought\s*\d*:\s*", "", response, flags=re.IGNORECASE)
+    content = _THOUGHT_PREFIX_RE.sub("", response)
     return {"type": "reasoning", "content": content}
 
 
+def react_response_complete(text: str, max_tool_calls: Optional[int] = None) -> bool:
+    """Check whether a partial ReAct response can stop streaming.
+
+    True once parse_react_response would discard anything generated later:
+    a final answer already ended by a following marker, a tool call followed
+    by an invented observation, or ``max_tool_calls`` complete tool calls.
+
+    Args:
+        text: Response received so far
+        max_tool_calls: Number of tool calls after which the rest is unused
+
+    Returns:
+        True if the rest of the response can be cancelled
+    """
+    final_match = _FINAL_ANSWER_RE.search(text)
+    if (
+        final_match
+        and final_match.end() < len(text.rstrip())
+        and not _has_tool_call(text[: final_match.end()])
+    ):
+        return True
+
+    observation = _TRUNCATION_PATTERNS[0].search(text)
+    if observation and _has_tool_call(text[: observation.start()]):
+        return True
+
+    if not max_tool_calls:
+        return False
+    return len(extract_tool_calls(text, max_tool_calls)) >= max_tool_calls
+
+
 def _has_tool_call(text: str) -> bool:
     """Check if text contains a valid tool call JSON."""
     return bool(extract_tool_call(text))
@@ -275,17 +349,11 @@ def extract_tool_call(text: str) -> Optional[dict]:
 
     # Try Python-style format: Action: tool_name({'arg': 'value'})
     # or Action: tool_name({"arg": "value"})
-    python_match = re.search(
-        r"Action:\s*([a-z_:]+)\s*\(\s*(\{.+?\})\s*\)",
-        text,
-        re.IGNORECASE | re.DOTALL,
-    )
+    python_match = _PYTHON_ACTION_RE.search(text)
     if python_match:
         tool_name = python_match.group(1)
         args_str = python_match.group(2)
         # Safely parse Python dict syntax using ast.literal_eval
-        import ast
-
         try:
             args = ast.literal_eval(args_str)
             if isinstance(args, dict):
@@ -296,43 +364,58 @@ def extract_tool_call(text: str) -> Optional[dict]:
     return None
 
 
+def extract_tool_calls(text: str, limit: Optional[int] = None) -> list[dict]:
+    """Extract every JSON tool call in text, in order.
+
+    Args:
+        text: Text that may contain several JSON tool calls
+        limit: Maximum number of calls to return (default: all)
+
+    Returns:
+        List of dicts with 'tool' and 'args' keys (empty if none found)
+    """
+    calls: list[dict] = []
+    idx = 0
+    while limit is None or len(calls) < limit:
+        call, idx = _scan_json_tool_call(text, idx)
+        if idx == -1:
+            break
+        if call:
+            calls.append(call)
+    return calls
+
+
 def _extract_json_tool_call(text: str) -> Optional[dict]:
     """Extract tool call from JSON format."""
-    # Find JSON object - handle nested braces
-    start_idx = text.find("{")
-    if start_idx == -1:
-        return None
-
-    # Find matching closing brace
-    depth = 0
-    end_idx = start_idx
-    for i, char in enumerate(text[start_idx:], start_idx):
-        if char == "{":
-            depth += 1
-        elif char == "}":
-            depth -= 1
-            if depth == 0:
-                end_idx = i
-                break
+    return _scan_json_tool_call(text, 0)[0]
 
-    if depth != 0:
-        return None
 
-    json_str = text[start_idx : end_idx + 1]
+def _scan_json_tool_call(text: str, start: int) -> tuple[Optional[dict], int]:
+    """Parse the first JSON object at or after ``start`` as a tool call.
 
-    try:
-        obj = json.loads(json_str)
+    Returns:
+        (tool call or None, index just past the object), or (None, -1) when
+        no complete JSON object follows ``start``
+    """
+    idx = text.find("{", start)
+    while idx != -1:
+        # raw_decode scans the object in C and reports where it ended
+        try:
+            obj, end = _JSON_DECODER.raw_decode(text, idx)
+        except json.JSONDecodeError:
+            idx = text.find("{", idx + 1)
+            continue
 
         # Support multiple formats
         tool_name = obj.get("tool") or obj.get("action") or obj.get("name")
         if not tool_name:
-            return None
+            return None, end
 
         args = obj.get("args") or obj.get("arguments") or obj.get("input") or {}
 
-        return {"tool": tool_name, "args": args}
-    except json.JSONDecodeError:
-        return None
+        return {"tool": tool_name, "args": args}, end
+
+    return None, -1
 
 
 def synthesize_answer(steps: list[ThoughtStep]) -> str:
@@ -366,5 +449,7 @@ __all__ = [
     "build_cot_prompt",
     "parse_react_response",
     "extract_tool_call",
+    "extract_tool_calls",
+    "react_response_complete",
     "synthesize_answer",
 ]
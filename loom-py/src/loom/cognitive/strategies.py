@@ -8,6 +8,9 @@ This module implements different reasoning strategies:
 
 from __future__ import annotations
 
+import asyncio
+import os
+from contextlib import AbstractContextManager, nullcontext
 from typing import TYPE_CHECKING, AsyncIterator, Optional, Union
 
 from opentelemetry import trace
@@ -17,20 +20,31 @@ from .loop import (
     build_react_prompt,
     build_react_system_prompt,
     parse_react_response,
+    react_response_complete,
     synthesize_answer,
 )
-from .types import CognitiveResult, ThoughtStep, ToolCall
+from .types import CognitiveResult, Observation, ThoughtStep, ToolCall
 
 if TYPE_CHECKING:
     from ..context import StepCompactor, ToolRegistry
     from ..context.memory import WorkingMemory
-    from ..llm import LLMProvider
+    from ..llm import LLMProvider, SemanticLLMCache
     from .config import CognitiveConfig
     from .executor import ToolExecutor
 
 # Get tracer for strategy spans
 tracer = trace.get_tracer(__name__)
 
+# Per-iteration spans are opt-in; the LLM and tool spans inside each
+# iteration are recorded either way
+_TRACE_ITERATIONS = os.environ.get("LOOM_TRACE_ITERATIONS") == "1"
+_NO_SPAN = nullcontext(trace.INVALID_SPAN)
+
+
+def _iteration_span(name: str) -> AbstractContextManager[trace.Span]:
+    """Start a ReAct iteration span, or a no-op one unless LOOM_TRACE_ITERATIONS=1."""
+    return tracer.start_as_current_span(name) if _TRACE_ITERATIONS else _NO_SPAN
+
 
 class StrategyExecutor:
     """Executes different thinking strategies for cognitive agents."""
@@ -44,6 +58,7 @@ class StrategyExecutor:
         step_compactor: StepCompactor,
         available_tools: list[str],
         tool_registry: Optional[ToolRegistry] = None,
+        llm_cache: Optional[SemanticLLMCache] = None,
     ):
         """Initialize strategy executor.
 
@@ -55,6 +70,7 @@ class StrategyExecutor:
             step_compactor: Step compactor for context engineering
             available_tools: List of available tool names
             tool_registry: Optional tool registry for enhanced descriptions
+            llm_cache: Optional response cache for single-shot and CoT calls
         """
         self.llm = llm
         self.config = config
@@ -63,18 +79,72 @@ class StrategyExecutor:
         self.step_compactor = step_compactor
         self.available_tools = available_tools
         self.tool_registry = tool_registry
+        self.llm_cache = llm_cache
+        # ((system_prompt, tools), prompt) for the last ReAct system prompt built
+        self._system_prompt_cache: Optional[tuple[tuple, str]] = None
+        self._react_system_prompt()
+
+    def _react_system_prompt(self) -> str:
+        """Return the ReAct system prompt, rebuilding it only when inputs change.
+
+        The cache is keyed on the configured system prompt and tool list. Tool
+        descriptors edited in the registry directly are not tracked; call
+        ``invalidate_system_prompt`` after doing so.
+        """
+        key = (self.config.system_prompt, tuple(self.available_tools))
+        cached = self._system_prompt_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        system = build_react_system_prompt(
+            self.config.system_prompt,
+            self.available_tools,
+            tool_registry=self.tool_registry,
+        )
+        self._system_prompt_cache = (key, system)
+        return system
+
+    def invalidate_system_prompt(self) -> None:
+        """Rebuild the ReAct system prompt after tools or their descriptors change.
+
+        The prompt is rebuilt here rather than on the next run, so runs only
+        ever reuse it.
+        """
+        self._system_prompt_cache = None
+        self._react_system_prompt()
+
+    async def _generate_cached(self, prompt: str, system: str, goal: Optional[str] = None) -> str:
+        """Call the LLM, answering from the response cache when possible.
+
+        Args:
+            prompt: Prompt sent to the LLM
+            system: System prompt
+            goal: Text to match cache entries on when ``prompt`` wraps it in a
+                fixed template (default: the prompt itself)
+        """
+        temperature = self.config.temperature
+        cache = self.llm_cache
+        if cache is None:
+            return await self.llm.generate(prompt=prompt, system=system, temperature=temperature)
+
+        model: str = getattr(getattr(self.llm, "config", None), "model", "")
+        text = goal or prompt
+        response = cache.get(text, system=system, temperature=temperature, model=model)
+        if response is None:
+            response = await self.llm.generate(
+                prompt=prompt, system=system, temperature=temperature
+            )
+            cache.set(text, response, system=system, temperature=temperature, model=model)
+        return response
 
     async def run_single_shot(self, goal: str) -> CognitiveResult:
         """Single shot: one LLM call, no tools."""
         system = self.config.system_prompt or "You are a helpful AI assistant."
 
-        response = await self.llm.generate(
-            prompt=goal,
-            system=system,
-            temperature=self.config.temperature,
-        )
+        response = await self._generate_cached(goal, system)
 
-        self.memory.add("assistant", response)
+        if self.config.persist_memory:
+            self.memory.add("assistant", response)
 
         return CognitiveResult(
             answer=response,
@@ -82,32 +152,36 @@ class StrategyExecutor:
             success=True,
         )
 
-    async def run_react(self, goal: str) -> CognitiveResult:
-        """ReAct pattern: iterative Thought -> Action -> Observation."""
+    async def run_react(self, goal: str, max_iterations: Optional[int] = None) -> CognitiveResult:
+        """ReAct pattern: iterative Thought -> Action -> Observation.
+
+        Args:
+            goal: The task/goal to accomplish
+            max_iterations: Iteration cap for this run (default: config.max_iterations)
+        """
         result = CognitiveResult(answer="", iterations=0)
 
-        system = build_react_system_prompt(
-            self.config.system_prompt,
-            self.available_tools,
-            tool_registry=self.tool_registry,
-        )
+        system = self._react_system_prompt()
+        # Formatted prompt lines per step, extended as the run goes
+        step_lines: list[list[str]] = []
+
+        goal_head = goal[:100]
+        # Consecutive reasoning-only responses, i.e. no progress
+        stalled = 0
 
-        for iteration in range(self.config.max_iterations):
+        for iteration in range(max_iterations or self.config.max_iterations):
             result.iterations = iteration + 1
 
-            with tracer.start_as_current_span(
-                "cognitive.react_iteration",
-                attributes={
-                    "iteration": iteration + 1,
-                    "goal": goal[:100],
-                },
-            ) as iter_span:
+            with _iteration_span("cognitive.react_iteration") as iter_span:
+                iter_span.set_attribute("iteration", iteration + 1)
+                iter_span.set_attribute("goal", goal_head)
                 # Build prompt with history
                 prompt = build_react_prompt(
                     goal,
                     result.steps,
                     compactor=self.step_compactor,
                     use_compaction=True,
+                    step_lines=step_lines,
                 )
 
                 # Think - LLM call
@@ -115,11 +189,26 @@ class StrategyExecutor:
                     "cognitive.think",
                     attributes={"prompt.length": len(prompt)},
                 ):
-                    response = await self.llm.generate(
-                        prompt=prompt,
-                        system=system,
-                        temperature=self.config.temperature,
-                    )
+                    if self.config.react_samples > 1 and hasattr(self.llm, "generate_candidates"):
+                        candidates = await self.llm.generate_candidates(
+                            prompt=prompt,
+                            n=self.config.react_samples,
+                            system=system,
+                            temperature=self.config.temperature,
+                            system_cacheable=True,
+                        )
+                        response = self._pick_candidate(candidates)
+                    elif self.config.stream_react:
+                        response = "".join(
+                            [chunk async for chunk in self._stream_react_response(prompt, system)]
+                        )
+                    else:
+                        response = await self.llm.generate(
+                            prompt=prompt,
+                            system=system,
+                            temperature=self.config.temperature,
+                            system_cacheable=True,
+                        )
 
                 # Parse response
                 parsed = parse_react_response(response)
@@ -133,37 +222,30 @@ class StrategyExecutor:
                     break
 
                 elif parsed["type"] == "tool_call":
-                    step = ThoughtStep(
-                        step=iteration + 1,
-                        reasoning=parsed.get("thought", ""),
-                        tool_call=ToolCall(
-                            name=parsed["tool"],
-                            arguments=parsed.get("args", {}),
-                        ),
-                    )
-
-                    # Execute tool
-                    observation = await self.tool_executor.execute_tool(step.tool_call)
-                    step.observation = observation
-
-                    # Attach reduced step if available
-                    if observation.reduced_step:
-                        step.reduced_step = observation.reduced_step
-
-                    result.steps.append(step)
-                    self.memory.add(
-                        "assistant",
-                        f"Thought: {step.reasoning}\nAction: {step.tool_call.name}",
-                    )
-
-                    # Add observation with offload reference if available
-                    if observation.reduced_step and observation.reduced_step.outcome_ref:
-                        obs_text = (
-                            f"Observation: (Data saved to {observation.reduced_step.outcome_ref})"
+                    stalled = 0
+                    reasoning = parsed.get("thought", "")
+                    for tool_call, observation in await self._execute_tool_calls(parsed):
+                        step = ThoughtStep(
+                            step=iteration + 1,
+                            reasoning=reasoning,
+                            tool_call=tool_call,
+                            observation=observation,
+                        )
+                        # Attach reduced step if available
+                        if observation.reduced_step:
+                            step.reduced_step = observation.reduced_step
+                        result.steps.append(step)
+                        self.memory.add(
+                            "assistant",
+                            f"Thought: {step.reasoning}\nAction: {tool_call.name}",
                         )
-                    else:
-                        obs_text = f"Observation: {observation.output if observation.success else observation.error}"
-                    self.memory.add("system", obs_text)
+
+                        # Add observation with offload reference if available
+                        if observation.reduced_step and observation.reduced_step.outcome_ref:
+                            obs_text = f"Observation: (Data saved to {observation.reduced_step.outcome_ref})"
+                        else:
+                            obs_text = f"Observation: {observation.output if observation.success else observation.error}"
+                        self.memory.add("system", obs_text)
 
                 else:
                     # Just reasoning, continue
@@ -175,6 +257,11 @@ class StrategyExecutor:
                     )
                     self.memory.add("assistant", f"Thought: {parsed.get('content', response)}")
 
+                    stalled += 1
+                    if self._is_stalled(stalled):
+                        iter_span.set_attribute("stalled", True)
+                        break
+
         # If we exhausted iterations without final answer
         if not result.answer:
             result.answer = synthesize_answer(result.steps)
@@ -182,36 +269,117 @@ class StrategyExecutor:
 
         return result
 
+    def _is_stalled(self, stalled: int) -> bool:
+        """Whether a run should give up after ``stalled`` reasoning-only responses."""
+        limit = self.config.max_stalled_iterations
+        return limit > 0 and stalled >= limit
+
+    def _pick_candidate(self, candidates: list[str]) -> str:
+        """Pick the first sampled response that can make progress.
+
+        A candidate qualifies if it gives a final answer or calls a tool the
+        agent actually has; otherwise the first candidate is used as-is.
+        """
+        tools = self.available_tools
+        for candidate in candidates:
+            parsed = parse_react_response(candidate)
+            if parsed["type"] == "final_answer":
+                return candidate
+            if parsed["type"] == "tool_call" and (not tools or parsed["tool"] in tools):
+                return candidate
+        return candidates[0]
+
+    async def _execute_tool_calls(self, parsed: dict) -> list[tuple[ToolCall, Observation]]:
+        """Run the tool calls from one ReAct response, in the order issued.
+
+        Consecutive read-only calls run concurrently. A call that may touch
+        files or processes (see ToolExecutor.runs_in_order) waits for the calls
+        before it and runs alone, so e.g. a write is never raced by a read or
+        delete of the same path. At most ``config.max_tools_per_step`` calls
+        are run.
+
+        Returns:
+            (tool_call, observation) pairs, in the order the model issued them
+        """
+        executor = self.tool_executor
+        calls = parsed.get("tool_calls") or [parsed]
+        results: list[tuple[ToolCall, Observation]] = []
+        batch: list[ToolCall] = []
+
+        async def run_batch() -> None:
+            observations = await asyncio.gather(*(executor.execute_tool(c) for c in batch))
+            results.extend(zip(batch, observations))
+            batch.clear()
+
+        for call in calls[: max(1, self.config.max_tools_per_step)]:
+            tool_call = ToolCall(name=call["tool"], arguments=call.get("args", {}))
+            if executor.runs_in_order(tool_call):
+                await run_batch()
+                results.append((tool_call, await executor.execute_tool(tool_call)))
+            else:
+                batch.append(tool_call)
+        await run_batch()
+        return results
+
+    async def _stream_react_response(self, prompt: str, system: str) -> AsyncIterator[str]:
+        """Stream one ReAct response, cancelling it once the rest would be unused.
+
+        Closing the provider's stream early stops the remaining decode (and,
+        for HTTP providers, the underlying request).
+        """
+        stream = self.llm.generate_stream(
+            prompt=prompt,
+            system=system,
+            temperature=self.config.temperature,
+            system_cacheable=True,
+        )
+        response = ""
+        try:
+            async for chunk in stream:
+                response += chunk
+                yield chunk
+                if react_response_complete(response, self.config.max_tools_per_step):
+                    break
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
     async def run_react_stream(
         self,
         goal: str,
+        max_iterations: Optional[int] = None,
     ) -> AsyncIterator[Union[str, ThoughtStep, CognitiveResult]]:
-        """ReAct pattern with streaming: yield chunks and steps as they happen."""
+        """ReAct pattern with streaming: yield chunks and steps as they happen.
+
+        Args:
+            goal: The task/goal to accomplish
+            max_iterations: Iteration cap for this run (default: config.max_iterations)
+        """
         result = CognitiveResult(answer="", iterations=0)
 
-        system = build_react_system_prompt(
-            self.config.system_prompt,
-            self.available_tools,
-            tool_registry=self.tool_registry,
-        )
+        system = self._react_system_prompt()
+        # Formatted prompt lines per step, extended as the run goes
+        step_lines: list[list[str]] = []
+
+        goal_head = goal[:100]
+        # Consecutive reasoning-only responses, i.e. no progress
+        stalled = 0
 
-        for iteration in range(self.config.max_iterations):
+        for iteration in range(max_iterations or self.config.max_iterations):
             result.iterations = iteration + 1
 
-            with tracer.start_as_current_span(
-                "cognitive.react_stream_iteration",
-                attributes={
-                    "iteration": iteration + 1,
-                    "goal": goal[:100],
-                    "steps_so_far": len(result.steps),
-                },
-            ) as iter_span:
+            with _iteration_span("cognitive.react_stream_iteration") as iter_span:
+                iter_span.set_attribute("iteration", iteration + 1)
+                iter_span.set_attribute("goal", goal_head)
+                iter_span.set_attribute("steps_so_far", len(result.steps))
                 # Build prompt with history
                 prompt = build_react_prompt(
                     goal,
                     result.steps,
                     compactor=self.step_compactor,
                     use_compaction=True,
+                    step_lines=step_lines,
                 )
 
                 # Stream the LLM response
@@ -220,11 +388,7 @@ class StrategyExecutor:
                     "cognitive.think_stream",
                     attributes={"prompt.length": len(prompt)},
                 ) as think_span:
-                    async for chunk in self.llm.generate_stream(
-                        prompt=prompt,
-                        system=system,
-                        temperature=self.config.temperature,
-                    ):
+                    async for chunk in self._stream_react_response(prompt, system):
                         full_response += chunk
                         yield chunk  # Stream each chunk to caller
                     think_span.set_attribute("response.length", len(full_response))
@@ -241,37 +405,32 @@ class StrategyExecutor:
                     break
 
                 elif parsed["type"] == "tool_call":
-                    step = ThoughtStep(
-                        step=iteration + 1,
-                        reasoning=parsed.get("thought", ""),
-                        tool_call=ToolCall(
-                            name=parsed["tool"],
-                            arguments=parsed.get("args", {}),
-                        ),
-                    )
-
+                    stalled = 0
                     iter_span.set_attribute("tool.name", parsed["tool"])
 
-                    # Execute tool
-                    observation = await self.tool_executor.execute_tool(step.tool_call)
-                    step.observation = observation
-
-                    # Attach reduced step if available
-                    if observation.reduced_step:
-                        step.reduced_step = observation.reduced_step
-
-                    result.steps.append(step)
-                    self.memory.add(
-                        "assistant",
-                        f"Thought: {step.reasoning}\nAction: {step.tool_call.name}",
-                    )
-                    self.memory.add(
-                        "system",
-                        f"Observation: {observation.output if observation.success else observation.error}",
-                    )
+                    reasoning = parsed.get("thought", "")
+                    for tool_call, observation in await self._execute_tool_calls(parsed):
+                        step = ThoughtStep(
+                            step=iteration + 1,
+                            reasoning=reasoning,
+                            tool_call=tool_call,
+                            observation=observation,
+                        )
+                        # Attach reduced step if available
+                        if observation.reduced_step:
+                            step.reduced_step = observation.reduced_step
+                        result.steps.append(step)
+                        self.memory.add(
+                            "assistant",
+                            f"Thought: {step.reasoning}\nAction: {tool_call.name}",
+                        )
+                        self.memory.add(
+                            "system",
+                            f"Observation: {observation.output if observation.success else observation.error}",
+                        )
 
-                    # Yield the complete step
-                    yield step
+                        # Yield the complete step
+                        yield step
 
                 else:
                     # Just reasoning, continue
@@ -283,6 +442,11 @@ class StrategyExecutor:
                     self.memory.add("assistant", f"Thought: {step.reasoning}")
                     yield step
 
+                    stalled += 1
+                    if self._is_stalled(stalled):
+                        iter_span.set_attribute("stalled", True)
+                        break
+
         # If we exhausted iterations without final answer
         if not result.answer:
             result.answer = synthesize_answer(result.steps)
@@ -300,13 +464,10 @@ class StrategyExecutor:
 
         prompt = build_cot_prompt(goal)
 
-        response = await self.llm.generate(
-            prompt=prompt,
-            system=system,
-            temperature=self.config.temperature,
-        )
+        response = await self._generate_cached(prompt, system, goal=goal)
 
-        self.memory.add("assistant", response)
+        if self.config.persist_memory:
+            self.memory.add("assistant", response)
 
         return CognitiveResult(
             answer=response,
@@ -16,7 +16,7 @@ if TYPE_CHECKING:
     from ..context import Step
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """A tool call to be executed."""
 
@@ -27,7 +27,7 @@ class ToolCall:
         return {"tool": self.name, "args": self.arguments}
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     """Result of a tool execution."""
 
@@ -39,7 +39,7 @@ class Observation:
     reduced_step: Optional[Step] = None  # Context-reduced version
 
 
-@dataclass
+@dataclass(slots=True)
 class ThoughtStep:
     """A single step in the reasoning process."""
 
@@ -50,7 +50,7 @@ class ThoughtStep:
     reduced_step: Optional[Step] = None  # Context-reduced version for prompts
 
 
-@dataclass
+@dataclass(slots=True)
 class CognitiveResult:
     """Result of a cognitive loop execution."""
 
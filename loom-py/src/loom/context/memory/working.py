@@ -5,7 +5,9 @@ Stores conversation history and intermediate results during agent reasoning.
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from collections import deque
+from itertools import islice
+from typing import Any, Iterator, Optional
 
 
 class WorkingMemory:
@@ -22,7 +24,10 @@ class WorkingMemory:
             max_items: Maximum number of items to keep (oldest are dropped)
         """
         self.max_items = max_items
-        self._items: list[dict[str, Any]] = []
+        # Ring buffer: appending past max_items drops the oldest item in O(1)
+        self._items: deque[dict[str, Any]] = deque(maxlen=max_items)
+        # Chat-format view of each item, built once on add and kept in step
+        self._messages: deque[dict[str, str]] = deque(maxlen=max_items)
 
     def add(self, role: str, content: str, metadata: Optional[dict] = None) -> None:
         """Add an item to working memory.
@@ -36,10 +41,7 @@ class WorkingMemory:
         if metadata:
             item["metadata"] = metadata
         self._items.append(item)
-
-        # Trim if over limit
-        if len(self._items) > self.max_items:
-            self._items = self._items[-self.max_items :]
+        self._messages.append({"role": role, "content": content})
 
     def get_context(self, max_items: Optional[int] = None) -> list[dict[str, Any]]:
         """Get recent items from memory.
@@ -51,7 +53,17 @@ class WorkingMemory:
             List of memory items (role, content, metadata)
         """
         n = max_items or len(self._items)
-        return self._items[-n:]
+        return list(islice(self._items, max(0, len(self._items) - n), None))
+
+    def iter_messages(self) -> Iterator[dict[str, str]]:
+        """Iterate over memory in chat messages format.
+
+        The message dicts are shared with the memory; copy before mutating.
+
+        Returns:
+            Iterator of {"role": ..., "content": ...} dicts, oldest first
+        """
+        return iter(self._messages)
 
     def to_messages(self) -> list[dict[str, str]]:
         """Convert memory to chat messages format.
@@ -59,11 +71,12 @@ class WorkingMemory:
         Returns:
             List of {"role": ..., "content": ...} dicts
         """
-        return [{"role": item["role"], "content": item["content"]} for item in self._items]
+        return list(self._messages)
 
     def clear(self) -> None:
         """Clear all items."""
         self._items.clear()
+        self._messages.clear()
 
     def __len__(self) -> int:
         return len(self._items)
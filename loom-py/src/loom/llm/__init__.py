@@ -4,11 +4,15 @@ This module provides LLM integration for Python agents:
 - LLMProvider: Main class for LLM API calls
 - LLMConfig: Configuration for API connections
 - Message/LLMResponse: Types for LLM interactions
+- SemanticLLMCache: Response cache for repeated (or, with embeddings, similar) prompts
+- BatchingLLMProxy: Coalesces concurrent generate calls into batches
 
 Part of the Brain/Hand separation - Python makes LLM calls directly
 for fast iteration on prompt engineering.
 """
 
+from .batching import BatchingLLMProxy
+from .cache import SemanticLLMCache
 from .config import LLMConfig
 from .provider import LLMProvider
 from .types import LLMResponse, Message
@@ -18,4 +22,6 @@ __all__ = [
     "LLMConfig",
     "Message",
     "LLMResponse",
+    "SemanticLLMCache",
+    "BatchingLLMProxy",
 ]
@@ -0,0 +1,126 @@
+"""LLM request batching - Coalesce concurrent generate calls.
+
+This module provides BatchingLLMProxy, which wraps an LLM provider so that
+generate() calls landing within a few milliseconds of each other (e.g. from
+agents fanning out research subgoals) are sent as one batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Optional
+
+# (system, temperature, max_tokens, timeout_ms, system_cacheable): calls
+# batch only with equals
+_BatchKey = tuple[Optional[str], Optional[float], Optional[int], Optional[int], bool]
+
+
+class BatchingLLMProxy:
+    """Drop-in LLM wrapper that micro-batches concurrent generate() calls.
+
+    Calls with the same settings are queued and drained after ``window_ms``
+    or as soon as ``max_batch`` are waiting, whichever comes first. A drained
+    batch goes to the provider's ``generate_batch`` when it has one, and to
+    concurrent ``generate`` calls otherwise. A lone call is passed straight
+    to ``generate``.
+
+    Everything other than generate() (generate_stream, chat, config, ...) is
+    forwarded to the wrapped provider. Share one proxy between agents for
+    their calls to be batched together; keep response caches in front of
+    it so hits never wait for a batch. If a batch call fails, every request
+    in that batch gets the error.
+    """
+
+    def __init__(self, llm: Any, max_batch: int = 8, window_ms: float = 5.0):
+        """Initialize the proxy.
+
+        Args:
+            llm: Provider to wrap (e.g. an LLMProvider)
+            max_batch: Queue depth that drains a batch immediately
+            window_ms: Longest a call waits for others to batch with
+        """
+        self._llm = llm
+        self.max_batch = max_batch
+        self.window = window_ms / 1000.0
+        self._pending: dict[_BatchKey, list[tuple[str, asyncio.Future[str]]]] = {}
+        self._timers: dict[_BatchKey, asyncio.TimerHandle] = {}
+        # Strong references so in-flight batch tasks are not garbage collected
+        self._tasks: set[asyncio.Task] = set()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._llm, name)
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout_ms: Optional[int] = None,
+        system_cacheable: bool = False,
+    ) -> str:
+        """Queue a completion request and wait for its batch to return it."""
+        key = (system, temperature, max_tokens, timeout_ms, system_cacheable)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
+
+        batch = self._pending.setdefault(key, [])
+        batch.append((prompt, future))
+        if len(batch) >= self.max_batch:
+            self._flush(key)
+        elif len(batch) == 1:
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+
+        return await future
+
+    def _flush(self, key: _BatchKey) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if batch:
+            task = asyncio.ensure_future(self._run_batch(key, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self, key: _BatchKey, batch: list[tuple[str, asyncio.Future[str]]]
+    ) -> None:
+        system, temperature, max_tokens, timeout_ms, system_cacheable = key
+        settings = {
+            "system": system,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "timeout_ms": timeout_ms,
+        }
+        # Only forwarded when set, so plain providers keep working
+        if system_cacheable:
+            settings["system_cacheable"] = True
+        prompts = [prompt for prompt, _ in batch]
+
+        results: list[Any]
+        generate_batch = getattr(self._llm, "generate_batch", None)
+        if len(prompts) > 1 and generate_batch is not None:
+            try:
+                results = await generate_batch(prompts, **settings)
+            except Exception as e:
+                results = [e] * len(prompts)
+        else:
+            results = await asyncio.gather(
+                *(self._llm.generate(prompt, **settings) for prompt in prompts),
+                return_exceptions=True,
+            )
+
+        for (_, future), result in zip(batch, results):
+            if future.done():  # Caller stopped waiting
+                continue
+            if isinstance(result, asyncio.CancelledError):
+                future.cancel()
+            elif isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+__all__ = ["BatchingLLMProxy"]
@@ -0,0 +1,154 @@
+"""LLM response cache - Reuse answers for repeated or paraphrased prompts.
+
+This module provides SemanticLLMCache, an in-process cache that answers a
+repeated prompt without another LLM round-trip, and, given an embedding
+model, a paraphrase of an earlier one too.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from collections import OrderedDict
+from typing import Callable, Optional, Sequence
+
+# A dense prompt embedding from a user-supplied model, L2-normalized
+Embedding = Sequence[float]
+
+
+def _prompt_key(prompt: str) -> str:
+    """Exact-match key: SHA-256 of the prompt, ignoring surrounding whitespace."""
+    return hashlib.sha256(prompt.strip().encode()).hexdigest()
+
+
+def _normalize(vec: Embedding) -> list[float]:
+    norm = math.sqrt(sum(v * v for v in vec)) or 1.0
+    return [v / norm for v in vec]
+
+
+def _cosine(a: Embedding, b: Embedding) -> float:
+    """Cosine similarity of two normalized embeddings."""
+    return sum(x * y for x, y in zip(a, b))
+
+
+class SemanticLLMCache:
+    """Cache of LLM responses keyed by prompt similarity.
+
+    Entries are bucketed by a SHA-256 fingerprint of the generation settings
+    (model, temperature, system prompt), so responses are never shared across
+    different configurations. Within a bucket, prompts are keyed by a SHA-256
+    of their text, so by default only a verbatim repeat of a cached prompt
+    hits.
+
+    Pass ``embed`` (e.g. a sentence-transformers ``encode``) for semantic
+    matching: a prompt with no exact entry then hits when its cosine
+    similarity to a cached prompt in its bucket is at least ``threshold``.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        max_entries: int = 1024,
+        embed: Optional[Callable[[str], Embedding]] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit (0.0-1.0)
+            max_entries: Maximum cached responses (least recently used are dropped)
+            embed: Embedding function for semantic matching (default: exact
+                matches only)
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._embed = embed
+        # (bucket, prompt key) -> (embedding, response), in LRU order
+        self._entries: OrderedDict[tuple[str, str], tuple[Optional[Embedding], str]] = OrderedDict()
+        # bucket -> prompt keys cached under it, so lookups only scan one bucket
+        self._buckets: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _bucket(system: Optional[str], temperature: Optional[float], model: str) -> str:
+        key = f"{model}\x00{temperature!r}\x00{system or ''}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def get(
+        self,
+        prompt: str,
+        *,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        model: str = "",
+    ) -> Optional[str]:
+        """Return the cached response for this or the most similar prompt, or None."""
+        bucket = self._bucket(system, temperature, model)
+        prompts = self._buckets.get(bucket)
+        if not prompts:
+            return None
+
+        # Exact tier: a repeated prompt skips embedding altogether
+        digest = _prompt_key(prompt)
+        if digest in prompts:
+            key = (bucket, digest)
+            self._entries.move_to_end(key)
+            return self._entries[key][1]
+
+        if self._embed is None:
+            return None
+        query = _normalize(self._embed(prompt))
+        best_key, best_score = None, self.threshold
+        for cached_prompt in prompts:
+            key = (bucket, cached_prompt)
+            embedding = self._entries[key][0]
+            if embedding is None:
+                continue
+            score = _cosine(query, embedding)
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][1]
+
+    def set(
+        self,
+        prompt: str,
+        response: str,
+        *,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        model: str = "",
+    ) -> None:
+        """Cache ``response`` for ``prompt`` under the given settings."""
+        bucket = self._bucket(system, temperature, model)
+        digest = _prompt_key(prompt)
+        key = (bucket, digest)
+        cached = self._entries.get(key)
+        # Re-caching the same prompt keeps its embedding
+        embedding: Optional[Embedding] = None
+        if cached is not None:
+            embedding = cached[0]
+        elif self._embed is not None:
+            embedding = _normalize(self._embed(prompt))
+        self._entries[key] = (embedding, response)
+        self._entries.move_to_end(key)
+        self._buckets.setdefault(bucket, set()).add(digest)
+
+        while len(self._entries) > self.max_entries:
+            (old_bucket, old_prompt), _ = self._entries.popitem(last=False)
+            prompts = self._buckets[old_bucket]
+            prompts.discard(old_prompt)
+            if not prompts:
+                del self._buckets[old_bucket]
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+        self._buckets.clear()
+
+
+__all__ = ["SemanticLLMCache"]
@@ -20,6 +20,8 @@ class LLMConfig:
         temperature: Sampling temperature (0.0-2.0)
         max_tokens: Maximum tokens to generate
         timeout_ms: Request timeout in milliseconds
+        prompt_cache_key: Send a ``prompt_cache_key`` with cacheable system
+            prompts (OpenAI); enable only for endpoints that accept the field
     """
 
     base_url: str
@@ -28,6 +30,7 @@ class LLMConfig:
     temperature: float = 0.7
     max_tokens: int = 4096
     timeout_ms: int = 30000
+    prompt_cache_key: bool = False
 
 
 __all__ = ["LLMConfig"]
@@ -10,6 +10,8 @@ This is part of the Brain/Hand separation:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
 from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional
 
@@ -51,6 +53,7 @@ class LLMProvider:
         temperature=0.7,
         max_tokens=4096,
         timeout_ms=30000,
+        prompt_cache_key=True,
     )
 
     LOCAL = LLMConfig(
@@ -123,6 +126,7 @@ class LLMProvider:
             max_tokens = 4096
             temperature = 0.7
             timeout_sec = 30
+            prompt_cache_key = false  # true only for endpoints that accept it
         """
         # Try to load from project config first
         if provider_name in project_config.llm_providers:
@@ -136,6 +140,7 @@ class LLMProvider:
                 temperature=provider_cfg.temperature,
                 max_tokens=provider_cfg.max_tokens,
                 timeout_ms=provider_cfg.timeout_sec * 1000,
+                prompt_cache_key=provider_cfg.prompt_cache_key,
             )
 
             print(f"[loom.llm] Loaded provider '{provider_name}' from loom.toml")
@@ -145,6 +150,20 @@ class LLMProvider:
         print(f"[loom.llm] Provider '{provider_name}' not in loom.toml, using built-in preset")
         return cls.from_name(ctx, provider_name)
 
+    def _cache_hints(self, system: Optional[str]) -> dict:
+        """Request fields that let the provider reuse a cached system prefix.
+
+        OpenAI-compatible servers cache a repeated prompt prefix on their own
+        (DeepSeek context caching, vLLM prefix caching); the system message
+        always goes first so the prefix is stable. With
+        ``config.prompt_cache_key`` set, OpenAI's ``prompt_cache_key`` routing
+        hint is added so requests sharing a system prompt land on the same
+        cache. It is off by default, as strict servers reject unknown fields.
+        """
+        if not system or not self.config.prompt_cache_key:
+            return {}
+        return {"prompt_cache_key": hashlib.sha256(system.encode()).hexdigest()[:32]}
+
     async def generate(
         self,
         prompt: str,
@@ -153,6 +172,7 @@ class LLMProvider:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         timeout_ms: Optional[int] = None,
+        system_cacheable: bool = False,
     ) -> str:
         """Generate text completion via direct HTTP call.
 
@@ -162,6 +182,8 @@ class LLMProvider:
             temperature: Override default temperature
             max_tokens: Override default max tokens
             timeout_ms: Override default timeout
+            system_cacheable: The system prompt is reused across calls, so ask
+                the provider to cache its prefill (see _cache_hints)
 
         Returns:
             Generated text
@@ -169,6 +191,126 @@ class LLMProvider:
         Raises:
             RuntimeError: If LLM call fails
         """
+        choices = await self._complete(
+            prompt,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout_ms=timeout_ms,
+            n=1,
+            system_cacheable=system_cacheable,
+        )
+        return choices[0]
+
+    async def generate_candidates(
+        self,
+        prompt: str,
+        *,
+        n: int,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout_ms: Optional[int] = None,
+        system_cacheable: bool = False,
+    ) -> list[str]:
+        """Sample several completions for the same prompt in one request.
+
+        Uses the chat completions ``n`` parameter, so the prompt is processed
+        once for all candidates. Providers that ignore ``n`` return a single
+        candidate.
+
+        Args:
+            prompt: User prompt/input
+            n: Number of candidates to sample
+            system: Optional system prompt
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            timeout_ms: Override default timeout
+            system_cacheable: The system prompt is reused across calls, so ask
+                the provider to cache its prefill (see _cache_hints)
+
+        Returns:
+            Generated texts, in the order the provider returned them
+
+        Raises:
+            RuntimeError: If LLM call fails
+        """
+        return await self._complete(
+            prompt,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout_ms=timeout_ms,
+            n=n,
+            system_cacheable=system_cacheable,
+        )
+
+    async def generate_batch(
+        self,
+        prompts: list[str],
+        *,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        timeout_ms: Optional[int] = None,
+        system_cacheable: bool = False,
+    ) -> list[str]:
+        """Generate completions for several prompts that share settings.
+
+        The requests go out concurrently over one HTTP client, so the batch
+        shares pooled connections instead of setting one up per prompt, and
+        servers with continuous batching (e.g. vLLM) decode them together.
+
+        Args:
+            prompts: User prompts
+            system: Optional system prompt shared by every prompt
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            timeout_ms: Override default timeout
+            system_cacheable: The system prompt is reused across calls, so ask
+                the provider to cache its prefill (see _cache_hints)
+
+        Returns:
+            Generated texts, one per prompt, in order
+
+        Raises:
+            RuntimeError: If any LLM call fails
+        """
+        timeout = (timeout_ms or self.config.timeout_ms) / 1000.0
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            results = await asyncio.gather(
+                *(
+                    self._complete(
+                        prompt,
+                        system=system,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        timeout_ms=timeout_ms,
+                        n=1,
+                        system_cacheable=system_cacheable,
+                        client=client,
+                    )
+                    for prompt in prompts
+                )
+            )
+        return [choices[0] for choices in results]
+
+    async def _complete(
+        self,
+        prompt: str,
+        *,
+        system: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        timeout_ms: Optional[int],
+        n: int,
+        system_cacheable: bool = False,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> list[str]:
+        """Make one chat completions call and return the text of every choice.
+
+        Uses ``client`` when given, otherwise a client for just this call.
+        """
         temp = temperature if temperature is not None else self.config.temperature
         tokens = max_tokens or self.config.max_tokens
         timeout = (timeout_ms or self.config.timeout_ms) / 1000.0  # Convert to seconds
@@ -181,6 +323,7 @@ class LLMProvider:
                 "llm.model": self.config.model,
                 "llm.temperature": temp,
                 "llm.max_tokens": tokens,
+                "llm.n": n,
                 "llm.prompt.length": len(prompt),
                 "llm.system.length": len(system) if system else 0,
                 "agent.id": self.ctx.agent_id if self.ctx else "unknown",
@@ -200,6 +343,11 @@ class LLMProvider:
                     "temperature": temp,
                     "max_tokens": tokens,
                 }
+                # Only sent when sampling, as not every provider accepts it
+                if n > 1:
+                    payload["n"] = n
+                if system_cacheable:
+                    payload.update(self._cache_hints(system))
 
                 # Build headers
                 headers = {"Content-Type": "application/json"}
@@ -209,16 +357,23 @@ class LLMProvider:
                 # Make direct HTTP call
                 url = f"{self.config.base_url.rstrip('/')}/chat/completions"
 
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.post(url, json=payload, headers=headers)
-                    response.raise_for_status()
-                    result = response.json()
+                if client is None:
+                    async with httpx.AsyncClient(timeout=timeout) as client:
+                        response = await client.post(url, json=payload, headers=headers)
+                else:
+                    response = await client.post(
+                        url, json=payload, headers=headers, timeout=timeout
+                    )
+                response.raise_for_status()
+                result = response.json()
 
                 # Extract generated text
-                generated_text = result["choices"][0]["message"]["content"]
+                choices = [choice["message"]["content"] for choice in result["choices"]]
+                if not choices:
+                    raise RuntimeError("LLM returned no choices")
 
                 # Record success metrics
-                span.set_attribute("llm.response.length", len(generated_text))
+                span.set_attribute("llm.response.length", len(choices[0]))
                 span.set_attribute("llm.status", "success")
                 if "usage" in result:
                     span.set_attribute(
@@ -229,7 +384,7 @@ class LLMProvider:
                     )
                 span.set_status(trace.Status(trace.StatusCode.OK))
 
-                return generated_text
+                return choices
 
             except httpx.HTTPStatusError as e:
                 error_msg = f"LLM HTTP error {e.response.status_code}: {e.response.text}"
@@ -251,6 +406,7 @@ class LLMProvider:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         timeout_ms: Optional[int] = None,
+        system_cacheable: bool = False,
     ) -> AsyncIterator[str]:
         """Generate text completion with streaming via direct HTTP call.
 
@@ -260,6 +416,8 @@ class LLMProvider:
             temperature: Override default temperature
             max_tokens: Override default max tokens
             timeout_ms: Override default timeout
+            system_cacheable: The system prompt is reused across calls, so ask
+                the provider to cache its prefill (see _cache_hints)
 
         Yields:
             Text chunks as they are generated
@@ -285,6 +443,8 @@ class LLMProvider:
             "max_tokens": tokens,
             "stream": True,
         }
+        if system_cacheable:
+            payload.update(self._cache_hints(system))
 
         # Build headers
         headers = {"Content-Type": "application/json"}
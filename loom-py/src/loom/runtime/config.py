@@ -30,18 +30,35 @@ from __future__ import annotations
 import ast
 import os
 import re
-import sys
+import tomllib
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
-if sys.version_info >= (3, 11):
-    import tomllib as toml  # type: ignore
-else:
-    try:
-        import tomli as toml  # type: ignore
-    except ImportError:
-        toml = None  # type: ignore
+# Raw parsed loom.toml keyed by resolved path -> (st_mtime_ns, st_size, data)
+_TOML_CACHE: dict[str, tuple[int, int, dict]] = {}
+
+
+def _read_toml(path: Path) -> dict:
+    """Parse a TOML file, reusing the previous parse until mtime or size changes.
+
+    The returned dict is shared with the cache and must not be mutated;
+    ``_expand_env_vars`` builds a fresh structure from it.
+    """
+    st = path.stat()
+    key = str(path.resolve())
+    cached = _TOML_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    _TOML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _forget_toml(path: Path) -> None:
+    """Drop the cached parse of ``path``; call after writing the file."""
+    _TOML_CACHE.pop(str(path.resolve()), None)
 
 
 def _load_env_file(env_path: Path) -> None:
@@ -115,6 +132,7 @@ class LLMProviderConfig:
     max_tokens: int = 2048
     temperature: float = 0.7
     timeout_sec: int = 30
+    prompt_cache_key: bool = False  # see LLMConfig.prompt_cache_key
     extra: dict[str, Any] = field(default_factory=dict)
 
 
@@ -173,11 +191,6 @@ class ProjectConfig:
         if not path.exists():
             return cls()
 
-        if toml is None:
-            raise ImportError(
-                "tomli is required for Python < 3.11. Install with: pip install tomli"
-            )
-
         # Load .env files - search up the directory tree
         env_search_paths = [
             path.parent / ".env",  # Same dir as loom.toml
@@ -197,7 +210,7 @@ class ProjectConfig:
                 break
 
         try:
-            raw_data = toml.loads(path.read_text(encoding="utf-8"))
+            raw_data = _read_toml(path)
             # Expand environment variables in the entire config
             data = _expand_env_vars(raw_data)
         except Exception as e:
@@ -245,6 +258,7 @@ class ProjectConfig:
                     max_tokens=provider_data.get("max_tokens", 2048),
                     temperature=provider_data.get("temperature", 0.7),
                     timeout_sec=provider_data.get("timeout_sec", 30),
+                    prompt_cache_key=provider_data.get("prompt_cache_key", False),
                     extra=provider_data.get("extra", {}),
                 )
 
@@ -12,6 +12,9 @@ from typing import Any, Callable, Optional
 
 from pydantic import BaseModel, create_model
 
+# Marks models that have not been derived from the function signature yet
+_UNRESOLVED: Any = object()
+
 
 class Tool:
     """Represents a registered tool with its metadata and handler function.
@@ -22,6 +25,10 @@ class Tool:
         func: The underlying Python function
         input_model: Pydantic model for input validation
         output_model: Pydantic model for output (if specified)
+
+    Models not passed explicitly are derived from the function signature on
+    first access, so tools that are declared but never registered or invoked
+    never pay for pydantic model construction.
     """
 
     def __init__(
@@ -29,14 +36,35 @@ class Tool:
         name: str,
         description: str,
         func: Callable[..., Any],
-        input_model: Optional[type[BaseModel]],
-        output_model: Optional[type[BaseModel]],
+        input_model: Optional[type[BaseModel]] = _UNRESOLVED,
+        output_model: Optional[type[BaseModel]] = _UNRESOLVED,
     ):
         self.name = name
         self.description = description
         self.func = func
-        self.input_model = input_model
-        self.output_model = output_model
+        self._input_model = input_model
+        self._output_model = output_model
+
+    def _resolve_models(self) -> None:
+        input_model, output_model = _model_from_signature(self.func)
+        if self._input_model is _UNRESOLVED:
+            self._input_model = input_model
+        if self._output_model is _UNRESOLVED:
+            self._output_model = output_model
+
+    @property
+    def input_model(self) -> Optional[type[BaseModel]]:
+        """Pydantic model for input validation, built on first access."""
+        if self._input_model is _UNRESOLVED:
+            self._resolve_models()
+        return self._input_model
+
+    @property
+    def output_model(self) -> Optional[type[BaseModel]]:
+        """Pydantic model for output, taken from the return annotation."""
+        if self._output_model is _UNRESOLVED:
+            self._resolve_models()
+        return self._output_model
 
     @property
     def parameters_schema(self) -> str:
@@ -46,6 +74,42 @@ class Tool:
         return "{}"
 
 
+def _signature_fields(func: Callable[..., Any]) -> Optional[tuple[dict[str, Any], Any]]:
+    """Read parameter annotations/defaults straight from the code object.
+
+    Much cheaper than ``inspect.signature`` for plain functions. Returns None
+    when the fast path does not apply (wrapped callables, ``*args``/``**kwargs``,
+    objects without a code object) so the caller falls back to ``inspect``.
+    """
+    if hasattr(func, "__wrapped__"):
+        return None
+    code = getattr(func, "__code__", None)
+    if code is None or code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+        return None
+
+    ann = getattr(func, "__annotations__", None) or {}
+    nargs = code.co_argcount
+    names = code.co_varnames[: nargs + code.co_kwonlyargcount]
+    defaults = func.__defaults__ or ()
+    kwdefaults = func.__kwdefaults__ or {}
+    first_default = nargs - len(defaults)
+
+    fields = {}
+    for i, name in enumerate(names):
+        if name == "self":
+            continue
+        if i < nargs:
+            default = defaults[i - first_default] if i >= first_default else ...
+        else:
+            default = kwdefaults.get(name, ...)
+        if name in ann:
+            field_ann = ann[name]
+        else:
+            field_ann = str if default is ... else type(default)
+        fields[name] = (field_ann, default)
+    return fields, ann.get("return", inspect.Signature.empty)
+
+
 def _model_from_signature(
     func: Callable[..., Any],
 ) -> tuple[Optional[type[BaseModel]], Optional[type[BaseModel]]]:
@@ -57,22 +121,26 @@ def _model_from_signature(
     Returns:
         (input_model, output_model) tuple
     """
-    sig = inspect.signature(func)
-    fields = {}
-    for name, param in sig.parameters.items():
-        if name == "self":
-            continue
-        ann = (
-            param.annotation
-            if param.annotation is not inspect.Parameter.empty
-            else (str if param.default is inspect.Parameter.empty else type(param.default))
-        )
-        default = ... if param.default is inspect.Parameter.empty else param.default
-        fields[name] = (ann, default)
+    parsed = _signature_fields(func)
+    if parsed is not None:
+        fields, return_ann = parsed
+    else:
+        sig = inspect.signature(func)
+        fields = {}
+        for name, param in sig.parameters.items():
+            if name == "self":
+                continue
+            ann = (
+                param.annotation
+                if param.annotation is not inspect.Parameter.empty
+                else (str if param.default is inspect.Parameter.empty else type(param.default))
+            )
+            default = ... if param.default is inspect.Parameter.empty else param.default
+            fields[name] = (ann, default)
+        return_ann = sig.return_annotation
     input_model = create_model(f"{func.__name__.capitalize()}Input", **fields) if fields else None
 
     # Output model: from return annotation if it's a BaseModel subtype
-    return_ann = sig.return_annotation
     output_model = None
     if return_ann is not inspect.Signature.empty:
         try:
@@ -104,13 +172,10 @@ def tool(name: str, description: str = ""):
     """
 
     def wrapper(func: Callable[..., Any]):
-        input_model, output_model = _model_from_signature(func)
         t = Tool(
             name=name,
             description=description or func.__doc__ or "",
             func=func,
-            input_model=input_model,
-            output_model=output_model,
         )
         func.__loom_tool__ = t
         return func
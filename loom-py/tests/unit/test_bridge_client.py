@@ -0,0 +1,104 @@
+"""Tests for BridgeClient channel setup."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from loom.bridge import client as bridge_client
+
+
+@pytest.mark.asyncio
+async def test_connect_passes_channel_options(monkeypatch):
+    """Test the channel is created once with the module's channel options."""
+    calls = []
+
+    def fake_channel(address, options=None):
+        calls.append((address, options))
+        return MagicMock()
+
+    monkeypatch.setattr(bridge_client.grpc.aio, "insecure_channel", fake_channel)
+    client = bridge_client.BridgeClient("127.0.0.1:1")
+
+    await client.connect()
+    await client.connect()
+
+    assert calls == [("127.0.0.1:1", bridge_client._CHANNEL_OPTIONS)]
+
+
+@pytest.mark.asyncio
+async def test_shared_client_refcount(monkeypatch):
+    """Test shared clients are reused per address and closed by the last holder."""
+    monkeypatch.setattr(bridge_client.grpc.aio, "insecure_channel", lambda *a, **k: MagicMock())
+    closed = []
+
+    async def fake_close(self):
+        closed.append(self.address)
+
+    monkeypatch.setattr(bridge_client.BridgeClient, "close", fake_close)
+
+    first = await bridge_client.get_shared_client("127.0.0.1:2")
+    second = await bridge_client.get_shared_client("127.0.0.1:2")
+    other = await bridge_client.get_shared_client("127.0.0.1:3")
+    assert first is second and first is not other
+
+    await bridge_client.release_shared_client(first)
+    assert closed == []
+    await bridge_client.release_shared_client(second)
+    assert closed == ["127.0.0.1:2"]
+
+    await bridge_client.release_shared_client(other)
+    assert bridge_client._CLIENTS == {}
+
+
+def test_shared_client_usable_from_successive_loops(monkeypatch):
+    """Test contended get_shared_client calls work from more than one event loop."""
+    import asyncio
+
+    async def slow_connect(self):
+        await asyncio.sleep(0)  # let the other callers contend
+
+    monkeypatch.setattr(bridge_client.BridgeClient, "connect", slow_connect)
+    monkeypatch.setattr(bridge_client.BridgeClient, "close", AsyncMock())
+
+    async def contend():
+        clients = await asyncio.gather(
+            *(bridge_client.get_shared_client("127.0.0.1:4") for _ in range(3))
+        )
+        for client in clients:
+            await bridge_client.release_shared_client(client)
+        return clients
+
+    for _ in range(2):
+        first, *rest = asyncio.run(contend())
+        assert all(client is first for client in rest)
+    assert bridge_client._CLIENTS == {}
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_reuses_request():
+    """Test heartbeats send the same empty request instance every time."""
+    client = bridge_client.BridgeClient("127.0.0.1:1")
+    client._stub = MagicMock(Heartbeat=AsyncMock())
+
+    await client.heartbeat()
+    await client.heartbeat()
+
+    first, second = (c.args[0] for c in client._stub.Heartbeat.call_args_list)
+    assert first is second
+    assert first.ByteSize() == 0
+
+
+def test_client_import_skips_unused_protos():
+    """Test importing the client loads only the Bridge service protos."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, loom.bridge.client as c; "
+        "print('loom.bridge.proto.generated.memory_pb2' in sys.modules); "
+        "c.pb_memory; "
+        "print('loom.bridge.proto.generated.memory_pb2' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert out.stdout.split() == ["False", "True"]
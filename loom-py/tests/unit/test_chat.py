@@ -0,0 +1,384 @@
+"""Tests for the chat CLI rendering helpers."""
+
+import os
+
+import pytest
+
+from loom.cli import chat
+
+
+def test_terminal_width_cached_until_resize(monkeypatch):
+    """Test the terminal is queried once and re-queried after SIGWINCH."""
+    calls = []
+
+    def fake_size(fallback):
+        calls.append(fallback)
+        return os.terminal_size((100 + len(calls), 24))
+
+    monkeypatch.setattr(chat.shutil, "get_terminal_size", fake_size)
+    monkeypatch.setattr(chat, "_install_sigwinch_handler", lambda: True)
+    monkeypatch.setattr(chat, "_CACHED_WIDTH", None)
+
+    assert chat.get_terminal_width() == 101
+    assert chat.get_terminal_width() == 101
+    assert len(calls) == 1
+
+    chat._invalidate_on_sigwinch()
+    assert chat.get_terminal_width() == 102
+
+
+def test_terminal_width_uncached_without_handler(monkeypatch):
+    """Test every call queries the terminal when no resize signal is available."""
+    calls = []
+
+    def fake_size(fallback):
+        calls.append(fallback)
+        return os.terminal_size((90, 24))
+
+    monkeypatch.setattr(chat.shutil, "get_terminal_size", fake_size)
+    monkeypatch.setattr(chat, "_install_sigwinch_handler", lambda: False)
+    monkeypatch.setattr(chat, "_CACHED_WIDTH", None)
+
+    chat.get_terminal_width()
+    chat.get_terminal_width()
+    assert len(calls) == 2
+
+
+class _RecordingStdout:
+    """Minimal stdout stand-in that records each write call."""
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(text)
+
+    def flush(self):
+        pass
+
+
+def test_thinking_step_single_write(monkeypatch):
+    """Test a rendered step reaches stdout in one write call."""
+    out = _RecordingStdout()
+    monkeypatch.setattr(chat.sys, "stdout", out)
+
+    step = {
+        "reasoning": "look it up",
+        "tool_call": {"tool": "web:search", "args": {"query": "loom"}},
+        "observation": {"success": True, "output": "line one\nline two"},
+    }
+    chat.print_thinking_step(step, 1, width=60)
+
+    assert len(out.writes) == 1
+    assert "web:search" in out.writes[0] and "line two" in out.writes[0]
+    assert out.writes[0].endswith("┘" + chat.Colors.RESET + "\n")
+
+
+def test_wrap_text():
+    """Test wrapping, indentation, whitespace collapsing and long words."""
+    assert chat.wrap_text("one  two\nthree", 9) == "one two\nthree"
+    assert chat.wrap_text("alpha beta", 10, "  ") == "  alpha\n  beta"
+    assert chat.wrap_text("supercalifragilistic ok", 10) == "supercalifragilistic\nok"
+    assert chat.wrap_text("", 20, "   ") == "   "
+
+
+def test_stream_writer_coalesces_chunks(monkeypatch):
+    """Test chunks are buffered until a newline or explicit flush."""
+    out = _RecordingStdout()
+    monkeypatch.setattr(chat.sys, "stdout", out)
+
+    writer = chat.make_stream_writer(min_flush_interval=60, prefix="<", suffix=">")
+    writer("Hel")
+    writer("lo")
+    assert out.writes == []
+
+    writer(" world\n")
+    writer("tail")
+    writer.flush()
+    assert out.writes == ["<Hello world\n>", "<tail>"]
+
+
+def test_chat_session_history_context():
+    """Test history storage, context window and clearing."""
+    session = chat.ChatSession()
+    for i in range(4):
+        session.append_message("user", f"q{i}")
+        session.append_message("assistant", f"a{i}")
+
+    assert list(session._context_lines) == [
+        "Assistant: a1",
+        "User: q2",
+        "Assistant: a2",
+        "User: q3",
+        "Assistant: a3",
+    ]
+    assert session.conversation_history[-1] == {"role": "assistant", "content": "a3"}
+    assert len(session.conversation_history) == 8
+
+    session.clear_history()
+    assert session.conversation_history == []
+    assert not session._context_lines
+
+
+def test_chat_session_history_bounds():
+    """Test history evicts the oldest messages by count and by characters."""
+    session = chat.ChatSession(max_history=3)
+    for i in range(5):
+        session.append_message("user", f"m{i}")
+
+    assert session.max_history == 3
+    assert [m["content"] for m in session.conversation_history] == ["m2", "m3", "m4"]
+    assert session._history_chars == 6
+
+    session = chat.ChatSession(max_history_chars=10)
+    for content in ("aaaa", "bbbb", "cccc"):
+        session.append_message("user", content)
+    assert [m["content"] for m in session.conversation_history] == ["bbbb", "cccc"]
+
+    session.append_message("assistant", "x" * 20)
+    assert [m["content"] for m in session.conversation_history] == ["x" * 20]
+
+
+def test_safe_filename_table():
+    """Test report filenames keep alphanumerics (incl. non-ASCII) and "-_ "."""
+    topic = "AI/agents: café-style_frameworks? " + "x" * 60
+    expected = "".join(c if c.isalnum() or c in "-_ " else "_" for c in topic)[:50]
+
+    assert topic[:50].translate(chat._SAFE_FILENAME_CHARS) == expected
+
+
+def test_serialize_result():
+    """Test CognitiveResult is converted to the ChatSession dict shape."""
+    from loom.cognitive.types import CognitiveResult, Observation, ThoughtStep, ToolCall
+
+    result = CognitiveResult(
+        answer="done",
+        steps=[
+            ThoughtStep(
+                step=1,
+                reasoning="check",
+                tool_call=ToolCall(name="fs:read_file", arguments={"path": "a"}),
+                observation=Observation(tool_name="fs:read_file", success=True, output="x"),
+            ),
+            ThoughtStep(step=2, reasoning="answer"),
+        ],
+        iterations=2,
+        total_latency_ms=15,
+    )
+
+    assert chat._serialize_result(result) == {
+        "answer": "done",
+        "steps": [
+            {
+                "step": 1,
+                "reasoning": "check",
+                "tool_call": {"tool": "fs:read_file", "args": {"path": "a"}},
+                "observation": {"success": True, "output": "x", "error": None},
+            },
+            {"step": 2, "reasoning": "answer", "tool_call": None, "observation": None},
+        ],
+        "iterations": 2,
+        "success": True,
+        "latency_ms": 15,
+    }
+
+
+async def test_async_line_reader(monkeypatch):
+    """Test stdin is read off the event loop and EOF propagates."""
+    lines = iter(["hello"])
+
+    def fake_input(prompt):
+        try:
+            return next(lines)
+        except StopIteration:
+            raise EOFError from None
+
+    monkeypatch.setattr("builtins.input", fake_input)
+    reader = chat._AsyncLineReader()
+
+    assert await reader.readline("> ") == "hello"
+    with pytest.raises(EOFError):
+        await reader.readline("> ")
+
+
+async def test_stream_writer_timer_and_size_flush(monkeypatch):
+    """Test a paused stream is flushed by timer and large bursts by size."""
+    import asyncio
+
+    out = _RecordingStdout()
+    monkeypatch.setattr(chat.sys, "stdout", out)
+
+    writer = chat.make_stream_writer(min_flush_interval=0.01)
+    writer("abc")
+    assert out.writes == []
+    await asyncio.sleep(0.05)
+    assert out.writes == ["abc"]
+
+    sized = chat.make_stream_writer(min_flush_interval=60, max_pending=8)
+    sized("0123")
+    sized("456789")
+    assert out.writes == ["abc", "0123456789"]
+    sized.flush()
+
+
+def test_print_history(monkeypatch):
+    """Test history rows are numbered, tagged and truncated in one write."""
+    out = _RecordingStdout()
+    monkeypatch.setattr(chat.sys, "stdout", out)
+
+    chat.print_history(["user", "assistant"], ["hi", "x" * 80])
+
+    assert len(out.writes) == 1
+    lines = out.writes[0].split("\n")
+    assert "[1]" in lines[2] and "You:" in lines[2] and lines[2].endswith(" hi")
+    assert "[2]" in lines[3] and "AI:" in lines[3] and lines[3].endswith("x" * 60 + "...")
+
+
+@pytest.mark.asyncio
+async def test_chat_commits_turn_only_on_completion():
+    """Test a failed turn leaves history alone and a completed one commits both messages."""
+    from loom.cognitive.types import CognitiveResult
+
+    class _Cognitive:
+        def __init__(self):
+            self.calls = []
+
+        async def run(self, goal, context=None):
+            self.calls.append(context)
+            if goal == "boom":
+                raise RuntimeError("boom")
+            return CognitiveResult(answer=f"re: {goal}", iterations=1, success=True)
+
+    session = chat.ChatSession()
+    session.cognitive = _Cognitive()
+
+    with pytest.raises(RuntimeError):
+        await session.chat("boom")
+    assert session.conversation_history == []
+
+    await session.chat("hi")
+    await session.chat("again")
+    assert [m["content"] for m in session.conversation_history] == [
+        "hi",
+        "re: hi",
+        "again",
+        "re: again",
+    ]
+    assert session.cognitive.calls == [None, None, ["User: hi", "Assistant: re: hi"]]
+
+
+def test_print_exc_single_write(monkeypatch):
+    """Test the traceback goes to stderr in a single write."""
+    err = _RecordingStdout()
+    monkeypatch.setattr(chat.sys, "stderr", err)
+
+    try:
+        raise ValueError("bad")
+    except ValueError:
+        chat._print_exc()
+
+    assert len(err.writes) == 1
+    assert err.writes[0].startswith("Traceback") and "ValueError: bad" in err.writes[0]
+
+
+@pytest.mark.asyncio
+async def test_command_dispatch(capsys):
+    """Test slash commands map to handlers that report whether to keep going."""
+    session = chat.ChatSession(streaming=True)
+
+    assert await chat._COMMANDS["/stream"](session, "/stream") is True
+    assert session.streaming is False
+    assert await chat._COMMANDS["/research"](session, "/research") is True
+    assert "Usage: /research" in capsys.readouterr().out
+    assert chat._COMMANDS["/exit"] is chat._COMMANDS["/q"] is chat._COMMANDS["/quit"]
+    assert await chat._COMMANDS["/quit"](session, "/quit") is False
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_runs_callbacks_in_order():
+    """Test chunks and steps reach the callbacks in stream order."""
+    from loom.cognitive.types import CognitiveResult, ThoughtStep
+
+    step = ThoughtStep(step=1, reasoning="r")
+
+    class _Cognitive:
+        async def run_stream(self, goal, context=None):
+            for piece in ("a", "b", "c"):
+                yield piece
+            yield step
+            yield "d"
+            yield CognitiveResult(answer="done", iterations=1, success=True)
+
+    session = chat.ChatSession()
+    session.cognitive = _Cognitive()
+    seen = []
+
+    result = await session.chat_stream("hi", on_chunk=seen.append, on_step=seen.append)
+
+    assert seen == ["a", "b", "c", step, "d"]
+    assert result["answer"] == "done"
+
+
+@pytest.mark.parametrize(("env", "colored"), [({}, False), ({"FORCE_COLOR": "1"}, True)])
+def test_colors_blank_when_piped(env, colored):
+    """Test piped output drops ANSI codes from the palette and prebuilt strings."""
+    import subprocess
+    import sys
+
+    code = "from loom.cli import chat; print(repr(chat.Colors.RED + chat._YOU_PROMPT))"
+    env = {k: v for k, v in os.environ.items() if k not in ("FORCE_COLOR", "NO_COLOR")} | env
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    ).stdout
+
+    assert ("\\x1b[" in out) is colored
+    assert "You ▶" in out
+
+
+@pytest.mark.asyncio
+async def test_research_command_output_is_batched(monkeypatch):
+    """Test /research writes its header, each progress line and its report in one write each."""
+    out = _RecordingStdout()
+    monkeypatch.setattr(chat.sys, "stdout", out)
+
+    class _Session:
+        research_timeout = None
+
+        async def research(self, topic, on_progress=None):
+            on_progress("step 1")
+            on_progress("step 2")
+            return {"summary": "sum", "iterations": 2, "report_path": None}
+
+    assert await chat._cmd_research(_Session(), "/research agents") is True
+
+    assert len(out.writes) == 4
+    assert "Topic: agents" in out.writes[0]
+    assert "step 1" in out.writes[1] and "step 2" in out.writes[2]
+    assert "Total iterations: 2" in out.writes[3] and "sum" in out.writes[3]
+
+
+@pytest.mark.asyncio
+async def test_research_command_times_out_and_cancels(capsys):
+    """Test a research run past its budget is cancelled and the REPL continues."""
+    import asyncio
+    import signal
+
+    cancelled = asyncio.Event()
+
+    class _Session:
+        research_timeout = 0.01
+
+        async def research(self, topic, on_progress=None):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+    previous = signal.getsignal(signal.SIGINT)
+
+    assert await chat._cmd_research(_Session(), "/research slow") is True
+
+    assert cancelled.is_set()
+    assert "timed out after 0.01s" in capsys.readouterr().out
+    assert signal.getsignal(signal.SIGINT) is previous
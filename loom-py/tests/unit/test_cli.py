@@ -0,0 +1,338 @@
+"""Tests for the loom CLI."""
+
+import importlib
+import os
+import sys
+
+import pytest
+
+from loom.cli.main import (
+    _find_cargo,
+    _load_project_config,
+    _pick_free_port,
+    _toml_dumps,
+    _toml_dumps_minimal,
+    _toml_format_value,
+    _write_project_bridge,
+    _write_status,
+    build_parser,
+    cmd_init,
+    cmd_run,
+)
+
+# ``loom.cli.main`` the attribute is the entry-point function, not the module
+cli_main = importlib.import_module("loom.cli.main")
+
+
+def test_parser_builds_only_requested_subcommand():
+    """Test that a known subcommand only builds its own subparser."""
+    parser = build_parser(["init", "demo"])
+    subparsers = parser._subparsers._group_actions[0]  # type: ignore[union-attr]
+
+    assert set(subparsers.choices) == {"init", "new", "create"}
+    args = parser.parse_args(["init", "demo"])
+    assert args.func is cmd_init
+    assert args.path == "demo"
+
+
+def test_parser_builds_all_subcommands_for_help():
+    """Test that help or unknown commands see every subcommand."""
+    for argv in ([], ["--help"], ["unknown"]):
+        parser = build_parser(argv)
+        subparsers = parser._subparsers._group_actions[0]  # type: ignore[union-attr]
+        assert set(subparsers.choices) >= {"init", "run", "up", "dev", "chat"}
+
+
+def test_run_arguments():
+    """Test run subcommand defaults."""
+    argv = ["run", "project", "--logs"]
+    args = build_parser(argv).parse_args(argv)
+
+    assert args.func is cmd_run
+    assert args.script == "project"
+    assert args.logs is True
+    assert args.mode == "full"
+    assert args.dashboard_port == 3030
+
+
+def test_load_project_config_cached_until_file_changes(tmp_path):
+    """Test loom.toml parses are reused until the file changes."""
+    cfg_path = tmp_path / "loom.toml"
+    cfg_path.write_text('name = "demo"\n')
+
+    first = _load_project_config(tmp_path)
+    assert first == {"name": "demo"}
+    assert _load_project_config(tmp_path) is first
+
+    cfg_path.write_text('name = "renamed"\n')
+    assert _load_project_config(tmp_path) == {"name": "renamed"}
+
+
+def test_load_project_config_shares_runtime_cache(tmp_path):
+    """Test the CLI and runtime config loaders share one parse and its invalidation."""
+    from loom.runtime.config import _TOML_CACHE, _read_toml
+
+    cfg_path = tmp_path / "loom.toml"
+    cfg_path.write_text('name = "demo"\n')
+
+    assert _load_project_config(tmp_path) is _read_toml(cfg_path)
+
+    _write_project_bridge(tmp_path, "127.0.0.1:1234", "full", "latest")
+    assert str(cfg_path.resolve()) not in _TOML_CACHE
+
+
+def test_load_project_config_missing(tmp_path):
+    """Test a missing loom.toml yields an empty config."""
+    assert _load_project_config(tmp_path) == {}
+
+
+def test_write_project_bridge_preserves_keys(tmp_path):
+    """Test the bridge table is merged into an existing loom.toml."""
+    (tmp_path / "loom.toml").write_text('name = "demo"\n\n[bridge]\nextra = 1\n')
+    before = _load_project_config(tmp_path)
+
+    _write_project_bridge(tmp_path, "127.0.0.1:1234", "full", "latest")
+
+    assert before == {"name": "demo", "bridge": {"extra": 1}}
+    assert _load_project_config(tmp_path) == {
+        "name": "demo",
+        "bridge": {"extra": 1, "address": "127.0.0.1:1234", "mode": "full", "version": "latest"},
+    }
+
+
+def test_write_project_bridge_fresh_project(tmp_path):
+    """Test a missing loom.toml is written directly with just the bridge table."""
+    _write_project_bridge(tmp_path, "127.0.0.1:1234", "bridge-only", "v0.1.0")
+
+    assert _load_project_config(tmp_path) == {
+        "bridge": {"address": "127.0.0.1:1234", "mode": "bridge-only", "version": "v0.1.0"},
+    }
+
+
+def test_toml_writers_round_trip():
+    """Test both TOML writers produce output that parses back identically."""
+    tomllib = pytest.importorskip("tomllib")
+
+    cfg = {
+        "name": 'quote " and \\ backslash',
+        "banner": "line one\nline two\ttabbed",
+        "topics": ["a", "b"],
+        "debug": False,
+        "retries": 3,
+        "bridge": {"address": "127.0.0.1:50051", "ratio": 0.5},
+    }
+
+    assert tomllib.loads(_toml_dumps(cfg)) == cfg
+    assert tomllib.loads(_toml_dumps_minimal(cfg)) == cfg
+
+
+def test_toml_format_value_types():
+    """Test exact-type dispatch and the subclass fallback."""
+    import enum
+
+    class Level(enum.IntEnum):
+        HIGH = 2
+
+    assert _toml_format_value(True) == "true"
+    assert _toml_format_value(0) == "0"
+    assert _toml_format_value(("a", 1.5)) == '["a", 1.5]'
+    assert _toml_format_value(Level.HIGH) == str(Level.HIGH)
+    assert _toml_format_value(None) == '"None"'
+
+
+def test_run_script_in_process(tmp_path, monkeypatch):
+    """Test `loom run script.py` executes the script as __main__ in-process."""
+    script = tmp_path / "hello.py"
+    out = tmp_path / "out.txt"
+    script.write_text(
+        "import sys\n"
+        "if __name__ == '__main__':\n"
+        f"    open({str(out)!r}, 'w').write(sys.argv[0])\n"
+    )
+    monkeypatch.setattr(sys, "argv", ["loom"])
+    monkeypatch.setattr(sys, "path", list(sys.path))
+
+    argv = ["run", str(script)]
+    args = build_parser(argv).parse_args(argv)
+    args.func(args)
+
+    assert out.read_text() == str(script)
+
+
+def test_pick_free_port_is_bindable():
+    """Test the picked port can be bound again immediately."""
+    import socket
+
+    port = _pick_free_port()
+    assert 0 < port < 65536
+    with socket.socket() as s:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        s.bind(("127.0.0.1", port))
+
+
+def test_run_discovers_project_scripts(tmp_path, monkeypatch):
+    """Test project discovery of agents/*.py and the main entry point."""
+    from loom.runtime import orchestrator
+
+    (tmp_path / "agents").mkdir()
+    (tmp_path / "agents" / "b.py").write_text("")
+    (tmp_path / "agents" / "a.py").write_text("")
+    (tmp_path / "agents" / "notes.txt").write_text("")
+    (tmp_path / "agents" / "pkg.py").mkdir()
+    (tmp_path / "run.py").write_text("")
+    (tmp_path / "app.py").write_text("")
+
+    seen = {}
+
+    async def fake_run_orchestrator(config):
+        seen["config"] = config
+
+    monkeypatch.setattr(orchestrator, "run_orchestrator", fake_run_orchestrator)
+
+    argv = ["run", str(tmp_path)]
+    args = build_parser(argv).parse_args(argv)
+    args.func(args)
+
+    assert seen["config"].agent_scripts == [
+        tmp_path / "agents" / "a.py",
+        tmp_path / "agents" / "b.py",
+        tmp_path / "run.py",
+    ]
+
+
+def test_run_missing_project_dir(tmp_path):
+    """Test running a missing project directory exits with an error."""
+    argv = ["run", str(tmp_path / "missing")]
+    args = build_parser(argv).parse_args(argv)
+
+    with pytest.raises(SystemExit):
+        args.func(args)
+
+
+def test_init_writes_templates(tmp_path):
+    """Test init scaffolds agent.py and loom.toml."""
+    from loom.cli.main import TEMPLATE_AGENT, TEMPLATE_CONFIG
+
+    argv = ["init", str(tmp_path / "proj")]
+    args = build_parser(argv).parse_args(argv)
+    args.func(args)
+
+    assert (tmp_path / "proj" / "agent.py").read_text(encoding="utf-8") == TEMPLATE_AGENT
+    assert (tmp_path / "proj" / "loom.toml").read_text(encoding="utf-8") == TEMPLATE_CONFIG
+
+
+def test_init_aliases():
+    """Test new/create are aliases of init."""
+    for alias in ("new", "create"):
+        args = build_parser([alias, "proj"]).parse_args([alias, "proj"])
+        assert args.func is cmd_init
+        assert args.path == "proj"
+
+
+def test_find_cargo_persists_hits(tmp_path, monkeypatch):
+    """Test cargo lookups are cached on disk and stale entries are ignored."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    cargo = bin_dir / "cargo"
+    cargo.write_text("#!/bin/sh\n")
+    cargo.chmod(0o755)
+    cache_file = tmp_path / "cache" / "which.json"
+    monkeypatch.setattr(cli_main, "_which_cache_path", lambda: cache_file)
+    _find_cargo.cache_clear()
+
+    assert _find_cargo(str(bin_dir)) == str(cargo)
+    assert str(cargo) in cache_file.read_text()
+
+    # A cargo installed earlier on PATH changes that directory's mtime
+    _find_cargo.cache_clear()
+    rustup_dir = tmp_path / "rustup"
+    rustup_dir.mkdir()
+    path_env = os.pathsep.join([str(rustup_dir), str(bin_dir)])
+    assert _find_cargo(path_env) == str(cargo)
+    _find_cargo.cache_clear()
+    rustup_cargo = rustup_dir / "cargo"
+    rustup_cargo.write_text("#!/bin/sh\n")
+    rustup_cargo.chmod(0o755)
+    os.utime(rustup_dir, ns=(0, 1))
+    assert _find_cargo(path_env) == str(rustup_cargo)
+
+    # A cached path that is no longer executable falls back to a fresh lookup
+    _find_cargo.cache_clear()
+    cargo.unlink()
+    assert _find_cargo(str(bin_dir)) is None
+    _find_cargo.cache_clear()
+
+
+def test_write_status_flushes_once(capsys):
+    """Test buffered status lines are written together and the buffer reset."""
+    msgs = ["[loom] one", "[loom] two"]
+    _write_status(msgs)
+    _write_status(msgs)
+
+    assert capsys.readouterr().out == "[loom] one\n[loom] two\n"
+    assert msgs == []
+
+
+def test_toml_dumps_falls_back_without_tomli_w(monkeypatch):
+    """Test the minimal writer is used when tomli_w is unavailable."""
+    monkeypatch.setattr(cli_main, "_toml_writer", lambda: None)
+
+    assert _toml_dumps({"name": "demo"}) == _toml_dumps_minimal({"name": "demo"})
+
+
+def test_dev_execs_cargo(monkeypatch, capsys):
+    """Test `loom dev` replaces the process with cargo on POSIX."""
+    execed = []
+
+    class Execed(Exception):
+        pass
+
+    def fake_execvpe(*a):
+        execed.append(a)
+        raise Execed
+
+    monkeypatch.setattr(cli_main, "_find_cargo", lambda path: "/usr/bin/cargo")
+    monkeypatch.setattr(cli_main.os, "name", "posix")
+    monkeypatch.setattr(cli_main.os, "execvpe", fake_execvpe)
+
+    args = build_parser(["dev", "--port", "4321"]).parse_args(["dev", "--port", "4321"])
+    with pytest.raises(Execed):
+        args.func(args)
+
+    file, argv, env = execed[0]
+    assert file == "/usr/bin/cargo"
+    assert argv[1:] == ["run", "-p", "loom-bridge", "--bin", "loom-bridge-server"]
+    assert env["LOOM_BRIDGE_ADDR"] == "127.0.0.1:4321"
+    assert "Press Ctrl+C" in capsys.readouterr().out
+
+
+def test_cli_import_is_lazy():
+    """Test importing the CLI does not pull in the agent/gRPC stack."""
+    import subprocess
+
+    code = (
+        "import sys, loom.cli.main; "
+        "print(any(m in sys.modules for m in ('loom.agent', 'grpc', 'loom.cognitive')))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_dev_background_spawns_detached(monkeypatch, capsys):
+    """Test `loom dev --background` spawns cargo in a new session and returns."""
+    spawned = []
+
+    def fake_spawnp(file, argv, env, **kwargs):
+        spawned.append((file, argv, kwargs))
+        return 4242
+
+    monkeypatch.setattr(cli_main, "_find_cargo", lambda path: "/usr/bin/cargo")
+    monkeypatch.setattr(cli_main.os, "posix_spawnp", fake_spawnp, raising=False)
+
+    argv = ["dev", "--port", "4321", "--background"]
+    args = build_parser(argv).parse_args(argv)
+    args.func(args)
+
+    assert spawned[0][0] == "/usr/bin/cargo"
+    assert spawned[0][2] == {"setsid": True}
+    assert "PID 4242" in capsys.readouterr().out
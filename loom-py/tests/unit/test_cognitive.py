@@ -1,7 +1,9 @@
 """Unit tests for cognitive module - streaming and non-streaming."""
 
 import asyncio
+import json
 from typing import AsyncIterator
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -11,6 +13,13 @@ from loom.cognitive import (
     CognitiveResult,
     ThinkingStrategy,
     ThoughtStep,
+    WorkingMemory,
+)
+from loom.cognitive.loop import (
+    build_react_prompt,
+    extract_tool_call,
+    parse_react_response,
+    react_response_complete,
 )
 from loom.cognitive.types import Observation, ToolCall
 from loom.context import Step
@@ -87,6 +96,75 @@ class TestThoughtStepIntegration:
         assert thought.reduced_step is None
 
 
+# ============================================================================
+# Response Parsing Tests
+# ============================================================================
+
+
+class TestParseReactResponse:
+    """Tests for ReAct response parsing."""
+
+    def test_tool_call_with_nested_args(self):
+        """Test a JSON tool call with nested arguments is extracted whole."""
+        parsed = parse_react_response(
+            'Thought: write it. {"tool": "fs:write", "args": {"meta": {"a": 1}, "text": "}"}}'
+        )
+
+        assert parsed["type"] == "tool_call"
+        assert parsed["thought"] == "write it."
+        assert parsed["args"] == {"meta": {"a": 1}, "text": "}"}
+
+    def test_skips_invalid_json_before_tool_call(self):
+        """Test braces that are not valid JSON do not hide a later tool call."""
+        call = extract_tool_call('Use {x} here: {"action": "web:search", "input": {"q": "loom"}}')
+
+        assert call == {"tool": "web:search", "args": {"q": "loom"}}
+
+    def test_final_answer(self):
+        """Test only the first final answer is kept."""
+        parsed = parse_react_response("FINAL ANSWER: 42\nFINAL ANSWER: 42")
+
+        assert parsed == {"type": "final_answer", "content": "42"}
+
+    def test_response_complete(self):
+        """Test a partial response is complete only once the rest is unused."""
+        call = '{"tool": "web:search", "args": {"q": "loom"}}'
+
+        assert not react_response_complete("FINAL ANSWER: 4")
+        assert react_response_complete("FINAL ANSWER: 4\nThought")
+        assert not react_response_complete(f"Search. {call}", max_tool_calls=2)
+        assert react_response_complete(f"Search. {call}\nObservation:", max_tool_calls=2)
+        assert react_response_complete(f"Search. {call} {call}", max_tool_calls=2)
+
+
+class TestBuildReactPrompt:
+    """Tests for ReAct prompt building."""
+
+    def test_steps_formatted_once_with_json_args(self):
+        """Test cached step lines are reused and tool args render as JSON."""
+        steps = [
+            ThoughtStep(
+                step=1,
+                reasoning="look",
+                tool_call=ToolCall(name="fs:read", arguments={"path": "a.txt"}),
+                observation=Observation(tool_name="fs:read", success=True, output="hi"),
+            )
+        ]
+        step_lines = []
+
+        prompt = build_react_prompt("Goal", steps, step_lines=step_lines)
+        assert 'Action: fs:read({"path":"a.txt"})' in prompt
+        assert "Observation: hi" in prompt
+
+        step_lines[0][0] = "\nThought 1: cached"
+        steps.append(ThoughtStep(step=2, reasoning="done"))
+        prompt = build_react_prompt("Goal", steps, step_lines=step_lines)
+
+        assert len(step_lines) == 2
+        assert "Thought 1: cached" in prompt
+        assert "Thought 2: done" in prompt
+
+
 # ============================================================================
 # Mock Fixtures
 # ============================================================================
@@ -142,6 +220,7 @@ class MockLLMProvider:
         temperature: float = None,
         max_tokens: int = None,
         timeout_ms: int = None,
+        system_cacheable: bool = False,
     ) -> str:
         """Mock generate - returns next response in sequence."""
         if self._call_count < len(self.responses):
@@ -158,6 +237,7 @@ class MockLLMProvider:
         temperature: float = None,
         max_tokens: int = None,
         timeout_ms: int = None,
+        system_cacheable: bool = False,
     ) -> AsyncIterator[str]:
         """Mock streaming generate - yields chunks."""
         # Support multiple iterations with different responses
@@ -198,13 +278,14 @@ def cognitive_config():
 
 
 @pytest.fixture
-def cognitive_agent(mock_ctx, mock_llm, cognitive_config):
-    """Create a CognitiveAgent with mocks."""
+def cognitive_agent(mock_ctx, mock_llm, cognitive_config, tmp_path):
+    """Create a CognitiveAgent with mocks, offloading into a temp workspace."""
     return CognitiveAgent(
         ctx=mock_ctx,
         llm=mock_llm,
         config=cognitive_config,
         available_tools=["weather:get", "system:shell"],
+        workspace_path=tmp_path,
     )
 
 
@@ -234,6 +315,35 @@ class TestCognitiveAgentRun:
         assert result.iterations == 1
         assert len(result.steps) == 0
 
+    @pytest.mark.asyncio
+    async def test_run_single_shot_uses_response_cache(self, mock_ctx, mock_llm):
+        """Test single-shot answers repeated goals from the response cache."""
+        config = CognitiveConfig(
+            thinking_strategy=ThinkingStrategy.SINGLE_SHOT, cache_responses=True
+        )
+        agent = CognitiveAgent(ctx=mock_ctx, llm=mock_llm, config=config)
+        mock_llm.set_responses(["Four.", "Something else."])
+
+        first = await agent.run("What is 2+2?")
+        second = await agent.run("What is 2+2?")
+
+        assert first.answer == second.answer == "Four."
+        assert mock_llm._call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_run_single_shot_without_persist_memory(self, mock_ctx, mock_llm):
+        """Test stateless single-shot runs leave working memory untouched."""
+        config = CognitiveConfig(
+            thinking_strategy=ThinkingStrategy.SINGLE_SHOT, persist_memory=False
+        )
+        agent = CognitiveAgent(ctx=mock_ctx, llm=mock_llm, config=config)
+        mock_llm.set_responses(["Four."])
+
+        result = await agent.run("What is 2+2?", context=["math"])
+
+        assert result.answer == "Four."
+        assert len(agent.memory) == 0
+
     @pytest.mark.asyncio
     async def test_run_react_final_answer(self, cognitive_agent, mock_llm):
         """Test ReAct with immediate final answer."""
@@ -267,6 +377,201 @@ class TestCognitiveAgentRun:
         assert result.steps[0].observation is not None
         assert result.steps[0].observation.success is True
 
+    @pytest.mark.asyncio
+    async def test_tool_json_output_is_indented(self, cognitive_agent, mock_llm, mock_ctx):
+        """Test JSON tool results (str or bytes) are re-indented; other text is kept."""
+        mock_llm.set_responses(
+            [
+                '{"tool": "weather:get", "args": {}} {"tool": "system:shell", "args": {}}',
+                "FINAL ANSWER: Done.",
+            ]
+        )
+        mock_ctx.set_tool_result("weather:get", b'{"temp":"25C"}')
+        mock_ctx.set_tool_result("system:shell", "not json")
+
+        result = await cognitive_agent.run("Weather?")
+
+        assert result.steps[0].observation.output == '{\n  "temp": "25C"\n}'
+        assert result.steps[1].observation.output == "not json"
+
+    @pytest.mark.asyncio
+    async def test_large_tool_json_output_is_compact(self, cognitive_agent, mock_llm, mock_ctx):
+        """Test JSON results over the observation budget are not indented."""
+        mock_llm.set_responses(['{"tool": "weather:get", "args": {}}', "FINAL ANSWER: Done."])
+        mock_ctx.set_tool_result("weather:get", json.dumps({"rows": list(range(1000))}, indent=4))
+
+        result = await cognitive_agent.run("Weather?")
+
+        assert result.steps[0].observation.output.startswith('{"rows":[0,1,2,')
+
+    @pytest.mark.asyncio
+    async def test_tool_json_output_keeps_big_ints_and_nan(
+        self, cognitive_agent, mock_llm, mock_ctx
+    ):
+        """Test integers beyond 64 bits and NaN survive re-indenting unchanged."""
+        mock_llm.set_responses(['{"tool": "weather:get", "args": {}}', "FINAL ANSWER: Done."])
+        mock_ctx.set_tool_result("weather:get", '{"id": 123456789012345678901234567890, "v": NaN}')
+
+        result = await cognitive_agent.run("Weather?")
+
+        output = result.steps[0].observation.output
+        assert output == '{\n  "id": 123456789012345678901234567890,\n  "v": NaN\n}'
+
+    @pytest.mark.asyncio
+    async def test_run_react_executes_batched_tool_calls_concurrently(
+        self, cognitive_agent, mock_llm, mock_ctx
+    ):
+        """Test several tool calls in one response run together as one step."""
+        mock_llm.set_responses(
+            [
+                "Check both cities. "
+                '{"tool": "weather:get", "args": {"location": "Tokyo"}} '
+                '{"tool": "weather:get", "args": {"location": "Paris"}}',
+                "FINAL ANSWER: Both are sunny.",
+            ]
+        )
+        in_flight = []
+        peak = 0
+
+        async def tool(name, payload=None, timeout_ms=30000):
+            nonlocal peak
+            in_flight.append(name)
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(name)
+            return payload["location"]
+
+        mock_ctx.tool = tool
+
+        result = await cognitive_agent.run("Weather in Tokyo and Paris?")
+
+        assert peak == 2
+        assert [s.step for s in result.steps] == [1, 1]
+        assert [s.observation.output for s in result.steps] == ["Tokyo", "Paris"]
+
+    @pytest.mark.asyncio
+    async def test_run_react_orders_side_effecting_tool_calls(
+        self, cognitive_agent, mock_llm, mock_ctx
+    ):
+        """Test fs/shell calls in one response run alone, in the order issued."""
+        mock_llm.set_responses(
+            [
+                '{"tool": "weather:get", "args": {"location": "Tokyo"}} '
+                '{"tool": "system:shell", "args": {"command": "a"}} '
+                '{"tool": "system:shell", "args": {"command": "b"}}',
+                "FINAL ANSWER: Done.",
+            ]
+        )
+        events = []
+
+        async def tool(name, payload=None, timeout_ms=30000):
+            key = payload.get("command") or payload.get("location")
+            events.append(("start", key))
+            await asyncio.sleep(0.01)
+            events.append(("end", key))
+            return key
+
+        mock_ctx.tool = tool
+
+        result = await cognitive_agent.run("Run a then b")
+
+        assert events == [
+            ("start", "Tokyo"),
+            ("end", "Tokyo"),
+            ("start", "a"),
+            ("end", "a"),
+            ("start", "b"),
+            ("end", "b"),
+        ]
+        assert [s.observation.output for s in result.steps] == ["Tokyo", "a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_react_system_prompt_is_reused(self, cognitive_agent, mock_llm, monkeypatch):
+        """Test the system prompt is built up front and rebuilt only when tools change."""
+        import loom.cognitive.strategies as strategies
+
+        builds = []
+        build = strategies.build_react_system_prompt
+
+        def counting_build(*args, **kwargs):
+            builds.append(args)
+            return build(*args, **kwargs)
+
+        monkeypatch.setattr(strategies, "build_react_system_prompt", counting_build)
+
+        await cognitive_agent.run("First")
+        await cognitive_agent.run("Second")
+        assert builds == []
+
+        cognitive_agent.register_tool("web:search", "Search the web")
+        assert len(builds) == 1
+        await cognitive_agent.run("Third")
+        assert len(builds) == 1
+
+    @pytest.mark.asyncio
+    async def test_run_stream_react_stops_after_complete_response(self, mock_ctx, mock_llm):
+        """Test streamed ReAct stops decoding once the answer is terminated."""
+        config = CognitiveConfig(stream_react=True)
+        agent = CognitiveAgent(ctx=mock_ctx, llm=mock_llm, config=config)
+        consumed = []
+        chunks = ["FINAL ANSWER: 42", "\nThought: ", "more", "!"]
+
+        async def tracking_stream(**kwargs):
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        mock_llm.generate_stream = tracking_stream
+
+        result = await agent.run("Answer?")
+
+        assert result.answer == "42"
+        assert consumed == ["FINAL ANSWER: 42", "\nThought: "]
+
+    @pytest.mark.asyncio
+    async def test_iteration_spans_are_opt_in(self, cognitive_agent, mock_llm, monkeypatch):
+        """Test ReAct iterations only get their own span with LOOM_TRACE_ITERATIONS=1."""
+        import loom.cognitive.strategies as strategies
+
+        spans = []
+        tracer = strategies.tracer
+
+        def recording_span(name, *args, **kwargs):
+            spans.append(name)
+            return tracer.start_as_current_span(name, *args, **kwargs)
+
+        monkeypatch.setattr(strategies, "tracer", MagicMock(start_as_current_span=recording_span))
+
+        await cognitive_agent.run("First")
+        assert "cognitive.react_iteration" not in spans
+
+        monkeypatch.setattr(strategies, "_TRACE_ITERATIONS", True)
+        await cognitive_agent.run("Second")
+        assert "cognitive.react_iteration" in spans
+
+    @pytest.mark.asyncio
+    async def test_react_samples_skip_unknown_tool_candidate(self, mock_ctx, mock_llm):
+        """Test sampled candidates calling a tool the agent lacks are passed over."""
+        config = CognitiveConfig(react_samples=2)
+        agent = CognitiveAgent(
+            ctx=mock_ctx, llm=mock_llm, config=config, available_tools=["weather:get"]
+        )
+        rounds = [
+            ['{"tool": "made:up", "args": {}}', '{"tool": "weather:get", "args": {}}'],
+            ["FINAL ANSWER: Sunny."],
+        ]
+
+        async def generate_candidates(prompt, *, n, system=None, temperature=None, **kwargs):
+            assert n == 2
+            return rounds.pop(0)
+
+        mock_llm.generate_candidates = generate_candidates
+
+        result = await agent.run("Weather?")
+
+        assert [s.tool_call.name for s in result.steps] == ["weather:get"]
+        assert result.answer == "Sunny."
+
     @pytest.mark.asyncio
     async def test_run_with_context(self, cognitive_agent, mock_llm):
         """Test run() with context parameter."""
@@ -308,6 +613,38 @@ class TestCognitiveAgentRun:
         assert result.iterations == 2  # Should stop at max
         assert len(result.steps) == 2
 
+    @pytest.mark.asyncio
+    async def test_run_stops_when_reasoning_stalls(self, mock_ctx, mock_llm):
+        """Test two reasoning-only responses in a row end the run early when enabled."""
+        responses = ["Hmm.", "Still thinking.", "FINAL ANSWER: Too late."]
+        mock_llm.set_responses(responses)
+        default = await CognitiveAgent(ctx=mock_ctx, llm=mock_llm).run("Stall")
+        assert default.answer == "Too late."
+
+        config = CognitiveConfig(max_stalled_iterations=2)
+        agent = CognitiveAgent(ctx=mock_ctx, llm=mock_llm, config=config)
+        mock_llm.set_responses(responses)
+
+        result = await agent.run("Stall")
+
+        assert result.iterations == 2
+        assert result.answer == "Still thinking."
+
+    @pytest.mark.asyncio
+    async def test_adaptive_iterations_shrink_after_stalled_runs(self, mock_ctx, mock_llm):
+        """Test the iteration cap drops for agents whose runs keep stalling."""
+        config = CognitiveConfig(
+            max_iterations=10, max_stalled_iterations=2, adaptive_iterations=True
+        )
+        agent = CognitiveAgent(ctx=mock_ctx, llm=mock_llm, config=config)
+        assert agent._iteration_cap() == 10
+
+        for _ in range(5):
+            mock_llm.set_responses(["Hmm.", "Hmm."])
+            await agent.run("Stall")
+
+        assert agent._iteration_cap() == 5
+
 
 # ============================================================================
 # Streaming Tests
@@ -482,6 +819,13 @@ class TestCognitiveTypes:
         assert result.steps == []
         assert result.error is None
 
+    def test_types_use_slots(self):
+        """Test per-step types carry no per-instance __dict__."""
+        step = ThoughtStep(step=1, reasoning="r", tool_call=ToolCall(name="t", arguments={}))
+
+        assert not hasattr(step, "__dict__")
+        assert not hasattr(step.tool_call, "__dict__")
+
 
 # ============================================================================
 # Config Tests
@@ -569,3 +913,15 @@ class TestCognitiveMemory:
         # Should have context entries
         context_entries = [h for h in history if "Context:" in h.get("content", "")]
         assert len(context_entries) >= 2
+
+    def test_memory_drops_oldest_items(self):
+        """Test working memory keeps only the newest max_items entries."""
+        memory = WorkingMemory(max_items=3)
+        for i in range(5):
+            memory.add("user", f"m{i}")
+
+        assert len(memory) == 3
+        assert [m["content"] for m in memory.get_context()] == ["m2", "m3", "m4"]
+        assert [m["content"] for m in memory.get_context(2)] == ["m3", "m4"]
+        assert memory.to_messages()[0] == {"role": "user", "content": "m2"}
+        assert next(memory.iter_messages()) is memory.to_messages()[0]
@@ -188,3 +188,17 @@ def test_project_config_nonexistent_file():
     config = ProjectConfig.load(Path("nonexistent.toml"))
     assert config.version == "0.1.0"
     assert config.bridge.address == "127.0.0.1:50051"
+
+
+def test_project_config_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    """Test the raw parse is cached while env expansion still runs per load."""
+    config_file = tmp_path / "loom.toml"
+    config_file.write_text('name = "${LOOM_TEST_NAME}"\n')
+
+    monkeypatch.setenv("LOOM_TEST_NAME", "first")
+    assert ProjectConfig.load(config_file).name == "first"
+    monkeypatch.setenv("LOOM_TEST_NAME", "second")
+    assert ProjectConfig.load(config_file).name == "second"
+
+    config_file.write_text('name = "renamed-project"\n')
+    assert ProjectConfig.load(config_file).name == "renamed-project"
@@ -106,3 +106,20 @@ class TestEnvelope:
         assert env.thread_id is None
         assert env.correlation_id is None
         assert env.sender is None
+
+    def test_inject_trace_context(self) -> None:
+        """Test trace context injection with and without an active span."""
+        from opentelemetry.trace import SpanContext, TraceFlags
+
+        env = Envelope.new(type="traced.event")
+        env.inject_trace_context()
+        assert env.trace_id is None
+        assert "trace_id" not in env.metadata
+
+        span_context = SpanContext(
+            trace_id=0x1234, span_id=0x56, is_remote=False, trace_flags=TraceFlags(1)
+        )
+        env.inject_trace_context(span_context)
+        assert env.trace_id == format(0x1234, "032x")
+        assert env.metadata["span_id"] == format(0x56, "016x")
+        assert env.trace_flags == "01"
@@ -0,0 +1,127 @@
+"""Tests for EventContext request/reply plumbing."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from loom import Context
+from loom.bridge.proto import action_pb2 as pb_action
+from loom.bridge.proto import event_pb2 as pb_event
+
+
+@pytest.fixture
+def context():
+    """Create a Context bound to an in-memory outbound queue."""
+    ctx = Context(agent_id="test-agent", client=MagicMock())
+    ctx._bind(asyncio.Queue())
+    return ctx
+
+
+class TestRequestReply:
+    """Test request/reply correlation."""
+
+    @pytest.mark.asyncio
+    async def test_request_times_out(self, context):
+        """Test request raises TimeoutError when no reply arrives."""
+        with pytest.raises(asyncio.TimeoutError):
+            await context.request("some.topic", type="ping", timeout_ms=10)
+
+        assert context._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_request_resolved_by_delivery(self, context):
+        """Test a matching delivery completes the pending request."""
+        task = asyncio.create_task(
+            context.request("some.topic", type="ping", payload=b"hi", timeout_ms=1000)
+        )
+
+        sent = await context._outbound_queue.get()
+        request_event = sent.publish.event
+        assert sent.publish.topic == "some.topic"
+
+        reply_event = pb_event.Event(
+            id="reply-1",
+            type="pong",
+            metadata={"loom.correlation_id": request_event.id},
+        )
+        context._on_delivery(MagicMock(event=reply_event))
+
+        reply = await task
+        assert reply.type == "pong"
+        assert reply.correlation_id == request_event.id
+        assert context._pending == {}
+
+
+class TestToolInvocation:
+    """Test tool call construction."""
+
+    @pytest.mark.asyncio
+    async def test_tool_call_headers(self, context):
+        """Test default headers are set and custom headers override them."""
+        context.client.forward_tool_call = AsyncMock(
+            return_value=pb_action.ToolResult(status=pb_action.ToolStatus.TOOL_OK, output="{}")
+        )
+
+        output = await context.tool("demo.tool", payload={"x": 1}, headers={"x-extra": "1"})
+
+        assert output == "{}"
+        call = context.client.forward_tool_call.call_args[0][0]
+        assert call.arguments == '{"x": 1}'
+        assert call.headers["x-agent-id"] == "test-agent"
+        assert call.headers["x-correlation-id"] == call.correlation_id == call.id
+        assert call.headers["x-extra"] == "1"
+        assert context._base_headers == {"x-agent-id": "test-agent"}
+
+    @pytest.mark.asyncio
+    async def test_tool_span_attributes_visible_to_sampler(self, context, monkeypatch):
+        """Test tool span attributes are passed at start and failures keep the error."""
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        from opentelemetry.sdk.trace.sampling import ALWAYS_ON
+        from opentelemetry.trace import StatusCode
+
+        from loom.agent import event
+
+        seen = []
+
+        class _Sampler:
+            def should_sample(self, parent_context, trace_id, name, kind=None, attributes=None, *a):
+                seen.append(dict(attributes or {}))
+                return ALWAYS_ON.should_sample(parent_context, trace_id, name, kind, attributes)
+
+            def get_description(self):
+                return "recording"
+
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider(sampler=_Sampler())
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        monkeypatch.setattr(event, "tracer", provider.get_tracer(__name__))
+        context.client.forward_tool_call = AsyncMock(
+            return_value=pb_action.ToolResult(
+                status=pb_action.ToolStatus.TOOL_ERROR,
+                error=pb_action.ToolError(message="boom"),
+            )
+        )
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await context.tool("demo.tool", timeout_ms=10)
+
+        assert seen == [{"tool.name": "demo.tool", "agent.id": "test-agent", "timeout.ms": 10}]
+        (span,) = exporter.get_finished_spans()
+        assert span.attributes["tool.status"] == pb_action.ToolStatus.TOOL_ERROR
+        assert span.status.status_code is StatusCode.ERROR
+        assert "boom" in span.status.description
+
+
+class TestSend:
+    """Test outbound queue binding."""
+
+    @pytest.mark.asyncio
+    async def test_emit_requires_bound_queue(self):
+        """Test emitting before the context is bound raises."""
+        ctx = Context(agent_id="test-agent", client=MagicMock())
+
+        with pytest.raises(RuntimeError, match="not bound"):
+            await ctx.emit("some.topic", type="ping")
@@ -0,0 +1,73 @@
+"""Tests for the batching LLM proxy."""
+
+import asyncio
+
+import pytest
+
+from loom.llm import BatchingLLMProxy
+
+
+class FakeLLM:
+    """Provider recording how requests reach it."""
+
+    def __init__(self):
+        self.batches = []
+        self.single = []
+
+    async def generate(self, prompt, *, system=None, temperature=None, **kwargs):
+        self.single.append(prompt)
+        return f"{system}:{prompt}"
+
+    async def generate_batch(self, prompts, *, system=None, temperature=None, **kwargs):
+        self.batches.append(list(prompts))
+        if "boom" in prompts:
+            raise RuntimeError("batch failed")
+        return [f"{system}:{prompt}" for prompt in prompts]
+
+
+class TestBatchingLLMProxy:
+    """Tests for BatchingLLMProxy."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_batch(self):
+        """Test calls within the window are batched and answered in order."""
+        llm = FakeLLM()
+        proxy = BatchingLLMProxy(llm, window_ms=50)
+
+        results = await asyncio.gather(*(proxy.generate(p, system="s") for p in "abc"))
+
+        assert results == ["s:a", "s:b", "s:c"]
+        assert llm.batches == [["a", "b", "c"]]
+
+    @pytest.mark.asyncio
+    async def test_settings_and_depth_split_batches(self):
+        """Test differing settings never share a batch and max_batch drains early."""
+        llm = FakeLLM()
+        proxy = BatchingLLMProxy(llm, max_batch=2, window_ms=50)
+
+        await asyncio.gather(
+            proxy.generate("a", system="x"),
+            proxy.generate("b", system="x"),
+            proxy.generate("c", system="y"),
+        )
+
+        assert llm.batches == [["a", "b"]]
+        assert llm.single == ["c"]
+
+    @pytest.mark.asyncio
+    async def test_batch_error_reaches_every_caller(self):
+        """Test a failed batch call raises in each waiting request."""
+        proxy = BatchingLLMProxy(FakeLLM(), window_ms=50)
+
+        results = await asyncio.gather(
+            proxy.generate("ok"), proxy.generate("boom"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_forwards_other_attributes(self):
+        """Test non-generate attributes come from the wrapped provider."""
+        llm = FakeLLM()
+        llm.config = object()
+
+        assert BatchingLLMProxy(llm).config is llm.config
@@ -0,0 +1,80 @@
+"""Tests for the LLM response cache."""
+
+from loom.llm import SemanticLLMCache
+
+
+class TestSemanticLLMCache:
+    """Tests for SemanticLLMCache."""
+
+    def test_hits_exact_repeat(self):
+        """Test only a verbatim repeat (up to surrounding whitespace) hits."""
+        cache = SemanticLLMCache()
+        cache.set("What is the capital of France?", "Paris", system="s", temperature=0.0)
+
+        assert (
+            cache.get(" What is the capital of France?\n", system="s", temperature=0.0) == "Paris"
+        )
+        assert cache.get("what is the capital of france?", system="s", temperature=0.0) is None
+
+    def test_case_and_indentation_are_significant(self):
+        """Test prompts differing in case or inner whitespace never share an answer."""
+        cache = SemanticLLMCache()
+        cache.set("Convert 'abc' to uppercase", "ABC")
+        cache.set("if x:\n    y()", "nested")
+
+        assert cache.get("convert 'ABC' to uppercase") is None
+        assert cache.get("if x:\ny()") is None
+
+    def test_reordered_prompt_misses(self):
+        """Test prompts with the same words in another order are different entries."""
+        cache = SemanticLLMCache()
+        cache.set("convert 5 km to miles", "3.11 miles")
+
+        assert cache.get("convert 5 miles to km") is None
+
+    def test_settings_are_isolated(self):
+        """Test different system prompts, temperatures or models never share entries."""
+        cache = SemanticLLMCache()
+        cache.set("hello", "hi", system="s", temperature=0.0, model="m1")
+
+        assert cache.get("hello", system="s", temperature=0.0, model="m1") == "hi"
+        assert cache.get("hello", system="other", temperature=0.0, model="m1") is None
+        assert cache.get("hello", system="s", temperature=0.5, model="m1") is None
+        assert cache.get("hello", system="s", temperature=0.0, model="m2") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test the cache drops the least recently used entry when full."""
+        cache = SemanticLLMCache(max_entries=2)
+        cache.set("alpha", "1")
+        cache.set("beta", "2")
+        assert cache.get("alpha") == "1"
+
+        cache.set("gamma", "3")
+
+        assert len(cache) == 2
+        assert cache.get("beta") is None
+        assert cache.get("alpha") == "1" and cache.get("gamma") == "3"
+
+    def test_custom_embedding(self):
+        """Test a dense embedding function is used for similarity."""
+        vectors = {"cat": [1.0, 0.0], "kitten": [0.95, 0.1], "car": [0.0, 1.0]}
+        cache = SemanticLLMCache(threshold=0.9, embed=vectors.__getitem__)
+        cache.set("cat", "meow")
+
+        assert cache.get("kitten") == "meow"
+        assert cache.get("car") is None
+
+    def test_exact_repeat_skips_embedding(self):
+        """Test an identical prompt is answered without embedding it."""
+        calls = []
+
+        def embed(text):
+            calls.append(text)
+            return [1.0, 0.0]
+
+        cache = SemanticLLMCache(embed=embed)
+        cache.set("cat", "meow")
+        cache.set("cat", "purr")
+
+        assert cache.get("cat") == "purr"
+        assert calls == ["cat"]
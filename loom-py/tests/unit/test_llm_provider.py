@@ -27,6 +27,7 @@ class TestLLMConfig:
         assert config.temperature == 0.7
         assert config.max_tokens == 4096
         assert config.timeout_ms == 30000
+        assert config.prompt_cache_key is False
 
     def test_custom_config(self):
         """Test custom LLMConfig values."""
@@ -183,6 +184,78 @@ class TestLLMProviderGenerate:
             assert messages[0]["role"] == "system"
             assert messages[1]["role"] == "user"
 
+    @pytest.mark.asyncio
+    async def test_generate_candidates_requests_n_choices(self):
+        """Test generate_candidates samples n choices in a single request."""
+        from loom.llm.config import LLMConfig
+        from loom.llm.provider import LLMProvider
+
+        mock_ctx = MagicMock()
+        mock_ctx.agent_id = "test-agent"
+
+        provider = LLMProvider(mock_ctx, LLMConfig(base_url="http://test.local/v1", model="m"))
+
+        mock_response_data = {
+            "choices": [{"message": {"content": "A"}}, {"message": {"content": "B"}}],
+        }
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_response = MagicMock()
+            mock_response.json.return_value = mock_response_data
+            mock_response.raise_for_status = MagicMock()
+
+            mock_client = AsyncMock()
+            mock_client.post = AsyncMock(return_value=mock_response)
+
+            mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client_class.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            candidates = await provider.generate_candidates("Pick", n=2)
+            assert candidates == ["A", "B"]
+            assert mock_client.post.call_args.kwargs["json"]["n"] == 2
+
+            assert await provider.generate("Pick") == "A"
+            assert "n" not in mock_client.post.call_args.kwargs["json"]
+
+    @pytest.mark.asyncio
+    async def test_generate_system_cacheable_sends_stable_cache_key(self):
+        """Test system_cacheable adds a prompt_cache_key only when the config opts in."""
+        from loom.llm.config import LLMConfig
+        from loom.llm.provider import LLMProvider
+
+        mock_ctx = MagicMock()
+        mock_ctx.agent_id = "test-agent"
+
+        config = LLMConfig(base_url="http://test.local/v1", model="m")
+        provider = LLMProvider(mock_ctx, config)
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_response = MagicMock()
+            mock_response.json.return_value = {"choices": [{"message": {"content": "ok"}}]}
+            mock_response.raise_for_status = MagicMock()
+
+            mock_client = AsyncMock()
+            mock_client.post = AsyncMock(return_value=mock_response)
+
+            mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
+            mock_client_class.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            # Off by default: strict endpoints reject unknown fields
+            await provider.generate("zero", system="Tools: ...", system_cacheable=True)
+            assert "prompt_cache_key" not in mock_client.post.call_args.kwargs["json"]
+
+            config.prompt_cache_key = True
+            keys = []
+            for prompt in ("one", "two"):
+                await provider.generate(prompt, system="Tools: ...", system_cacheable=True)
+                payload = mock_client.post.call_args.kwargs["json"]
+                assert payload["messages"][0] == {"role": "system", "content": "Tools: ..."}
+                keys.append(payload["prompt_cache_key"])
+            assert keys[0] == keys[1]
+
+            await provider.generate("three", system="Tools: ...")
+            assert "prompt_cache_key" not in mock_client.post.call_args.kwargs["json"]
+
 
 class TestLLMProviderGenerateStream:
     """Tests for LLMProvider.generate_stream() method."""
@@ -1,5 +1,6 @@
 """Tests for memory integration in context."""
 
+import asyncio
 import hashlib
 import time
 from unittest.mock import AsyncMock, MagicMock
@@ -151,8 +152,10 @@ class TestMemoryIntegrationWithMockClient:
         assert len(plans) == 2
         assert plans[0]["action"] == "BUY"
         assert plans[1]["action"] == "HOLD"
-        assert "timestamp_ms" in plans[0]
-        assert "plan_hash" in plans[0]
+        assert plans[0]["timestamp_ms"] == now_ms - 60000
+        assert plans[0]["plan_hash"] == "hash1"
+        assert plans[1]["method"] == "rule"
+        assert plans[0]["metadata"] == {}
 
     @pytest.mark.asyncio
     async def test_check_duplicate_plan_found(self, context, mock_client):
@@ -185,6 +188,9 @@ class TestMemoryIntegrationWithMockClient:
         # Verify
         assert is_dup is True
         assert dup_info["plan_hash"] == "abc123"
+        request = mock_client.check_duplicate.call_args[0][0]
+        assert request.plan.reasoning == ""
+        assert request.plan.plan_hash == hashlib.md5(b"BTC|BUY|Bullish").hexdigest()[:8]
         assert dup_info["time_since_ms"] == 60000
 
     @pytest.mark.asyncio
@@ -317,6 +323,104 @@ class TestMemoryIntegrationWithMockClient:
         assert stats["successful_executions"] == 6
         assert abs(stats["win_rate"] - 0.6) < 0.01
         assert len(stats["recent_executions"]) == 10
+        assert stats["recent_executions"][0]["order_id"] == "order-0"
+        assert stats["recent_executions"][9]["status"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_save_plan_buffered(self, context, mock_client):
+        """Test fire-and-forget plan saving is flushed in the background."""
+        mock_client.save_plan.return_value = pb_memory.SavePlanResponse(success=True)
+        mock_client.mark_executed.return_value = pb_memory.MarkExecutedResponse(success=True)
+
+        plan_hash = await context.save_plan(
+            symbol="BTC", action="BUY", confidence=0.8, reasoning="Bullish", wait=False
+        )
+        await context.mark_plan_executed(
+            plan_hash=plan_hash,
+            symbol="BTC",
+            action="BUY",
+            confidence=0.8,
+            status="success",
+            executed=True,
+            wait=False,
+        )
+
+        assert plan_hash == hashlib.md5(b"BTC|BUY|Bullish").hexdigest()[:8]
+        mock_client.save_plan.assert_not_called()
+
+        await context.flush_writes()
+
+        mock_client.save_plan.assert_called_once()
+        mock_client.mark_executed.assert_called_once()
+        assert context._write_buf == []
+
+    @pytest.mark.asyncio
+    async def test_buffered_write_failure_reported(self, context, mock_client):
+        """Test buffered write failures go to on_write_error instead of raising."""
+        mock_client.save_plan.return_value = pb_memory.SavePlanResponse(
+            success=False, error_message="Database error"
+        )
+        errors = []
+        context.on_write_error = errors.append
+
+        await context.save_plan(symbol="BTC", action="SELL", confidence=0.5, wait=False)
+        await context.flush_writes()
+
+        assert len(errors) == 1
+        assert "Database error" in str(errors[0])
+
+    @pytest.mark.asyncio
+    async def test_buffered_write_cancellation_reported(self, context, mock_client):
+        """Test a cancelled buffered write is reported like any other failure."""
+        mock_client.save_plan.side_effect = asyncio.CancelledError()
+        errors = []
+        context.on_write_error = errors.append
+
+        await context.save_plan(symbol="BTC", action="SELL", confidence=0.5, wait=False)
+        await context.flush_writes()
+
+        assert len(errors) == 1
+        assert isinstance(errors[0], asyncio.CancelledError)
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_in_flight_flush(self, mock_client, monkeypatch):
+        """Test Agent.stop() lets a size-triggered flush finish before returning."""
+        from loom import Agent
+
+        monkeypatch.setenv("LOOM_TELEMETRY_AUTO", "0")
+        saved = []
+
+        async def slow_save(req):
+            await asyncio.sleep(0.01)
+            saved.append(req)
+            return pb_memory.SavePlanResponse(success=True)
+
+        mock_client.save_plan.side_effect = slow_save
+        agent = Agent(agent_id="test-agent", topics=[], client=mock_client)
+        agent.ctx.write_batch_max = 1
+
+        await agent.ctx.save_plan(symbol="BTC", action="BUY", confidence=0.8, wait=False)
+        await asyncio.sleep(0)  # the flush is now awaiting the slow write
+        assert agent.ctx._write_buf == [] and agent.ctx._write_tasks
+
+        await agent.stop()
+
+        assert len(saved) == 1
+
+    @pytest.mark.asyncio
+    async def test_size_triggered_flush_is_tracked(self, context, mock_client):
+        """Test a flush started by a full buffer is held until it finishes."""
+        mock_client.save_plan.return_value = pb_memory.SavePlanResponse(success=True)
+        context.write_batch_max = 1
+
+        await context.save_plan(symbol="BTC", action="BUY", confidence=0.8, wait=False)
+        assert len(context._write_tasks) == 1
+
+        await asyncio.gather(*context._write_tasks)
+        await asyncio.sleep(0)
+
+        mock_client.save_plan.assert_called_once()
+        assert not context._write_tasks
 
     @pytest.mark.asyncio
     async def test_rpc_error_handling(self, context, mock_client):
@@ -128,3 +128,46 @@ def test_backwards_compatibility_capability_alias() -> None:
     # capability/Capability are aliases
     assert capability == tool
     assert Capability == Tool
+
+
+def test_tool_models_built_lazily(monkeypatch) -> None:
+    """Test that input models are only built on first access."""
+    from loom.tools import decorator
+
+    calls = []
+    original = decorator._model_from_signature
+
+    def counting(func):
+        calls.append(func)
+        return original(func)
+
+    monkeypatch.setattr(decorator, "_model_from_signature", counting)
+
+    @tool("test.lazy", description="Lazy model")
+    def lazy_func(x: int) -> int:
+        return x
+
+    t: Tool = lazy_func.__loom_tool__  # type: ignore[attr-defined]
+    assert calls == []
+
+    assert t.input_model is not None
+    assert t.input_model(x=3).x == 3
+    assert t.output_model is None
+    assert t.input_model is t.input_model
+    assert len(calls) == 1
+
+
+def test_tool_schema_defaults_and_keyword_only() -> None:
+    """Test schema generation for defaults, unannotated and keyword-only params."""
+
+    @tool("test.kwonly", description="Keyword-only parameters")
+    def kw_func(query: str, limit=10, *, verbose: bool = False, tag) -> dict:
+        return {}
+
+    t: Tool = kw_func.__loom_tool__  # type: ignore[attr-defined]
+    schema = json.loads(t.parameters_schema)
+
+    assert schema["properties"]["limit"] == {"default": 10, "title": "Limit", "type": "integer"}
+    assert schema["properties"]["verbose"]["default"] is False
+    assert schema["properties"]["tag"]["type"] == "string"
+    assert sorted(schema["required"]) == ["query", "tag"]